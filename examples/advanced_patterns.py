@@ -11,8 +11,11 @@ This script demonstrates more sophisticated usage patterns including:
 
 import asyncio
 import json
+import os
+import random
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlparse
 
 # Add src to path for imports
 import sys
@@ -23,80 +26,197 @@ from src.agents.examples.research_agent import research_agent
 from src.agents.examples.data_analyst import data_analyst_agent
 from src.core.dependencies import ChatDependencies, ResearchDependencies, DataDependencies
 from src.core.base_agent import BaseAgent
-from src.core.models import BaseResponse
+from src.core.http_client import shared_http_client
+from src.core.models import BaseResponse, ResearchResult
 from src.config.logging import logger
-from src.utils.helpers import generate_session_id, retry_async, RetryConfig
+from src.utils.helpers import generate_session_id, install_fast_event_loop, retry_async, RetryConfig, truncate_text
 from src.utils.logger import get_contextual_logger
+from src.utils.streaming import coalesce_stream
+
+# Upper bound on concurrent agent calls, to stay within provider rate limits
+MAX_PARALLEL_AGENTS = int(os.getenv("MAX_PARALLEL_AGENTS", "5"))
+agent_semaphore = asyncio.Semaphore(MAX_PARALLEL_AGENTS)
+
+# Shared RNG for the simulated failures in the retry demo
+_rng = random.Random()
+
+# Findings forwarded from one agent to the next in a chain
+MAX_PROMPT_FINDINGS = 10
+
+
+async def run_limited(agent, prompt: str, deps):
+    """Run an agent while holding one of the shared concurrency slots"""
+    async with agent_semaphore:
+        return await agent.run(prompt, deps)
+
+
+async def stream_research(prompt: str, deps: ResearchDependencies, queue: asyncio.Queue):
+    """Stream research output, publishing each finding as soon as it is complete"""
+    published = 0
+    result = None
+    
+    try:
+        async with agent_semaphore:
+            async for partial in research_agent.stream(prompt, deps):
+                result = partial
+                findings = getattr(partial, "findings", None) or []
+                # The last finding may still be mid-generation
+                for finding in findings[published:-1]:
+                    await queue.put(finding)
+                published = max(published, len(findings) - 1)
+        
+        if result is not None:
+            for finding in result.findings[published:]:
+                await queue.put(finding)
+    
+    finally:
+        # Sentinel: no more findings are coming
+        await queue.put(None)
+    
+    return result
+
+
+async def collect_findings(queue: asyncio.Queue, limit: int) -> List[str]:
+    """Take findings off the queue until the limit or the end of the stream"""
+    findings = []
+    while len(findings) < limit:
+        finding = await queue.get()
+        if finding is None:
+            break
+        findings.append(finding)
+    return findings
 
 
 async def agent_chaining_example():
-    """Demonstrate chaining multiple agents together"""
+    """Demonstrate chaining multiple agents together as a streaming scatter-gather DAG"""
     print("\n🔗 Agent Chaining Example")
     print("=" * 50)
     
-    # Step 1: Research agent gathers information
-    research_deps = ResearchDependencies(
-        session_id=generate_session_id(),
-        search_enabled=True
-    )
+    # One session shared by every node in the chain
+    session_id = generate_session_id()
+    research_deps = ResearchDependencies(session_id=session_id, search_enabled=True)
+    data_deps = DataDependencies(session_id=session_id)
+    chat_deps = ChatDependencies(session_id=session_id)
     
     topic = "sustainable energy technologies"
     print(f"📋 Researching: {topic}")
     
-    try:
-        research_result = await research_agent.run(
+    # Wave 1: research streams findings into a queue while a lightweight
+    # context primer runs alongside it
+    findings_queue: asyncio.Queue = asyncio.Queue()
+    research_task = asyncio.create_task(
+        stream_research(
             f"Research current trends and developments in {topic}",
-            research_deps
+            research_deps,
+            findings_queue
         )
-        
-        print(f"✅ Research completed with {len(research_result.findings)} findings")
-        
-        # Step 2: Data analyst processes the research findings
-        data_deps = DataDependencies(
-            session_id=research_deps.session_id  # Same session
+    )
+    primer_task = asyncio.create_task(
+        run_limited(
+            simple_chat_agent,
+            f"In two or three sentences, give background context on {topic} "
+            f"for business decision-makers.",
+            chat_deps
         )
+    )
+    
+    try:
+        # Downstream agents only use the top findings, so start them as soon
+        # as those have streamed in rather than waiting for the full result
+        top_findings = await collect_findings(findings_queue, MAX_PROMPT_FINDINGS)
+        if not top_findings:
+            # Nothing streamed: surface a research failure before spending more calls
+            await research_task
         
-        # Convert research findings to a format for analysis
-        research_data = {
-            "topic": topic,
-            "findings": research_result.findings,
-            "sources": research_result.sources
-        }
+        print(f"✅ Received {len(top_findings)} findings, starting analysis")
+        
+        # Hand the findings to the analyst as typed dependencies rather than
+        # serializing them into the prompt
+        data_deps.upstream_research = ResearchResult(query=topic, findings=top_findings)
         
         analysis_prompt = f"""
-        Analyze the following research data and provide strategic insights:
-        {json.dumps(research_data, indent=2)}
+        Analyze the upstream research on {topic} and provide strategic insights.
         
         Focus on identifying patterns, opportunities, and actionable recommendations.
         """
         
-        analysis_result = await data_analyst_agent.run(analysis_prompt, data_deps)
+        outline_prompt = f"""
+        Draft a short outline for a briefing on {topic} based on these findings:
+        {json.dumps(top_findings, separators=(",", ":"), ensure_ascii=False)}
+        """
+        
+        # Wave 2: analysis and the outline draft overlap with the research tail
+        analysis_result, outline_result, primer_result = await asyncio.gather(
+            run_limited(data_analyst_agent, analysis_prompt, data_deps),
+            run_limited(simple_chat_agent, outline_prompt, chat_deps),
+            primer_task,
+            return_exceptions=True
+        )
+        
+        if isinstance(analysis_result, BaseException):
+            raise analysis_result
         
         print(f"✅ Analysis completed")
         
-        # Step 3: Chat agent summarizes everything for the user
-        chat_deps = ChatDependencies(
-            session_id=research_deps.session_id  # Same session
-        )
+        research_result = await research_task
+        print(f"✅ Research completed with {len(research_result.findings)} findings")
+        
+        # Primer and outline are optional context for the synthesis step
+        primer = primer_result.message if not isinstance(primer_result, BaseException) else "None"
+        outline = outline_result.message if not isinstance(outline_result, BaseException) else "None"
+        sources = [urlparse(src).netloc or src for src in research_result.sources]
         
+        # Wave 3: thin synthesis step over everything gathered so far
         summary_prompt = f"""
         Create a comprehensive summary based on this research and analysis:
         
         Research Topic: {topic}
+        Background: {primer}
         Key Findings: {', '.join(research_result.findings[:3])}
+        Sources: {', '.join(sources) if sources else 'None'}
         Analysis: {analysis_result.analysis}
         Top Insights: {', '.join(analysis_result.insights[:2]) if analysis_result.insights else 'None'}
+        Suggested Outline: {outline}
         
         Provide a clear, actionable summary for business decision-makers.
         """
         
-        summary_result = await simple_chat_agent.run(summary_prompt, chat_deps)
+        summary_result = await run_limited(simple_chat_agent, summary_prompt, chat_deps)
         
         print(f"\n📄 Final Summary:")
         print(f"{summary_result.message}")
         
     except Exception as e:
         print(f"❌ Error in agent chaining: {e}")
+    
+    finally:
+        # Don't leave upstream work running if a later stage failed
+        research_task.cancel()
+        primer_task.cancel()
+
+
+async def stream_tokens(agent, prompt: str, deps, sse_mode: bool = False):
+    """
+    Yield incremental text from an agent stream.
+    
+    With sse_mode=True each token is framed as a server-sent event, so the
+    generator can back a StreamingResponse(media_type="text/event-stream")
+    directly (send "X-Accel-Buffering: no" when behind nginx).
+    """
+    seen = ""
+    async for chunk in agent.stream(prompt, deps):
+        if hasattr(chunk, "delta"):
+            token = chunk.delta
+        else:
+            # Structured outputs stream as cumulative partial models
+            text = chunk.message if hasattr(chunk, "message") else str(chunk)
+            token = text[len(seen):] if text.startswith(seen) else text
+            seen = text
+        
+        if not token:
+            continue
+        
+        yield f"data: {json.dumps({'token': token})}\n\n" if sse_mode else token
 
 
 async def streaming_example():
@@ -111,12 +231,18 @@ async def streaming_example():
     print(f"📝 Streaming response for: {prompt[:50]}...")
     print("\n🤖 Agent response (streaming):")
     
+    buf = []
+    
     try:
-        async for chunk in simple_chat_agent.stream(prompt, deps):
-            # In a real streaming implementation, this would show incremental responses
-            print(".", end="", flush=True)  # Show progress
+        tokens = stream_tokens(simple_chat_agent, prompt, deps)
+        async for token in coalesce_stream(tokens):
+            # Write each sentence-sized chunk as soon as it is complete
+            sys.stdout.write(token)
+            sys.stdout.flush()
+            buf.append(token)
         
-        print("\n✅ Streaming completed")
+        response = "".join(buf)
+        print(f"\n✅ Streaming completed ({len(response)} characters)")
         
     except Exception as e:
         print(f"\n❌ Streaming error: {e}")
@@ -129,22 +255,37 @@ async def retry_logic_example():
     
     contextual_logger = get_contextual_logger("RetryExample")
     
+    class TransientAPIError(Exception):
+        """Simulated provider error carrying an HTTP status code"""
+        def __init__(self, status_code: int):
+            super().__init__(f"Simulated API failure (HTTP {status_code})")
+            self.status_code = status_code
+    
+    def is_transient(error: Exception) -> bool:
+        """Only rate limits, server errors and timeouts are worth retrying"""
+        if isinstance(error, asyncio.TimeoutError):
+            return True
+        status_code = getattr(error, "status_code", None)
+        return status_code == 429 or (status_code is not None and status_code >= 500)
+    
+    # Every attempt belongs to the same session
+    deps = ChatDependencies(session_id=generate_session_id())
+    
     async def unreliable_agent_call():
         """Simulate an unreliable agent call"""
-        import random
-        if random.random() < 0.7:  # 70% chance of failure for demo
-            raise Exception("Simulated API failure")
+        if _rng.random() < 0.7:  # 70% chance of failure for demo
+            raise TransientAPIError(_rng.choice([429, 503]))
         
-        return await simple_chat_agent.run(
-            "What is the meaning of life?",
-            ChatDependencies(session_id=generate_session_id())
-        )
+        return await simple_chat_agent.run("What is the meaning of life?", deps)
     
-    # Configure retry behavior
+    # Configure retry behavior: capped exponential backoff with full jitter
     retry_config = RetryConfig(
         max_attempts=3,
         delay=1.0,
-        backoff_factor=2.0
+        backoff_factor=2.0,
+        max_delay=30.0,
+        jitter="full",
+        retry_if=is_transient
     )
     
     contextual_logger.info("Starting unreliable agent call with retry logic")
@@ -189,17 +330,36 @@ async def custom_tool_integration():
         print(f"❌ Custom tool error: {e}")
 
 
-async def parallel_agent_execution():
+# Dependency type for each kind of agent in the parallel example
+_DEP_FACTORIES = {
+    "chat": ChatDependencies,
+    "research": ResearchDependencies,
+    "analysis": DataDependencies
+}
+
+# (agent, prompt, dependency key) for each parallel task
+_PARALLEL_TASKS = [
+    (simple_chat_agent, "What are the benefits of renewable energy?", "chat"),
+    (research_agent, "Find information about electric vehicle adoption rates", "research"),
+    (data_analyst_agent, "Analyze trends in green technology investment", "analysis")
+]
+
+
+def build_dependencies(session_id: str) -> Dict[str, Any]:
+    """Create one dependencies object per agent kind for a session"""
+    return {key: factory(session_id=session_id) for key, factory in _DEP_FACTORIES.items()}
+
+
+async def parallel_agent_execution(dependencies: Optional[Dict[str, Any]] = None):
     """Demonstrate running multiple agents in parallel"""
     print("\n⚡ Parallel Agent Execution")
     print("=" * 50)
     
-    # Create different tasks for different agents
-    tasks = [
-        (simple_chat_agent, "What are the benefits of renewable energy?", ChatDependencies()),
-        (research_agent, "Find information about electric vehicle adoption rates", ResearchDependencies()),
-        (data_analyst_agent, "Analyze trends in green technology investment", DataDependencies())
-    ]
+    if dependencies is None:
+        dependencies = build_dependencies(generate_session_id())
+    
+    # Create different tasks for different agents, all in one session
+    tasks = [(agent, prompt, dependencies[key]) for agent, prompt, key in _PARALLEL_TASKS]
     
     print("🚀 Starting parallel agent execution...")
     
@@ -209,7 +369,9 @@ async def parallel_agent_execution():
         task_logger.info(f"Starting: {prompt[:50]}...")
         
         try:
-            result = await agent.run(prompt, deps)
+            # Bound fan-out so larger task lists don't trip provider rate limits
+            async with agent_semaphore:
+                result = await agent.run(prompt, deps)
             task_logger.info("Completed successfully")
             return agent.name, result, None
         except Exception as e:
@@ -223,18 +385,31 @@ async def parallel_agent_execution():
             return_exceptions=True
         )
         
-        print("\n📊 Parallel Execution Results:")
+        # Assemble the report after all tasks finish so output never interleaves
+        lines = ["\n📊 Parallel Execution Results:"]
         for agent_name, result, error in results:
             if error:
-                print(f"❌ {agent_name}: Failed - {error}")
+                lines.append(f"❌ {agent_name}: Failed - {error}")
             else:
-                response_preview = str(result)[:100] + "..." if len(str(result)) > 100 else str(result)
-                print(f"✅ {agent_name}: {response_preview}")
+                response_preview = truncate_text(str(result), 100)
+                lines.append(f"✅ {agent_name}: {response_preview}")
+        print("\n".join(lines))
                 
     except Exception as e:
         print(f"❌ Parallel execution error: {e}")
 
 
+def compact_for_prompt(value: Any) -> Any:
+    """Reduce an agent result to plain data, truncating long lists"""
+    if hasattr(value, "model_dump"):
+        value = value.model_dump()
+    if isinstance(value, dict):
+        return {key: compact_for_prompt(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [compact_for_prompt(item) for item in value[:MAX_PROMPT_FINDINGS]]
+    return value
+
+
 class MetaAgent(BaseAgent):
     """An agent that coordinates other agents"""
     
@@ -260,20 +435,39 @@ class MetaAgent(BaseAgent):
         logger.info(f"Meta-agent coordinating task: {task}")
         
         results = {}
+        pending = []
         
         # Simple coordination logic (can be made more sophisticated)
         if "research" in task.lower():
-            results["research"] = await self.available_agents["research"].run(
-                task, ResearchDependencies()
-            )
+            pending.append((
+                "research",
+                self.available_agents["research"].run(task, ResearchDependencies())
+            ))
         
         if "analyze" in task.lower() or "analysis" in task.lower():
-            results["analysis"] = await self.available_agents["analysis"].run(
-                task, DataDependencies()
-            )
+            pending.append((
+                "analysis",
+                self.available_agents["analysis"].run(task, DataDependencies())
+            ))
+        
+        # Sub-agents are independent of each other, so run them concurrently
+        outputs = await asyncio.gather(
+            *[coro for _, coro in pending],
+            return_exceptions=True
+        )
+        for (key, _), output in zip(pending, outputs):
+            if isinstance(output, BaseException):
+                logger.error(f"Meta-agent sub-task '{key}' failed: {output}")
+            results[key] = output
         
         # Always provide a summary
-        summary_prompt = f"Summarize the results of this multi-agent task: {task}\nResults: {results}"
+        compact = json.dumps(
+            {key: compact_for_prompt(value) for key, value in results.items()},
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str
+        )
+        summary_prompt = f"Summarize the results of this multi-agent task: {task}\nResults: {compact}"
         results["summary"] = await self.available_agents["chat"].run(
             summary_prompt, ChatDependencies()
         )
@@ -296,11 +490,11 @@ async def meta_agent_example():
     try:
         results = await meta_agent.coordinate_agents(complex_task)
         
-        print("\n📊 Coordination Results:")
+        lines = ["\n📊 Coordination Results:"]
         for agent_type, result in results.items():
-            print(f"\n🎯 {agent_type.upper()} Agent Result:")
-            result_preview = str(result)[:200] + "..." if len(str(result)) > 200 else str(result)
-            print(f"   {result_preview}")
+            result_preview = truncate_text(str(result), 200)
+            lines.append(f"\n🎯 {agent_type.upper()} Agent Result:\n   {result_preview}")
+        print("\n".join(lines))
             
     except Exception as e:
         print(f"❌ Meta-agent coordination error: {e}")
@@ -320,14 +514,18 @@ async def main():
         print("See .env.example for the required format.")
         return
     
+    # Shared dependencies for the parallel example, built once per run
+    dependencies = build_dependencies(generate_session_id())
+    
     try:
-        # Run advanced examples
-        await agent_chaining_example()
-        await streaming_example()
-        await retry_logic_example()
-        await custom_tool_integration()
-        await parallel_agent_execution()
-        await meta_agent_example()
+        # Run advanced examples over one pooled HTTP client
+        async with shared_http_client():
+            await agent_chaining_example()
+            await streaming_example()
+            await retry_logic_example()
+            await custom_tool_integration()
+            await parallel_agent_execution(dependencies)
+            await meta_agent_example()
         
         print("\n✅ All advanced examples completed successfully!")
         
@@ -337,4 +535,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
     asyncio.run(main())
\ No newline at end of file
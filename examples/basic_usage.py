@@ -18,8 +18,12 @@ from src.agents.examples.simple_chat import simple_chat_agent
 from src.agents.examples.research_agent import research_agent
 from src.agents.examples.data_analyst import data_analyst_agent
 from src.core.dependencies import ChatDependencies, ResearchDependencies, DataDependencies
+from src.core.http_client import shared_http_client
 from src.config.logging import logger
-from src.utils.helpers import generate_session_id
+from src.utils.helpers import generate_session_id, install_fast_event_loop
+
+# User/assistant exchanges kept as context for the chat example
+CONTEXT_TURNS = 16
 
 
 async def basic_chat_example():
@@ -27,11 +31,11 @@ async def basic_chat_example():
     print("\n🤖 Basic Chat Example")
     print("=" * 50)
     
-    # Create dependencies with conversation history
+    # Create dependencies with a bounded conversation history
     deps = ChatDependencies(
         user_id="demo_user",
         session_id=generate_session_id(),
-        conversation_history=[]
+        max_history=CONTEXT_TURNS * 2
     )
     
     # Simple conversation
@@ -80,19 +84,18 @@ async def research_example():
             deps
         )
         
-        print(f"\n📋 Research Results:")
-        print(f"Query: {result.query}")
-        print(f"\nFindings:")
-        for i, finding in enumerate(result.findings, 1):
-            print(f"  {i}. {finding}")
+        # Build the report first and write it in one go
+        lines = ["\n📋 Research Results:", f"Query: {result.query}", "\nFindings:"]
+        lines.extend(f"  {i}. {finding}" for i, finding in enumerate(result.findings, 1))
         
         if result.sources:
-            print(f"\nSources:")
-            for i, source in enumerate(result.sources, 1):
-                print(f"  {i}. {source}")
+            lines.append("\nSources:")
+            lines.extend(f"  {i}. {source}" for i, source in enumerate(result.sources, 1))
         
         if result.confidence:
-            print(f"\nConfidence Level: {result.confidence:.2f}")
+            lines.append(f"\nConfidence Level: {result.confidence:.2f}")
+        
+        print("\n".join(lines))
             
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -121,21 +124,21 @@ async def data_analysis_example():
     try:
         result = await data_analyst_agent.run(analysis_request, deps)
         
-        print(f"\n📈 Analysis Results:")
-        print(f"Analysis: {result.analysis}")
+        # Build the report first and write it in one go
+        lines = ["\n📈 Analysis Results:", f"Analysis: {result.analysis}"]
         
         if result.insights:
-            print(f"\n💡 Key Insights:")
-            for i, insight in enumerate(result.insights, 1):
-                print(f"  {i}. {insight}")
+            lines.append("\n💡 Key Insights:")
+            lines.extend(f"  {i}. {insight}" for i, insight in enumerate(result.insights, 1))
         
         if result.recommendations:
-            print(f"\n🎯 Recommendations:")
-            for i, rec in enumerate(result.recommendations, 1):
-                print(f"  {i}. {rec}")
+            lines.append("\n🎯 Recommendations:")
+            lines.extend(f"  {i}. {rec}" for i, rec in enumerate(result.recommendations, 1))
         
         if result.data_summary:
-            print(f"\n📊 Data Summary: {result.data_summary}")
+            lines.append(f"\n📊 Data Summary: {result.data_summary}")
+        
+        print("\n".join(lines))
             
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -153,12 +156,14 @@ async def agent_info_example():
     ]
     
     for name, agent in agents:
-        info = agent.get_info()
-        print(f"\n🤖 {name} Agent:")
-        print(f"  Name: {info['name']}")
-        print(f"  Model: {info['model']}")
-        print(f"  Dependencies: {info['deps_type']}")
-        print(f"  Output Type: {info['output_type']}")
+        info = agent.info
+        print(
+            f"\n🤖 {name} Agent:\n"
+            f"  Name: {info['name']}\n"
+            f"  Model: {info['model']}\n"
+            f"  Dependencies: {info['deps_type']}\n"
+            f"  Output Type: {info['output_type']}"
+        )
 
 
 async def main():
@@ -179,11 +184,12 @@ async def main():
         return
     
     try:
-        # Run all examples
-        await agent_info_example()
-        await basic_chat_example()
-        await research_example()
-        await data_analysis_example()
+        # Run all examples over one pooled HTTP client
+        async with shared_http_client():
+            await agent_info_example()
+            await basic_chat_example()
+            await research_example()
+            await data_analysis_example()
         
         print("\n✅ All examples completed successfully!")
         
@@ -193,5 +199,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Run the async main function
+    # Run the async main function, on uvloop when available
+    install_fast_event_loop()
     asyncio.run(main())
\ No newline at end of file
@@ -6,13 +6,25 @@ Demonstrates how different agents can work together, collaborate, and build upon
 Perfect for observing agent interactions and testing complex workflows.
 """
 
+import argparse
 import asyncio
+import hashlib
 import json
+import os
 import sys
 import time
+from dataclasses import dataclass
 from datetime import datetime
+from enum import IntEnum
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from string import Template
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -21,51 +33,493 @@ from src.agents.examples.simple_chat import simple_chat_agent
 from src.agents.examples.research_agent import research_agent
 from src.agents.examples.data_analyst import data_analyst_agent
 from src.core.dependencies import ChatDependencies, ResearchDependencies, DataDependencies
+from src.core.models import AnalysisResult, ResearchResult
 from src.utils.conversation_tracker import conversation_tracker
 from src.utils.observer import observer
 from src.config.logging import logger
+from src.tasks import queue_available, queue_reachable, submit_scenario, wait_for_scenario
+from src.utils.async_lru import async_lru_cache, fingerprint
+from src.utils.helpers import enable_eager_tasks
+
+# Upper bound for a single agent call, so one stalled call can't block a batch
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "120"))
+
+# Angles covered by parallel researchers in the collaborative scenario
+RESEARCH_FOCUSES = ("current trends", "key developments", "important findings")
+
+
+# Set AGENT_CACHE_DISABLE=1 to always call the LLM, even for repeated prompts
+AGENT_CACHE_DISABLE = os.getenv("AGENT_CACHE_DISABLE") == "1"
+
+
+@async_lru_cache(
+    maxsize=512,
+    key=lambda agent, prompt, deps: (
+        agent.name,
+        hashlib.blake2b(prompt.encode("utf-8")).digest(),
+        fingerprint(deps)
+    )
+)
+async def _cached_run(agent, prompt: str, deps) -> Any:
+    """Run an agent, reusing the result of an identical earlier call"""
+    return await agent.run(prompt, deps)
+
+
+# Prompt templates, parsed once at import
+_PLANNING_PROMPT = Template("""\
+We need to conduct comprehensive research on '$topic'.
+Please outline a structured approach for researching this topic,
+including what aspects should be investigated and how the research should be organized.
+""")
+
+_RESEARCH_FOCUS_PROMPT = Template(
+    "Conduct detailed research on '$topic', focusing on $focus. "
+    "Provide comprehensive research results with sources."
+)
+
+_COLLAB_ANALYSIS_PROMPT = Template("""\
+Analyze the following research findings on '$topic' and provide strategic insights:
+
+$research_summary
+
+Focus on identifying patterns, opportunities, implications, and actionable recommendations.
+""")
+
+_SYNTHESIS_PROMPT = Template("""\
+Create a comprehensive final report synthesizing all the collaborative research on '$topic'.
+
+Research Plan: $plan
+
+Research Findings: $research_summary
+
+Analysis: $analysis_summary
+
+Provide a clear, actionable executive summary that combines all insights.
+""")
+
+_MODERATION_PROMPT = Template("""\
+You are moderating a debate on '$topic'.
+Position A: $position_a
+Position B: $position_b
+
+Please introduce the topic and set ground rules for a constructive debate.
+""")
+
+_DEBATE_POSITION_PROMPT = Template("""\
+In this debate on '$topic', argue strongly for this position: $position
+
+Provide evidence, research findings, and logical arguments to support this viewpoint.
+Be persuasive but respectful.
+""")
+
+_DEBATE_BLIND_PROMPT = Template("""\
+In this debate on '$topic', argue strongly for this position: $position
+
+Provide data-driven insights, statistical evidence, and analytical reasoning
+to support your viewpoint.
+""")
+
+_DEBATE_COUNTER_PROMPT = Template("""\
+In this debate on '$topic', argue strongly for this position: $position
+
+Counter the previous arguments and provide data-driven insights, statistical evidence,
+and analytical reasoning to support your viewpoint. Address the opposing position directly.
+""")
+
+_CONCLUSION_PROMPT = Template("""\
+As the moderator of this debate on '$topic', provide a balanced summary:
+
+Position A ($position_a) presented:
+$argument_a
+
+Position B ($position_b) presented:
+$argument_b
+
+Summarize the key points from both sides and identify areas of agreement/disagreement.
+""")
+
+_BREAKDOWN_PROMPT = Template("""\
+We need to solve this problem: '$problem'
+
+Please break down this problem into smaller, manageable components.
+Identify what information we need, what research should be done,
+and what analysis would be helpful.
+""")
+
+_PROBLEM_RESEARCH_PROMPT = Template("""\
+Based on the problem breakdown, research information relevant to solving: '$problem'
+
+Problem analysis: $breakdown
+
+Find relevant data, examples, best practices, and approaches that could help solve this problem.
+""")
+
+_SOLUTION_PROMPT = Template("""\
+Based on the problem breakdown and research information, provide concrete solutions for: '$problem'
+
+Problem breakdown: $breakdown
+
+Research information: $research_info
+
+Analyze the options and provide specific, actionable recommendations with implementation steps.
+""")
+
+_IMPLEMENTATION_PROMPT = Template("""\
+Create a comprehensive implementation plan for solving: '$problem'
+
+Problem breakdown: $breakdown
+Research findings: $research_info
+Solution analysis: $solution_analysis
+
+Provide a clear, step-by-step implementation plan that integrates all the insights.
+""")
+
+
+class _Timer:
+    """Measures elapsed time with the monotonic perf_counter clock"""
+    
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._end: Optional[float] = None
+    
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        self._end = None
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._end = time.perf_counter()
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds since start, frozen once the block exits"""
+        end = self._end if self._end is not None else time.perf_counter()
+        return end - self._start
+
+
+def _new_conversation_id(prefix: str) -> str:
+    """Conversation id that stays unique for scenarios started in the same second"""
+    return f"{prefix}_{time.time_ns():x}"
+
+
+async def _run_step(agent, prompt: str, deps) -> Tuple[Any, float]:
+    """Run one agent call under the LLM timeout, returning (result, duration)"""
+    call = agent.run(prompt, deps) if AGENT_CACHE_DISABLE else _cached_run(agent, prompt, deps)
+    with _Timer() as timer:
+        result = await asyncio.wait_for(call, timeout=LLM_TIMEOUT)
+    return result, timer.elapsed
+
+
+def _merge_research(query: str, results: List[ResearchResult]) -> ResearchResult:
+    """Combine the output of several researchers into one result"""
+    findings = [finding for result in results for finding in result.findings]
+    sources = list(dict.fromkeys(source for result in results for source in result.sources))
+    confidences = [result.confidence for result in results if result.confidence is not None]
+    
+    return ResearchResult(
+        query=query,
+        findings=findings,
+        sources=sources,
+        confidence=sum(confidences) / len(confidences) if confidences else None
+    )
+
+
+def _format_enumerated(header: str, items: List[str]) -> str:
+    """Format a header followed by a numbered list, one item per line"""
+    lines = [header]
+    lines.extend(f"{i}. {item}" for i, item in enumerate(items, 1))
+    return "\n".join(lines) + "\n"
+
+
+# Chat agents answer with a message; use it as-is in transcripts
+_chat_message = attrgetter("message")
+
+
+def _format_research_summary(result: ResearchResult) -> str:
+    """Format research findings for display"""
+    parts = [_format_enumerated(f"Query: {result.query}\n\nFindings:", result.findings)]
+    
+    if result.confidence:
+        parts.append(f"\nConfidence: {result.confidence:.1%}")
+    
+    return "".join(parts)
+
+
+def _format_research_info(result: ResearchResult) -> str:
+    """Format research gathered for a problem"""
+    return _format_enumerated(
+        f"Research Query: {result.query}\n\nInformation Found:",
+        result.findings
+    )
+
+
+def _format_analysis_summary(result: AnalysisResult) -> str:
+    """Format an analysis with its insights and recommendations"""
+    parts = [f"Analysis: {result.analysis}\n"]
+    
+    if result.insights:
+        parts.append(_format_enumerated("\nKey Insights:", result.insights))
+    
+    if result.recommendations:
+        parts.append(_format_enumerated("\nRecommendations:", result.recommendations))
+    
+    return "".join(parts)
+
+
+def _format_solution_analysis(result: AnalysisResult) -> str:
+    """Format an analysis of possible solutions"""
+    parts = [f"Solution Analysis: {result.analysis}\n"]
+    
+    if result.recommendations:
+        parts.append(_format_enumerated("\nRecommendations:", result.recommendations))
+    
+    return "".join(parts)
+
+
+def _format_position_a(result: ResearchResult) -> str:
+    """Format the research agent's opening argument"""
+    return _format_enumerated(
+        f"Position A Argument:\n{result.query}\n\nKey Points:",
+        result.findings
+    )
+
+
+def _format_position_b(result: AnalysisResult) -> str:
+    """Format the analyst's opening argument"""
+    parts = [f"Position B Analysis: {result.analysis}\n"]
+    
+    if result.insights:
+        parts.append(_format_enumerated("\nKey Insights:", result.insights))
+    
+    return "".join(parts)
+
+
+class _MessageBus:
+    """Queues tracker messages and records them in batches off the scenario path"""
+    
+    def __init__(self, tracker):
+        self.q: asyncio.Queue = asyncio.Queue()
+        self._tracker = tracker
+        self._task = asyncio.create_task(self._drain())
+    
+    def post(
+        self,
+        conversation_id: str,
+        sender: str,
+        content: str,
+        message_type: str = "text",
+        metadata: Dict[str, Any] = None,
+        response_time: float = None
+    ):
+        """Queue a message for the tracker without waiting for it to be recorded"""
+        self.q.put_nowait({
+            "conversation_id": conversation_id,
+            "sender": sender,
+            "content": content,
+            "message_type": message_type,
+            "metadata": metadata,
+            "response_time": response_time
+        })
+    
+    async def flush(self):
+        """Wait until every queued message has been recorded"""
+        await self.q.join()
+    
+    async def _drain(self):
+        while True:
+            # Take everything that piled up since the last batch
+            batch = [await self.q.get()]
+            while True:
+                try:
+                    batch.append(self.q.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            try:
+                self._tracker.add_messages_bulk(batch)
+            except Exception as e:
+                logger.error(f"Failed to record {len(batch)} messages: {e}")
+            finally:
+                for _ in batch:
+                    self.q.task_done()
+
+
+class ScenarioSpec(NamedTuple):
+    """A scenario to run: its kind and the positional arguments it takes"""
+    kind: str
+    args: Tuple[Any, ...]
+
+
+def _write_results(filename: Path, results: Dict[str, Any]) -> None:
+    """Write results as JSON, replacing the file atomically"""
+    # Write to a temp file and swap it in, so readers never see a partial file
+    tmp_filename = filename.with_suffix(".json.tmp")
+    
+    if orjson is not None:
+        payload = orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(tmp_filename, 'wb') as f:
+            f.write(payload)
+    else:
+        # json.dump encodes incrementally, so large timelines aren't held in memory twice
+        with open(tmp_filename, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+    
+    os.replace(tmp_filename, filename)
+
+
+class AgentKind(IntEnum):
+    """Agents taking part in the scenarios, indexing AGENTS"""
+    CHAT = 0
+    RESEARCH = 1
+    ANALYST = 2
+
+
+@dataclass(frozen=True, slots=True)
+class AgentEntry:
+    """An agent with its dependency type and how it is shown in transcripts"""
+    agent: Any
+    deps_class: type
+    emoji: str
+    role: str
+
+
+AGENTS: Tuple[AgentEntry, ...] = (
+    AgentEntry(simple_chat_agent, ChatDependencies, "💬", "facilitator"),
+    AgentEntry(research_agent, ResearchDependencies, "🔍", "researcher"),
+    AgentEntry(data_analyst_agent, DataDependencies, "📊", "analyst"),
+)
+
+
+def _no_details(result: Any) -> Dict[str, Any]:
+    return {}
+
+
+@dataclass(slots=True)
+class Step:
+    """
+    One agent call in a scenario pipeline.
+    
+    `prompt` and `deps` are built from the pipeline state, which maps the
+    names of finished steps to their formatted output. A prompt builder may
+    return several prompts; they run concurrently and `merge` combines the
+    results.
+    """
+    name: str
+    agent: AgentKind
+    action: str
+    message_type: str
+    prompt: Callable[[Dict[str, str]], Union[str, List[str]]]
+    deps: Callable[[Dict[str, str]], Any]
+    format: Callable[[Any], str]
+    details: Callable[[Any], Dict[str, Any]] = _no_details
+    depends_on: Tuple[str, ...] = ()
+    merge: Optional[Callable[[List[Any]], Any]] = None
+    announce: str = ""
+    label: str = ""
 
 
 class MultiAgentScenarios:
     """Orchestrates multi-agent interaction scenarios"""
     
     def __init__(self):
-        self.agents = {
-            "chat": {
-                "agent": simple_chat_agent,
-                "deps_class": ChatDependencies,
-                "emoji": "💬",
-                "role": "facilitator"
-            },
-            "research": {
-                "agent": research_agent, 
-                "deps_class": ResearchDependencies,
-                "emoji": "🔍",
-                "role": "researcher"
-            },
-            "analyst": {
-                "agent": data_analyst_agent,
-                "deps_class": DataDependencies,
-                "emoji": "📊", 
-                "role": "analyst"
-            }
-        }
+        self.agents = AGENTS
+        
+        # Scenario results are saved here
+        self._save_dir = Path("generated/conversations")
+        self._save_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Created on first use, inside the running event loop
+        self._message_bus: Optional[_MessageBus] = None
         
         # Register agents with conversation tracker
-        for agent_id, config in self.agents.items():
+        for kind, entry in zip(AgentKind, self.agents):
+            agent_id = kind.name.lower()
             conversation_tracker.register_agent(agent_id, {
                 "name": agent_id,
-                "role": config["role"],
-                "emoji": config["emoji"]
+                "role": entry.role,
+                "emoji": entry.emoji
             })
     
+    @property
+    def _bus(self) -> _MessageBus:
+        """Message bus feeding the conversation tracker"""
+        if self._message_bus is None:
+            self._message_bus = _MessageBus(conversation_tracker)
+        return self._message_bus
+    
+    async def _run_pipeline_step(self, step: Step, state: Dict[str, str]) -> Tuple[Any, float]:
+        """Run one step, fanning out when its prompt builder returns several prompts"""
+        agent = AGENTS[step.agent].agent
+        deps = step.deps(state)
+        prompt = step.prompt(state)
+        
+        if isinstance(prompt, str):
+            return await _run_step(agent, prompt, deps)
+        
+        runs = await asyncio.gather(*[_run_step(agent, p, deps) for p in prompt])
+        return step.merge([result for result, _ in runs]), max(duration for _, duration in runs)
+    
+    async def _run_pipeline(self, conversation_id: str, steps: List[Step]) -> List[Dict[str, Any]]:
+        """
+        Run scenario steps, gathering every step whose dependencies are met.
+        
+        Each step's formatted output is posted to the conversation and made
+        available to later steps under its name. Returns one timeline record
+        per step, in step order.
+        """
+        numbers = {step.name: number for number, step in enumerate(steps, 1)}
+        state: Dict[str, str] = {}
+        records: Dict[str, Dict[str, Any]] = {}
+        pending = list(steps)
+        
+        while pending:
+            ready = [step for step in pending if all(dep in state for dep in step.depends_on)]
+            if not ready:
+                raise ValueError(f"Unsatisfiable step dependencies: {[step.name for step in pending]}")
+            
+            for step in ready:
+                logger.info(step.announce)
+            
+            runs = await asyncio.gather(*[self._run_pipeline_step(step, state) for step in ready])
+            
+            for step, (result, duration) in zip(ready, runs):
+                sender = step.agent.name.lower()
+                output = step.format(result)
+                details = step.details(result)
+                state[step.name] = output
+                
+                self._bus.post(
+                    conversation_id,
+                    sender,
+                    output,
+                    step.message_type,
+                    {"step": numbers[step.name], **details},
+                    duration
+                )
+                
+                records[step.name] = {
+                    "step": numbers[step.name],
+                    "agent": sender,
+                    "action": step.action,
+                    "duration": duration,
+                    **details,
+                    "output": output
+                }
+                
+                logger.info("%s:\n%s", step.label, output)
+            
+            pending = [step for step in pending if step.name not in state]
+        
+        return [records[step.name] for step in steps]
+    
     async def scenario_collaborative_research(self, topic: str) -> Dict[str, Any]:
         """Scenario: Multiple agents collaborate on a research topic"""
-        print(f"🤝 Collaborative Research Scenario")
-        print(f"📋 Topic: {topic}")
-        print("=" * 60)
+        logger.info("🤝 Collaborative Research Scenario")
+        logger.info("📋 Topic: %s", topic)
+        logger.info("=" * 60)
         
-        conversation_id = f"collab_research_{int(time.time())}"
+        scenario_timer = _Timer()
+        conversation_id = _new_conversation_id("collab_research")
         participants = ["chat", "research", "analyst"]
         
         # Start conversation tracking
@@ -83,209 +537,117 @@ class MultiAgentScenarios:
             "timeline": []
         }
         
-        try:
-            # Step 1: Chat agent introduces the topic and plans approach
-            print(f"\n💬 Step 1: Planning the research approach")
-            planning_prompt = f"""
-            We need to conduct comprehensive research on '{topic}'. 
-            Please outline a structured approach for researching this topic, 
-            including what aspects should be investigated and how the research should be organized.
-            """
-            
-            start_time = time.time()
-            chat_deps = ChatDependencies(
-                user_id="scenario_user",
-                session_id="collab_session", 
-                context={"scenario": "collaborative_research", "topic": topic}
-            )
-            
-            planning_result = await simple_chat_agent.run(planning_prompt, chat_deps)
-            planning_time = time.time() - start_time
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "chat",
-                planning_result.message,
-                "planning",
-                {"step": 1},
-                planning_time
-            )
-            
-            results["timeline"].append({
-                "step": 1,
-                "agent": "chat",
-                "action": "research_planning",
-                "duration": planning_time,
-                "output": planning_result.message
-            })
-            
-            print(f"💬 Chat Agent Plan:\n{planning_result.message}\n")
-            
-            # Step 2: Research agent gathers information
-            print(f"🔍 Step 2: Gathering research information")
-            research_prompt = f"""
-            Based on the research plan, conduct detailed research on '{topic}'.
-            Focus on current trends, key developments, and important findings.
-            Provide comprehensive research results with sources.
-            """
-            
-            start_time = time.time()
-            research_deps = ResearchDependencies(
-                user_id="scenario_user",
-                session_id="collab_session",
-                search_enabled=True,
-                max_results=5,
-                context={
-                    "scenario": "collaborative_research", 
-                    "topic": topic,
-                    "previous_step": "planning"
-                }
-            )
-            
-            research_result = await research_agent.run(research_prompt, research_deps)
-            research_time = time.time() - start_time
-            
-            # Format research findings for display
-            research_summary = f"Query: {research_result.query}\n\nFindings:\n"
-            for i, finding in enumerate(research_result.findings, 1):
-                research_summary += f"{i}. {finding}\n"
-            
-            if research_result.confidence:
-                research_summary += f"\nConfidence: {research_result.confidence:.1%}"
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "research",
-                research_summary,
-                "research",
-                {"step": 2, "findings_count": len(research_result.findings)},
-                research_time
-            )
-            
-            results["timeline"].append({
-                "step": 2,
-                "agent": "research",
-                "action": "information_gathering",
-                "duration": research_time,
-                "findings_count": len(research_result.findings),
-                "output": research_summary
-            })
-            
-            print(f"🔍 Research Results:\n{research_summary}\n")
-            
-            # Step 3: Analyst agent analyzes the research
-            print(f"📊 Step 3: Analyzing research findings")
-            analysis_prompt = f"""
-            Analyze the following research findings on '{topic}' and provide strategic insights:
-            
-            {research_summary}
-            
-            Focus on identifying patterns, opportunities, implications, and actionable recommendations.
-            """
-            
-            start_time = time.time()
-            analyst_deps = DataDependencies(
-                user_id="scenario_user",
-                session_id="collab_session",
-                context={
-                    "scenario": "collaborative_research",
-                    "topic": topic,
-                    "previous_steps": ["planning", "research"]
-                }
-            )
-            
-            analysis_result = await data_analyst_agent.run(analysis_prompt, analyst_deps)
-            analysis_time = time.time() - start_time
-            
-            # Format analysis for display
-            analysis_summary = f"Analysis: {analysis_result.analysis}\n"
-            
-            if analysis_result.insights:
-                analysis_summary += f"\nKey Insights:\n"
-                for i, insight in enumerate(analysis_result.insights, 1):
-                    analysis_summary += f"{i}. {insight}\n"
-            
-            if analysis_result.recommendations:
-                analysis_summary += f"\nRecommendations:\n"
-                for i, rec in enumerate(analysis_result.recommendations, 1):
-                    analysis_summary += f"{i}. {rec}\n"
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "analyst",
-                analysis_summary,
-                "analysis",
-                {
-                    "step": 3,
-                    "insights_count": len(analysis_result.insights) if analysis_result.insights else 0,
-                    "recommendations_count": len(analysis_result.recommendations) if analysis_result.recommendations else 0
+        chat_deps = ChatDependencies(
+            user_id="scenario_user",
+            session_id="collab_session", 
+            context={"scenario": "collaborative_research", "topic": topic}
+        )
+        
+        research_deps = ResearchDependencies(
+            user_id="scenario_user",
+            session_id="collab_session",
+            search_enabled=True,
+            max_results=5,
+            context={"scenario": "collaborative_research", "topic": topic}
+        )
+        
+        analyst_deps = DataDependencies(
+            user_id="scenario_user",
+            session_id="collab_session",
+            context={
+                "scenario": "collaborative_research",
+                "topic": topic,
+                "previous_steps": ["planning", "research"]
+            }
+        )
+        
+        # Planning and research are independent: the chat agent plans while
+        # several researchers cover different angles of the topic in parallel
+        steps = [
+            Step(
+                name="plan",
+                agent=AgentKind.CHAT,
+                action="research_planning",
+                message_type="planning",
+                prompt=lambda state: _PLANNING_PROMPT.substitute(topic=topic),
+                deps=lambda state: chat_deps,
+                format=_chat_message,
+                announce="💬 Step 1: Planning the research approach",
+                label="💬 Chat Agent Plan"
+            ),
+            Step(
+                name="research",
+                agent=AgentKind.RESEARCH,
+                action="information_gathering",
+                message_type="research",
+                prompt=lambda state: [
+                    _RESEARCH_FOCUS_PROMPT.substitute(topic=topic, focus=focus)
+                    for focus in RESEARCH_FOCUSES
+                ],
+                deps=lambda state: research_deps,
+                format=_format_research_summary,
+                details=lambda result: {"findings_count": len(result.findings)},
+                merge=lambda found: _merge_research(topic, found),
+                announce="🔍 Step 2: Gathering research information",
+                label="🔍 Research Results"
+            ),
+            Step(
+                name="analysis",
+                agent=AgentKind.ANALYST,
+                action="data_analysis",
+                message_type="analysis",
+                prompt=lambda state: _COLLAB_ANALYSIS_PROMPT.substitute(
+                    topic=topic,
+                    research_summary=state["research"]
+                ),
+                deps=lambda state: analyst_deps,
+                format=_format_analysis_summary,
+                details=lambda result: {
+                    "insights_count": len(result.insights) if result.insights else 0,
+                    "recommendations_count": len(result.recommendations) if result.recommendations else 0
                 },
-                analysis_time
-            )
-            
-            results["timeline"].append({
-                "step": 3,
-                "agent": "analyst",
-                "action": "data_analysis",
-                "duration": analysis_time,
-                "insights_count": len(analysis_result.insights) if analysis_result.insights else 0,
-                "recommendations_count": len(analysis_result.recommendations) if analysis_result.recommendations else 0,
-                "output": analysis_summary
-            })
-            
-            print(f"📊 Analysis Results:\n{analysis_summary}\n")
-            
-            # Step 4: Chat agent synthesizes final report
-            print(f"💬 Step 4: Synthesizing final report")
-            synthesis_prompt = f"""
-            Create a comprehensive final report synthesizing all the collaborative research on '{topic}'.
-            
-            Research Plan: {planning_result.message}
-            
-            Research Findings: {research_summary}
-            
-            Analysis: {analysis_summary}
-            
-            Provide a clear, actionable executive summary that combines all insights.
-            """
-            
-            start_time = time.time()
-            final_result = await simple_chat_agent.run(synthesis_prompt, chat_deps)
-            synthesis_time = time.time() - start_time
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "chat",
-                final_result.message,
-                "synthesis",
-                {"step": 4, "is_final": True},
-                synthesis_time
+                depends_on=("research",),
+                announce="📊 Step 3: Analyzing research findings",
+                label="📊 Analysis Results"
+            ),
+            Step(
+                name="synthesis",
+                agent=AgentKind.CHAT,
+                action="synthesis",
+                message_type="synthesis",
+                prompt=lambda state: _SYNTHESIS_PROMPT.substitute(
+                    topic=topic,
+                    plan=state["plan"],
+                    research_summary=state["research"],
+                    analysis_summary=state["analysis"]
+                ),
+                deps=lambda state: chat_deps,
+                format=_chat_message,
+                details=lambda result: {"is_final": True},
+                depends_on=("plan", "research", "analysis"),
+                announce="💬 Step 4: Synthesizing final report",
+                label="💬 Final Report"
             )
+        ]
+        
+        try:
+            results["timeline"] = await self._run_pipeline(conversation_id, steps)
             
-            results["timeline"].append({
-                "step": 4,
-                "agent": "chat",
-                "action": "synthesis",
-                "duration": synthesis_time,
-                "output": final_result.message
-            })
-            
-            print(f"💬 Final Report:\n{final_result.message}\n")
-            
-            # Calculate totals
-            total_time = sum(step["duration"] for step in results["timeline"])
+            # Steps overlap, so report wall-clock time rather than the sum
+            total_time = scenario_timer.elapsed
             results["total_duration"] = total_time
             results["success"] = True
             
-            print(f"✅ Collaborative research completed in {total_time:.2f}s")
+            logger.info("✅ Collaborative research completed in %.2fs", total_time)
             
         except Exception as e:
             results["success"] = False
             results["error"] = str(e)
-            print(f"❌ Scenario failed: {e}")
+            logger.error("❌ Scenario failed: %s", e)
         
         finally:
-            # End conversation tracking
+            # End conversation tracking once queued messages are recorded
+            await self._bus.flush()
             conversation_tracker.end_conversation(
                 conversation_id,
                 "Collaborative research scenario completed"
@@ -293,15 +655,27 @@ class MultiAgentScenarios:
         
         return results
     
-    async def scenario_debate_discussion(self, topic: str, position_a: str, position_b: str) -> Dict[str, Any]:
-        """Scenario: Two agents debate different positions, moderated by a third"""
-        print(f"🗣️ Debate Discussion Scenario")
-        print(f"📋 Topic: {topic}")
-        print(f"🔵 Position A: {position_a}")
-        print(f"🔴 Position B: {position_b}")
-        print("=" * 60)
+    async def scenario_debate_discussion(
+        self,
+        topic: str,
+        position_a: str,
+        position_b: str,
+        blind_round: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Scenario: Two agents debate different positions, moderated by a third.
         
-        conversation_id = f"debate_{int(time.time())}"
+        In a blind round both opening arguments are written concurrently; with
+        blind_round=False the analyst sees and rebuts position A first.
+        """
+        logger.info("🗣️ Debate Discussion Scenario")
+        logger.info("📋 Topic: %s", topic)
+        logger.info("🔵 Position A: %s", position_a)
+        logger.info("🔴 Position B: %s", position_b)
+        logger.info("=" * 60)
+        
+        scenario_timer = _Timer()
+        conversation_id = _new_conversation_id("debate")
         participants = ["chat", "research", "analyst"]
         
         conversation_tracker.start_conversation(
@@ -314,174 +688,143 @@ class MultiAgentScenarios:
             "scenario": "debate_discussion",
             "topic": topic,
             "positions": {"a": position_a, "b": position_b},
+            "blind_round": blind_round,
             "conversation_id": conversation_id,
             "debate_rounds": []
         }
         
-        try:
-            # Chat agent moderates, Research takes position A, Analyst takes position B
-            print(f"\n💬 Moderator: Starting the debate")
-            
-            moderation_prompt = f"""
-            You are moderating a debate on '{topic}'.
-            Position A: {position_a}
-            Position B: {position_b}
-            
-            Please introduce the topic and set ground rules for a constructive debate.
-            """
-            
-            start_time = time.time()
-            chat_deps = ChatDependencies(
-                user_id="scenario_user",
-                session_id="debate_session",
-                context={"scenario": "debate", "role": "moderator"}
-            )
-            
-            moderation_result = await simple_chat_agent.run(moderation_prompt, chat_deps)
-            mod_time = time.time() - start_time
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "chat",
-                moderation_result.message,
-                "moderation",
-                {"role": "moderator"},
-                mod_time
-            )
-            
-            print(f"💬 Moderator:\n{moderation_result.message}\n")
-            
-            # Round 1: Research agent argues for position A
-            print(f"🔍 Round 1: Research Agent (Position A)")
-            
-            research_prompt = f"""
-            In this debate on '{topic}', argue strongly for this position: {position_a}
-            
-            Provide evidence, research findings, and logical arguments to support this viewpoint.
-            Be persuasive but respectful.
-            """
-            
-            start_time = time.time()
-            research_deps = ResearchDependencies(
-                user_id="scenario_user",
-                session_id="debate_session",
-                context={"scenario": "debate", "role": "position_a", "position": position_a}
-            )
-            
-            research_debate = await research_agent.run(research_prompt, research_deps)
-            research_time = time.time() - start_time
-            
-            # Format research argument
-            research_argument = f"Position A Argument:\n{research_debate.query}\n\nKey Points:\n"
-            for i, finding in enumerate(research_debate.findings, 1):
-                research_argument += f"{i}. {finding}\n"
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "research",
-                research_argument,
-                "argument",
-                {"position": "A", "round": 1},
-                research_time
-            )
-            
-            print(f"🔍 Research Agent (Position A):\n{research_argument}\n")
-            
-            # Round 1: Analyst agent argues for position B
-            print(f"📊 Round 1: Analyst Agent (Position B)")
-            
-            analysis_prompt = f"""
-            In this debate on '{topic}', argue strongly for this position: {position_b}
-            
-            Counter the previous arguments and provide data-driven insights, statistical evidence,
-            and analytical reasoning to support your viewpoint. Address the opposing position directly.
-            """
-            
-            start_time = time.time()
-            analyst_deps = DataDependencies(
-                user_id="scenario_user",
-                session_id="debate_session",
-                context={
-                    "scenario": "debate", 
-                    "role": "position_b", 
-                    "position": position_b,
-                    "opposing_argument": research_argument
-                }
+        # Chat agent moderates, Research takes position A, Analyst takes position B
+        chat_deps = ChatDependencies(
+            user_id="scenario_user",
+            session_id="debate_session",
+            context={"scenario": "debate", "role": "moderator"}
+        )
+        
+        research_deps = ResearchDependencies(
+            user_id="scenario_user",
+            session_id="debate_session",
+            context={"scenario": "debate", "role": "position_a", "position": position_a}
+        )
+        
+        analyst_deps = DataDependencies(
+            user_id="scenario_user",
+            session_id="debate_session",
+            context={
+                "scenario": "debate", 
+                "role": "position_b", 
+                "position": position_b
+            }
+        )
+        
+        if blind_round:
+            position_b_step = Step(
+                name="position_b",
+                agent=AgentKind.ANALYST,
+                action="argument",
+                message_type="argument",
+                prompt=lambda state: _DEBATE_BLIND_PROMPT.substitute(topic=topic, position=position_b),
+                deps=lambda state: analyst_deps,
+                format=_format_position_b,
+                details=lambda result: {"position": "B", "round": 1},
+                announce="📊 Round 1: Analyst Agent (Position B)",
+                label="📊 Analyst Agent (Position B)"
             )
-            
-            analyst_debate = await data_analyst_agent.run(analysis_prompt, analyst_deps)
-            analyst_time = time.time() - start_time
-            
-            # Format analyst argument
-            analyst_argument = f"Position B Analysis: {analyst_debate.analysis}\n"
-            
-            if analyst_debate.insights:
-                analyst_argument += f"\nKey Insights:\n"
-                for i, insight in enumerate(analyst_debate.insights, 1):
-                    analyst_argument += f"{i}. {insight}\n"
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "analyst", 
-                analyst_argument,
-                "argument",
-                {"position": "B", "round": 1},
-                analyst_time
+        else:
+            position_b_step = Step(
+                name="position_b",
+                agent=AgentKind.ANALYST,
+                action="argument",
+                message_type="argument",
+                prompt=lambda state: _DEBATE_COUNTER_PROMPT.substitute(topic=topic, position=position_b),
+                deps=lambda state: analyst_deps.model_copy(
+                    update={"context": {**analyst_deps.context, "opposing_argument": state["position_a"]}}
+                ),
+                format=_format_position_b,
+                details=lambda result: {"position": "B", "round": 1},
+                depends_on=("position_a",),
+                announce="📊 Round 1: Analyst Agent (Position B)",
+                label="📊 Analyst Agent (Position B)"
             )
-            
-            print(f"📊 Analyst Agent (Position B):\n{analyst_argument}\n")
-            
-            # Moderator summary
-            print(f"💬 Moderator: Concluding the debate")
-            
-            conclusion_prompt = f"""
-            As the moderator of this debate on '{topic}', provide a balanced summary:
-            
-            Position A ({position_a}) presented:
-            {research_argument}
-            
-            Position B ({position_b}) presented:
-            {analyst_argument}
-            
-            Summarize the key points from both sides and identify areas of agreement/disagreement.
-            """
-            
-            start_time = time.time()
-            conclusion_result = await simple_chat_agent.run(conclusion_prompt, chat_deps)
-            conclusion_time = time.time() - start_time
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "chat",
-                conclusion_result.message,
-                "conclusion",
-                {"role": "moderator"},
-                conclusion_time
+        
+        # The introduction and the opening arguments are independent; in a blind
+        # round the analyst doesn't see position A first, so all three run at once
+        steps = [
+            Step(
+                name="moderation",
+                agent=AgentKind.CHAT,
+                action="moderation",
+                message_type="moderation",
+                prompt=lambda state: _MODERATION_PROMPT.substitute(
+                    topic=topic,
+                    position_a=position_a,
+                    position_b=position_b
+                ),
+                deps=lambda state: chat_deps,
+                format=_chat_message,
+                details=lambda result: {"role": "moderator"},
+                announce="💬 Moderator: Starting the debate",
+                label="💬 Moderator"
+            ),
+            Step(
+                name="position_a",
+                agent=AgentKind.RESEARCH,
+                action="argument",
+                message_type="argument",
+                prompt=lambda state: _DEBATE_POSITION_PROMPT.substitute(topic=topic, position=position_a),
+                deps=lambda state: research_deps,
+                format=_format_position_a,
+                details=lambda result: {"position": "A", "round": 1},
+                announce="🔍 Round 1: Research Agent (Position A)",
+                label="🔍 Research Agent (Position A)"
+            ),
+            position_b_step,
+            Step(
+                name="conclusion",
+                agent=AgentKind.CHAT,
+                action="conclusion",
+                message_type="conclusion",
+                prompt=lambda state: _CONCLUSION_PROMPT.substitute(
+                    topic=topic,
+                    position_a=position_a,
+                    argument_a=state["position_a"],
+                    position_b=position_b,
+                    argument_b=state["position_b"]
+                ),
+                deps=lambda state: chat_deps,
+                format=_chat_message,
+                details=lambda result: {"role": "moderator"},
+                depends_on=("moderation", "position_a", "position_b"),
+                announce="💬 Moderator: Concluding the debate",
+                label="💬 Moderator Summary"
             )
-            
-            print(f"💬 Moderator Summary:\n{conclusion_result.message}\n")
+        ]
+        
+        try:
+            _, argument_a, argument_b, conclusion = await self._run_pipeline(conversation_id, steps)
             
             results["debate_rounds"] = [
                 {
                     "round": 1,
-                    "position_a": research_argument,
-                    "position_b": analyst_argument,
-                    "moderation": conclusion_result.message
+                    "position_a": argument_a["output"],
+                    "position_b": argument_b["output"],
+                    "moderation": conclusion["output"]
                 }
             ]
             
-            total_time = mod_time + research_time + analyst_time + conclusion_time
+            # Opening calls overlap, so report wall-clock time rather than the sum
+            total_time = scenario_timer.elapsed
             results["total_duration"] = total_time
             results["success"] = True
             
-            print(f"✅ Debate completed in {total_time:.2f}s")
+            logger.info("✅ Debate completed in %.2fs", total_time)
             
         except Exception as e:
             results["success"] = False
             results["error"] = str(e)
-            print(f"❌ Debate failed: {e}")
+            logger.error("❌ Debate failed: %s", e)
         
         finally:
+            await self._bus.flush()
             conversation_tracker.end_conversation(
                 conversation_id,
                 "Debate discussion scenario completed"
@@ -491,11 +834,12 @@ class MultiAgentScenarios:
     
     async def scenario_problem_solving_chain(self, problem: str) -> Dict[str, Any]:
         """Scenario: Agents work in sequence to solve a complex problem"""
-        print(f"🧩 Problem-Solving Chain Scenario")
-        print(f"❓ Problem: {problem}")
-        print("=" * 60)
+        logger.info("🧩 Problem-Solving Chain Scenario")
+        logger.info("❓ Problem: %s", problem)
+        logger.info("=" * 60)
         
-        conversation_id = f"problem_solving_{int(time.time())}"
+        scenario_timer = _Timer()
+        conversation_id = _new_conversation_id("problem_solving")
         participants = ["chat", "research", "analyst"]
         
         conversation_tracker.start_conversation(
@@ -511,196 +855,104 @@ class MultiAgentScenarios:
             "solution_chain": []
         }
         
-        try:
-            # Step 1: Chat agent breaks down the problem
-            print(f"\n💬 Step 1: Problem breakdown and analysis")
-            
-            breakdown_prompt = f"""
-            We need to solve this problem: '{problem}'
-            
-            Please break down this problem into smaller, manageable components.
-            Identify what information we need, what research should be done,
-            and what analysis would be helpful.
-            """
-            
-            start_time = time.time()
-            chat_deps = ChatDependencies(
-                user_id="scenario_user",
-                session_id="problem_session",
-                context={"scenario": "problem_solving", "problem": problem}
-            )
-            
-            breakdown_result = await simple_chat_agent.run(breakdown_prompt, chat_deps)
-            breakdown_time = time.time() - start_time
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "chat",
-                breakdown_result.message,
-                "problem_breakdown",
-                {"step": 1},
-                breakdown_time
-            )
-            
-            print(f"💬 Problem Breakdown:\n{breakdown_result.message}\n")
-            
-            # Step 2: Research agent gathers relevant information
-            print(f"🔍 Step 2: Information gathering")
-            
-            research_prompt = f"""
-            Based on the problem breakdown, research information relevant to solving: '{problem}'
-            
-            Problem analysis: {breakdown_result.message}
-            
-            Find relevant data, examples, best practices, and approaches that could help solve this problem.
-            """
-            
-            start_time = time.time()
-            research_deps = ResearchDependencies(
-                user_id="scenario_user",
-                session_id="problem_session",
-                context={
-                    "scenario": "problem_solving",
-                    "problem": problem,
-                    "breakdown": breakdown_result.message
-                }
-            )
-            
-            research_result = await research_agent.run(research_prompt, research_deps)
-            research_time = time.time() - start_time
-            
-            research_info = f"Research Query: {research_result.query}\n\nInformation Found:\n"
-            for i, finding in enumerate(research_result.findings, 1):
-                research_info += f"{i}. {finding}\n"
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "research",
-                research_info,
-                "information_gathering",
-                {"step": 2},
-                research_time
-            )
-            
-            print(f"🔍 Research Information:\n{research_info}\n")
-            
-            # Step 3: Analyst provides solution recommendations
-            print(f"📊 Step 3: Solution analysis and recommendations")
-            
-            solution_prompt = f"""
-            Based on the problem breakdown and research information, provide concrete solutions for: '{problem}'
-            
-            Problem breakdown: {breakdown_result.message}
-            
-            Research information: {research_info}
-            
-            Analyze the options and provide specific, actionable recommendations with implementation steps.
-            """
-            
-            start_time = time.time()
-            analyst_deps = DataDependencies(
-                user_id="scenario_user",
-                session_id="problem_session",
-                context={
-                    "scenario": "problem_solving",
-                    "problem": problem,
-                    "breakdown": breakdown_result.message,
-                    "research": research_info
-                }
-            )
-            
-            solution_result = await data_analyst_agent.run(solution_prompt, analyst_deps)
-            solution_time = time.time() - start_time
-            
-            solution_analysis = f"Solution Analysis: {solution_result.analysis}\n"
-            
-            if solution_result.recommendations:
-                solution_analysis += f"\nRecommendations:\n"
-                for i, rec in enumerate(solution_result.recommendations, 1):
-                    solution_analysis += f"{i}. {rec}\n"
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "analyst",
-                solution_analysis,
-                "solution_analysis",
-                {"step": 3},
-                solution_time
-            )
-            
-            print(f"📊 Solution Analysis:\n{solution_analysis}\n")
-            
-            # Step 4: Chat agent creates final implementation plan
-            print(f"💬 Step 4: Implementation planning")
-            
-            implementation_prompt = f"""
-            Create a comprehensive implementation plan for solving: '{problem}'
-            
-            Problem breakdown: {breakdown_result.message}
-            Research findings: {research_info}
-            Solution analysis: {solution_analysis}
-            
-            Provide a clear, step-by-step implementation plan that integrates all the insights.
-            """
-            
-            start_time = time.time()
-            implementation_result = await simple_chat_agent.run(implementation_prompt, chat_deps)
-            implementation_time = time.time() - start_time
-            
-            conversation_tracker.add_message(
-                conversation_id,
-                "chat",
-                implementation_result.message,
-                "implementation_plan",
-                {"step": 4, "is_final": True},
-                implementation_time
+        chat_deps = ChatDependencies(
+            user_id="scenario_user",
+            session_id="problem_session",
+            context={"scenario": "problem_solving", "problem": problem}
+        )
+        
+        # Each step builds on everything before it, so the chain runs in sequence
+        steps = [
+            Step(
+                name="breakdown",
+                agent=AgentKind.CHAT,
+                action="problem_breakdown",
+                message_type="problem_breakdown",
+                prompt=lambda state: _BREAKDOWN_PROMPT.substitute(problem=problem),
+                deps=lambda state: chat_deps,
+                format=_chat_message,
+                announce="💬 Step 1: Problem breakdown and analysis",
+                label="💬 Problem Breakdown"
+            ),
+            Step(
+                name="research",
+                agent=AgentKind.RESEARCH,
+                action="information_gathering",
+                message_type="information_gathering",
+                prompt=lambda state: _PROBLEM_RESEARCH_PROMPT.substitute(
+                    problem=problem,
+                    breakdown=state["breakdown"]
+                ),
+                deps=lambda state: ResearchDependencies(
+                    user_id="scenario_user",
+                    session_id="problem_session",
+                    context={**chat_deps.context, "breakdown": state["breakdown"]}
+                ),
+                format=_format_research_info,
+                depends_on=("breakdown",),
+                announce="🔍 Step 2: Information gathering",
+                label="🔍 Research Information"
+            ),
+            Step(
+                name="solution",
+                agent=AgentKind.ANALYST,
+                action="solution_analysis",
+                message_type="solution_analysis",
+                prompt=lambda state: _SOLUTION_PROMPT.substitute(
+                    problem=problem,
+                    breakdown=state["breakdown"],
+                    research_info=state["research"]
+                ),
+                deps=lambda state: DataDependencies(
+                    user_id="scenario_user",
+                    session_id="problem_session",
+                    context={
+                        **chat_deps.context,
+                        "breakdown": state["breakdown"],
+                        "research": state["research"]
+                    }
+                ),
+                format=_format_solution_analysis,
+                depends_on=("breakdown", "research"),
+                announce="📊 Step 3: Solution analysis and recommendations",
+                label="📊 Solution Analysis"
+            ),
+            Step(
+                name="implementation",
+                agent=AgentKind.CHAT,
+                action="implementation_planning",
+                message_type="implementation_plan",
+                prompt=lambda state: _IMPLEMENTATION_PROMPT.substitute(
+                    problem=problem,
+                    breakdown=state["breakdown"],
+                    research_info=state["research"],
+                    solution_analysis=state["solution"]
+                ),
+                deps=lambda state: chat_deps,
+                format=_chat_message,
+                details=lambda result: {"is_final": True},
+                depends_on=("breakdown", "research", "solution"),
+                announce="💬 Step 4: Implementation planning",
+                label="💬 Implementation Plan"
             )
+        ]
+        
+        try:
+            results["solution_chain"] = await self._run_pipeline(conversation_id, steps)
             
-            print(f"💬 Implementation Plan:\n{implementation_result.message}\n")
-            
-            results["solution_chain"] = [
-                {
-                    "step": 1,
-                    "agent": "chat",
-                    "action": "problem_breakdown",
-                    "output": breakdown_result.message,
-                    "duration": breakdown_time
-                },
-                {
-                    "step": 2,
-                    "agent": "research", 
-                    "action": "information_gathering",
-                    "output": research_info,
-                    "duration": research_time
-                },
-                {
-                    "step": 3,
-                    "agent": "analyst",
-                    "action": "solution_analysis",
-                    "output": solution_analysis,
-                    "duration": solution_time
-                },
-                {
-                    "step": 4,
-                    "agent": "chat",
-                    "action": "implementation_planning",
-                    "output": implementation_result.message,
-                    "duration": implementation_time
-                }
-            ]
-            
-            total_time = breakdown_time + research_time + solution_time + implementation_time
+            total_time = scenario_timer.elapsed
             results["total_duration"] = total_time
             results["success"] = True
             
-            print(f"✅ Problem-solving chain completed in {total_time:.2f}s")
+            logger.info("✅ Problem-solving chain completed in %.2fs", total_time)
             
         except Exception as e:
             results["success"] = False
             results["error"] = str(e)
-            print(f"❌ Problem-solving failed: {e}")
+            logger.error("❌ Problem-solving failed: %s", e)
         
         finally:
+            await self._bus.flush()
             conversation_tracker.end_conversation(
                 conversation_id,
                 "Problem-solving chain scenario completed"
@@ -708,23 +960,63 @@ class MultiAgentScenarios:
         
         return results
     
-    def save_scenario_results(self, results: Dict[str, Any]) -> str:
-        """Save scenario results to file"""
-        # Ensure conversations directory exists
-        conversations_dir = Path("generated/conversations")
-        conversations_dir.mkdir(parents=True, exist_ok=True)
+    async def _dispatch(self, spec: ScenarioSpec) -> Dict[str, Any]:
+        """Run the scenario described by a spec"""
+        # Cached agent calls then resolve without an extra event-loop tick
+        enable_eager_tasks()
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = conversations_dir / f"scenario_{results['scenario']}_{timestamp}.json"
+        scenarios = {
+            "collaborative_research": self.scenario_collaborative_research,
+            "debate_discussion": self.scenario_debate_discussion,
+            "problem_solving_chain": self.scenario_problem_solving_chain
+        }
         
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        if spec.kind not in scenarios:
+            raise ValueError(f"Unknown scenario: {spec.kind}")
+        
+        return await scenarios[spec.kind](*spec.args)
+    
+    async def run_batch_async(self, specs: List[ScenarioSpec], *, concurrency: int = 8) -> List[Any]:
+        """
+        Run many scenarios concurrently, at most `concurrency` at a time.
+        
+        Results come back in spec order; a scenario that raised is returned
+        as its exception instead of aborting the rest of the batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _one(spec: ScenarioSpec) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._dispatch(spec)
+        
+        return await asyncio.gather(*[_one(spec) for spec in specs], return_exceptions=True)
+    
+    async def save_scenario_results(self, results: Dict[str, Any]) -> str:
+        """Save scenario results to file"""
+        filename = self._save_dir / f"scenario_{results['scenario']}_{datetime.now():%Y%m%d_%H%M%S}.json"
+        
+        # Serialize and write on a worker thread so large results don't stall the loop
+        await asyncio.to_thread(_write_results, filename, results)
         
         print(f"💾 Scenario results saved to {filename}")
         return str(filename)
 
 
-async def main():
+async def _ainput(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    line = await loop.run_in_executor(None, input, prompt)
+    return line.strip()
+
+
+async def _run_queued(specs: List[ScenarioSpec]) -> List[Any]:
+    """Submit scenarios to the task queue and wait for their results"""
+    task_ids = [await asyncio.to_thread(submit_scenario, spec.kind, list(spec.args)) for spec in specs]
+    print(f"📮 Queued {len(task_ids)} scenario(s), waiting for workers...")
+    return await asyncio.gather(*[wait_for_scenario(task_id) for task_id in task_ids], return_exceptions=True)
+
+
+async def main(local: bool = False):
     """Interactive scenario runner"""
     scenarios = MultiAgentScenarios()
     
@@ -737,48 +1029,51 @@ async def main():
     print("4. Run All Scenarios")
     print("-" * 40)
     
-    choice = input("Enter choice (1-4): ").strip()
+    choice = await _ainput("Enter choice (1-4): ")
     
     if choice == "1":
-        topic = input("Enter research topic: ").strip()
-        results = await scenarios.scenario_collaborative_research(topic)
-        scenarios.save_scenario_results(results)
+        topic = await _ainput("Enter research topic: ")
+        specs = [ScenarioSpec("collaborative_research", (topic,))]
         
     elif choice == "2":
-        topic = input("Enter debate topic: ").strip()
-        position_a = input("Enter position A: ").strip()
-        position_b = input("Enter position B: ").strip()
-        results = await scenarios.scenario_debate_discussion(topic, position_a, position_b)
-        scenarios.save_scenario_results(results)
+        topic = await _ainput("Enter debate topic: ")
+        position_a = await _ainput("Enter position A: ")
+        position_b = await _ainput("Enter position B: ")
+        specs = [ScenarioSpec("debate_discussion", (topic, position_a, position_b))]
         
     elif choice == "3":
-        problem = input("Enter problem to solve: ").strip()
-        results = await scenarios.scenario_problem_solving_chain(problem)
-        scenarios.save_scenario_results(results)
+        problem = await _ainput("Enter problem to solve: ")
+        specs = [ScenarioSpec("problem_solving_chain", (problem,))]
         
     elif choice == "4":
         print("\n🚀 Running all scenarios...\n")
         
         # Run all scenarios with example inputs
-        scenarios_to_run = [
-            ("collaborative_research", "artificial intelligence in healthcare"),
-            ("debate_discussion", "remote work vs office work", "Remote work increases productivity", "Office work promotes collaboration"),
-            ("problem_solving_chain", "How to reduce customer churn in a SaaS business")
+        specs = [
+            ScenarioSpec("collaborative_research", ("artificial intelligence in healthcare",)),
+            ScenarioSpec("debate_discussion", ("remote work vs office work", "Remote work increases productivity", "Office work promotes collaboration")),
+            ScenarioSpec("problem_solving_chain", ("How to reduce customer churn in a SaaS business",))
         ]
-        
-        for scenario_type, *args in scenarios_to_run:
-            print(f"\n{'='*60}")
-            if scenario_type == "collaborative_research":
-                results = await scenarios.scenario_collaborative_research(args[0])
-            elif scenario_type == "debate_discussion": 
-                results = await scenarios.scenario_debate_discussion(args[0], args[1], args[2])
-            elif scenario_type == "problem_solving_chain":
-                results = await scenarios.scenario_problem_solving_chain(args[0])
-            
-            scenarios.save_scenario_results(results)
     
     else:
         print("Invalid choice")
+        specs = []
+    
+    if specs:
+        if not local and queue_available() and not await asyncio.to_thread(queue_reachable):
+            print("⚠️ Task queue unreachable (is Redis running?), running scenarios locally")
+            local = True
+        
+        if local or not queue_available():
+            batch_results = await scenarios.run_batch_async(specs, concurrency=4)
+        else:
+            batch_results = await _run_queued(specs)
+        
+        for spec, results in zip(specs, batch_results):
+            if isinstance(results, BaseException):
+                print(f"❌ Scenario {spec.kind} failed: {results}")
+                continue
+            await scenarios.save_scenario_results(results)
     
     # Show session report
     print(f"\n📊 Session Report:")
@@ -786,4 +1081,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run multi-agent scenarios")
+    parser.add_argument("--local", action="store_true", help="run scenarios in this process instead of the task queue")
+    cli_args = parser.parse_args()
+    
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner() as runner:
+            runner.run(main(local=cli_args.local))
+    else:
+        asyncio.run(main(local=cli_args.local))
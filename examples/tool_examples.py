@@ -7,267 +7,286 @@ and how to integrate them with agents effectively.
 """
 
 import asyncio
-import json
+import tempfile
 from pathlib import Path
 
 # Add src to path for imports
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_root = str(Path(__file__).parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 from src.tools.web_search import web_search_tool
 from src.tools.file_operations import file_operations_tool
 from src.tools.data_tools import data_tools
 from src.config.logging import logger
+from src.utils.helpers import install_fast_event_loop, json_dumps
 
 
-async def web_search_examples():
-    """Demonstrate web search tool capabilities"""
-    print("\n🔍 Web Search Tool Examples")
-    print("=" * 50)
+class _Section:
+    """Collects one example's output and writes it in a single call"""
     
-    # Basic search
-    print("\n1. Basic Web Search:")
-    search_results = await web_search_tool.search("Pydantic AI framework", max_results=3)
+    def __init__(self, title: str):
+        self.lines = [title, "=" * 50]
     
-    for i, result in enumerate(search_results, 1):
-        print(f"  {i}. {result.title}")
-        print(f"     URL: {result.url}")
-        print(f"     Snippet: {result.snippet[:100]}...")
-        print()
+    def line(self, text: str = "") -> None:
+        self.lines.append(text)
     
-    # Academic search
-    print("2. Academic Search:")
-    academic_results = await web_search_tool.search_academic("machine learning applications", max_results=2)
+    def __enter__(self) -> "_Section":
+        return self
     
-    for i, result in enumerate(academic_results, 1):
-        print(f"  {i}. {result.title}")
-        print(f"     URL: {result.url}")
-        print(f"     Snippet: {result.snippet[:100]}...")
-        print()
-    
-    # Fetch page content (mock)
-    print("3. Fetch Page Content:")
-    if search_results:
-        content = await web_search_tool.fetch_page_content(search_results[0].url)
-        if content:
-            print(f"  Content preview: {content[:150]}...")
-        else:
-            print("  Could not fetch content")
+    def __exit__(self, *exc) -> None:
+        sys.stdout.write("\n".join(self.lines) + "\n")
 
 
-async def file_operations_examples():
-    """Demonstrate file operations tool capabilities"""
-    print("\n📁 File Operations Tool Examples")
-    print("=" * 50)
-    
-    # Create a temporary directory for examples
-    temp_dir = Path("temp_examples")
-    temp_dir.mkdir(exist_ok=True)
-    
-    try:
-        # 1. Write and read text file
-        print("1. Text File Operations:")
-        test_file = temp_dir / "test.txt"
-        content = "Hello from agent-land!\nThis is a test file for demonstrating file operations."
-        
-        success = await file_operations_tool.write_text_file(str(test_file), content)
-        print(f"  Write success: {success}")
-        
-        if success:
-            read_content = await file_operations_tool.read_text_file(str(test_file))
-            print(f"  Read content: {read_content}")
-            
-            # Get file info
-            file_info = file_operations_tool.get_file_info(str(test_file))
-            print(f"  File info: {file_info.name}, {file_info.size} bytes, exists: {file_info.exists}")
+async def web_search_examples():
+    """Demonstrate web search tool capabilities"""
+    with _Section("\n🔍 Web Search Tool Examples") as out:
         
-        # 2. JSON file operations
-        print("\n2. JSON File Operations:")
-        json_file = temp_dir / "test.json"
-        test_data = {
-            "project": "agent-land",
-            "version": "0.1.0",
-            "features": ["pydantic-ai", "type-safety", "modularity"],
-            "stats": {"agents": 3, "tools": 3, "examples": 3}
-        }
+        # Basic and academic searches are independent, so run them concurrently
+        search_results, academic_results = await asyncio.gather(
+            web_search_tool.search("Pydantic AI framework", max_results=3),
+            web_search_tool.search_academic("machine learning applications", max_results=2)
+        )
         
-        json_success = await file_operations_tool.write_json_file(str(json_file), test_data)
-        print(f"  JSON write success: {json_success}")
+        # Basic search
+        out.line("\n1. Basic Web Search:")
+        for i, result in enumerate(search_results, 1):
+            out.line(f"  {i}. {result.title}")
+            out.line(f"     URL: {result.url}")
+            out.line(f"     Snippet: {result.snippet[:100]}...")
+            out.line()
         
-        if json_success:
-            json_data = await file_operations_tool.read_json_file(str(json_file))
-            print(f"  JSON data: {json.dumps(json_data, indent=2)}")
+        # Academic search
+        out.line("2. Academic Search:")
+        for i, result in enumerate(academic_results, 1):
+            out.line(f"  {i}. {result.title}")
+            out.line(f"     URL: {result.url}")
+            out.line(f"     Snippet: {result.snippet[:100]}...")
+            out.line()
         
-        # 3. Directory listing
-        print("\n3. Directory Listing:")
-        files = await file_operations_tool.list_directory(str(temp_dir))
-        print(f"  Found {len(files)} files:")
-        for file_info in files:
-            print(f"    - {file_info.name} ({file_info.size} bytes)")
+        # Fetch page content (mock) - needs the basic search results first
+        out.line("3. Fetch Page Content:")
+        if search_results:
+            content = await web_search_tool.fetch_page_content(search_results[0].url)
+            if content:
+                out.line(f"  Content preview: {content[:150]}...")
+            else:
+                out.line("  Could not fetch content")
+
+
+async def file_operations_examples():
+    """Demonstrate file operations tool capabilities"""
+    with _Section("\n📁 File Operations Tool Examples") as out:
         
-    except Exception as e:
-        print(f"❌ File operations error: {e}")
-    
-    finally:
-        # Clean up
-        try:
-            import shutil
-            shutil.rmtree(temp_dir)
-        except Exception:
-            pass
+        # Create a temporary directory for examples; it is removed on exit
+        with tempfile.TemporaryDirectory(prefix="agent_land_") as td:
+            temp_dir = Path(td)
+            
+            try:
+                test_file = temp_dir / "test.txt"
+                content = "Hello from agent-land!\nThis is a test file for demonstrating file operations."
+                
+                json_file = temp_dir / "test.json"
+                test_data = {
+                    "project": "agent-land",
+                    "version": "0.1.0",
+                    "features": ["pydantic-ai", "type-safety", "modularity"],
+                    "stats": {"agents": 3, "tools": 3, "examples": 3}
+                }
+                
+                # The text and JSON files are independent, so write them together
+                success, json_success = await asyncio.gather(
+                    file_operations_tool.write_text_file(str(test_file), content),
+                    file_operations_tool.write_json_file(str(json_file), test_data)
+                )
+                
+                read_content, json_data = await asyncio.gather(
+                    file_operations_tool.read_text_file(str(test_file)),
+                    file_operations_tool.read_json_file(str(json_file))
+                )
+                
+                # 1. Write and read text file
+                out.line("1. Text File Operations:")
+                out.line(f"  Write success: {success}")
+                
+                if success:
+                    out.line(f"  Read content: {read_content}")
+                    
+                    # Get file info
+                    file_info = file_operations_tool.get_file_info(str(test_file))
+                    out.line(f"  File info: {file_info.name}, {file_info.size} bytes, exists: {file_info.exists}")
+                
+                # 2. JSON file operations
+                out.line("\n2. JSON File Operations:")
+                out.line(f"  JSON write success: {json_success}")
+                
+                if json_success:
+                    out.line(f"  JSON data: {json_dumps(json_data, indent=2).decode()}")
+                
+                # 3. Directory listing
+                out.line("\n3. Directory Listing:")
+                files = await file_operations_tool.list_directory(str(temp_dir))
+                out.line(f"  Found {len(files)} files:")
+                for file_info in files:
+                    out.line(f"    - {file_info.name} ({file_info.size} bytes)")
+                
+            except Exception as e:
+                out.line(f"❌ File operations error: {e}")
 
 
 async def data_tools_examples():
     """Demonstrate data tools capabilities"""
-    print("\n📊 Data Tools Examples")
-    print("=" * 50)
-    
-    # Sample data for demonstration
-    sample_data = [
-        {"id": 1, "name": "Alice", "department": "Engineering", "salary": 95000, "years": 3},
-        {"id": 2, "name": "Bob", "department": "Marketing", "salary": 78000, "years": 2},
-        {"id": 3, "name": "Charlie", "department": "Engineering", "salary": 105000, "years": 5},
-        {"id": 4, "name": "Diana", "department": "Sales", "salary": 82000, "years": 4},
-        {"id": 5, "name": "Eve", "department": "Engineering", "salary": 88000, "years": 1},
-        {"id": 6, "name": "Frank", "department": "Marketing", "salary": 92000, "years": 6}
-    ]
-    
-    try:
-        # 1. Load and summarize data
-        print("1. Data Loading and Summary:")
-        loaded_data = await data_tools.load_json_data(sample_data)
-        print(f"  Loaded {len(loaded_data)} records")
-        
-        summary = await data_tools.summarize_data(loaded_data)
-        print(f"  Summary: {summary.total_records} records, {len(summary.columns)} columns")
-        print(f"  Columns: {', '.join(summary.columns)}")
-        print(f"  Data types: {summary.data_types}")
-        print(f"  Sample data: {summary.sample_data[0]}")
-        
-        # 2. Calculate column statistics
-        print("\n2. Column Statistics:")
-        salary_stats = await data_tools.calculate_column_stats(loaded_data, "salary")
-        if salary_stats:
-            print(f"  Salary statistics:")
-            print(f"    Count: {salary_stats.count}")
-            print(f"    Mean: ${salary_stats.mean:.2f}")
-            print(f"    Median: ${salary_stats.median:.2f}")
-            print(f"    Std Dev: ${salary_stats.std:.2f}")
-            print(f"    Range: ${salary_stats.min:.2f} - ${salary_stats.max:.2f}")
-        
-        years_stats = await data_tools.calculate_column_stats(loaded_data, "years")
-        if years_stats:
-            print(f"  Years experience statistics:")
-            print(f"    Count: {years_stats.count}")
-            print(f"    Mean: {years_stats.mean:.1f} years")
-            print(f"    Range: {years_stats.min} - {years_stats.max} years")
-        
-        # 3. Filter data
-        print("\n3. Data Filtering:")
-        engineering_filter = {"department": "Engineering"}
-        engineering_data = await data_tools.filter_data(loaded_data, engineering_filter)
-        print(f"  Engineering department: {len(engineering_data)} employees")
-        for emp in engineering_data:
-            print(f"    - {emp['name']}: ${emp['salary']}")
-        
-        # 4. Group data
-        print("\n4. Data Grouping:")
-        groups = await data_tools.group_data(loaded_data, "department")
-        print(f"  Grouped by department: {len(groups)} groups")
-        for dept, employees in groups.items():
-            print(f"    {dept}: {len(employees)} employees")
+    with _Section("\n📊 Data Tools Examples") as out:
         
-        # 5. Aggregate data
-        print("\n5. Data Aggregation:")
-        avg_salary_by_dept = await data_tools.aggregate_data(loaded_data, "department", "salary", "mean")
-        print(f"  Average salary by department:")
-        for dept, avg_salary in avg_salary_by_dept.items():
-            print(f"    {dept}: ${avg_salary:.2f}")
+        # Sample data for demonstration
+        sample_data = [
+            {"id": 1, "name": "Alice", "department": "Engineering", "salary": 95000, "years": 3},
+            {"id": 2, "name": "Bob", "department": "Marketing", "salary": 78000, "years": 2},
+            {"id": 3, "name": "Charlie", "department": "Engineering", "salary": 105000, "years": 5},
+            {"id": 4, "name": "Diana", "department": "Sales", "salary": 82000, "years": 4},
+            {"id": 5, "name": "Eve", "department": "Engineering", "salary": 88000, "years": 1},
+            {"id": 6, "name": "Frank", "department": "Marketing", "salary": 92000, "years": 6}
+        ]
         
-        total_years_by_dept = await data_tools.aggregate_data(loaded_data, "department", "years", "sum")
-        print(f"  Total years experience by department:")
-        for dept, total_years in total_years_by_dept.items():
-            print(f"    {dept}: {total_years} years")
-        
-    except Exception as e:
-        print(f"❌ Data tools error: {e}")
+        try:
+            # 1. Load and summarize data
+            out.line("1. Data Loading and Summary:")
+            # Load once into a handle; every tool below reuses its columns and codes
+            handle = await data_tools.load_handle(sample_data)
+            loaded_data = handle.rows
+            out.line(f"  Loaded {len(loaded_data)} records")
+            
+            summary = await data_tools.summarize_data(loaded_data)
+            out.line(f"  Summary: {summary.total_records} records, {len(summary.columns)} columns")
+            out.line(f"  Columns: {', '.join(summary.columns)}")
+            out.line(f"  Data types: {summary.data_types}")
+            out.line(f"  Sample data: {summary.sample_data[0]}")
+            
+            # None of these modify the data, so compute them all at once
+            engineering_filter = {"department": "Engineering"}
+            (
+                salary_stats,
+                years_stats,
+                engineering_data,
+                groups,
+                avg_salary_by_dept,
+                total_years_by_dept
+            ) = await asyncio.gather(
+                data_tools.calculate_column_stats(handle, "salary"),
+                data_tools.calculate_column_stats(handle, "years"),
+                data_tools.filter_data(handle, engineering_filter),
+                data_tools.group_data(handle, "department"),
+                data_tools.aggregate_data(handle, "department", "salary", "mean"),
+                data_tools.aggregate_data(handle, "department", "years", "sum")
+            )
+            
+            # 2. Calculate column statistics
+            out.line("\n2. Column Statistics:")
+            if salary_stats:
+                out.line(f"  Salary statistics:")
+                out.line(f"    Count: {salary_stats.count}")
+                out.line(f"    Mean: ${salary_stats.mean:.2f}")
+                out.line(f"    Median: ${salary_stats.median:.2f}")
+                out.line(f"    Std Dev: ${salary_stats.std:.2f}")
+                out.line(f"    Range: ${salary_stats.min:.2f} - ${salary_stats.max:.2f}")
+            
+            if years_stats:
+                out.line(f"  Years experience statistics:")
+                out.line(f"    Count: {years_stats.count}")
+                out.line(f"    Mean: {years_stats.mean:.1f} years")
+                out.line(f"    Range: {years_stats.min} - {years_stats.max} years")
+            
+            # 3. Filter data
+            out.line("\n3. Data Filtering:")
+            out.line(f"  Engineering department: {len(engineering_data)} employees")
+            for emp in engineering_data:
+                out.line(f"    - {emp['name']}: ${emp['salary']}")
+            
+            # 4. Group data
+            out.line("\n4. Data Grouping:")
+            out.line(f"  Grouped by department: {len(groups)} groups")
+            for dept, employees in groups.items():
+                out.line(f"    {dept}: {len(employees)} employees")
+            
+            # 5. Aggregate data
+            out.line("\n5. Data Aggregation:")
+            out.line(f"  Average salary by department:")
+            for dept, avg_salary in avg_salary_by_dept.items():
+                out.line(f"    {dept}: ${avg_salary:.2f}")
+            
+            out.line(f"  Total years experience by department:")
+            for dept, total_years in total_years_by_dept.items():
+                out.line(f"    {dept}: {total_years} years")
+            
+        except Exception as e:
+            out.line(f"❌ Data tools error: {e}")
 
 
 async def integrated_tool_workflow():
     """Demonstrate using multiple tools together in a workflow"""
-    print("\n🔧 Integrated Tool Workflow")
-    print("=" * 50)
-    
-    try:
-        # Step 1: Create sample data
-        workflow_data = {
-            "analysis": {
-                "topic": "Employee Performance Analysis",
-                "date": "2024-01-15",
-                "findings": [
-                    "Engineering department has highest average salary",
-                    "Sales team shows strong performance metrics",
-                    "Marketing ROI exceeded expectations"
-                ]
-            },
-            "recommendations": [
-                "Increase engineering team budget",
-                "Expand sales territories",
-                "Invest more in digital marketing"
-            ]
-        }
-        
-        # Step 2: Save analysis to file
-        temp_dir = Path("temp_workflow")
-        temp_dir.mkdir(exist_ok=True)
+    with _Section("\n🔧 Integrated Tool Workflow") as out:
         
-        analysis_file = temp_dir / "analysis_results.json"
-        write_success = await file_operations_tool.write_json_file(str(analysis_file), workflow_data)
-        print(f"✅ Saved analysis to file: {write_success}")
-        
-        # Step 3: Load and process the data
-        if write_success:
-            loaded_data = await file_operations_tool.read_json_file(str(analysis_file))
-            print(f"✅ Loaded analysis data: {loaded_data['analysis']['topic']}")
-            
-            # Step 4: Generate a summary report
-            summary_content = f"""
-# Analysis Report: {loaded_data['analysis']['topic']}
-
-**Date:** {loaded_data['analysis']['date']}
-
-## Key Findings:
-"""
-            for finding in loaded_data['analysis']['findings']:
-                summary_content += f"- {finding}\n"
-            
-            summary_content += "\n## Recommendations:\n"
-            for rec in loaded_data['recommendations']:
-                summary_content += f"- {rec}\n"
+        with tempfile.TemporaryDirectory(prefix="agent_land_") as td:
+            temp_dir = Path(td)
             
-            # Step 5: Save summary report
-            report_file = temp_dir / "summary_report.md"
-            report_success = await file_operations_tool.write_text_file(str(report_file), summary_content)
-            print(f"✅ Generated summary report: {report_success}")
-            
-            # Step 6: List all generated files
-            files = await file_operations_tool.list_directory(str(temp_dir))
-            print(f"✅ Workflow generated {len(files)} files:")
-            for file_info in files:
-                print(f"  - {file_info.name} ({file_info.size} bytes)")
-        
-        print("\n🎉 Integrated workflow completed successfully!")
-        
-    except Exception as e:
-        print(f"❌ Integrated workflow error: {e}")
-    
-    finally:
-        # Clean up
-        try:
-            import shutil
-            shutil.rmtree(temp_dir)
-        except Exception:
-            pass
+            try:
+                # Step 1: Create sample data
+                workflow_data = {
+                    "analysis": {
+                        "topic": "Employee Performance Analysis",
+                        "date": "2024-01-15",
+                        "findings": [
+                            "Engineering department has highest average salary",
+                            "Sales team shows strong performance metrics",
+                            "Marketing ROI exceeded expectations"
+                        ]
+                    },
+                    "recommendations": [
+                        "Increase engineering team budget",
+                        "Expand sales territories",
+                        "Invest more in digital marketing"
+                    ]
+                }
+                
+                # Step 2: Generate a summary report
+                parts = [
+                    "",
+                    f"# Analysis Report: {workflow_data['analysis']['topic']}",
+                    "",
+                    f"**Date:** {workflow_data['analysis']['date']}",
+                    "",
+                    "## Key Findings:",
+                ]
+                parts.extend(f"- {finding}" for finding in workflow_data['analysis']['findings'])
+                parts.append("\n## Recommendations:")
+                parts.extend(f"- {rec}" for rec in workflow_data['recommendations'])
+                summary_content = "\n".join(parts) + "\n"
+                
+                # Step 3: Save the analysis and the report together
+                analysis_file = temp_dir / "analysis_results.json"
+                report_file = temp_dir / "summary_report.md"
+                write_success, report_success = await asyncio.gather(
+                    file_operations_tool.write_json_bytes(str(analysis_file), workflow_data),
+                    file_operations_tool.write_text_file(str(report_file), summary_content)
+                )
+                out.line(f"✅ Saved analysis to file: {write_success}")
+                out.line(f"✅ Generated summary report: {report_success}")
+                
+                # Step 4: List all generated files. The file is only for persistence;
+                # the data is already in memory, so it isn't read back.
+                if write_success:
+                    out.line(f"✅ Analysis data: {workflow_data['analysis']['topic']}")
+                    
+                    files = await file_operations_tool.list_directory(str(temp_dir))
+                    out.line(f"✅ Workflow generated {len(files)} files:")
+                    for file_info in files:
+                        out.line(f"  - {file_info.name} ({file_info.size} bytes)")
+                
+                out.line("\n🎉 Integrated workflow completed successfully!")
+                
+            except Exception as e:
+                out.line(f"❌ Integrated workflow error: {e}")
 
 
 async def main():
@@ -286,7 +305,12 @@ async def main():
     except Exception as e:
         logger.error(f"Error running tool examples: {e}")
         print(f"\n❌ Error running tool examples: {e}")
+    
+    finally:
+        await web_search_tool.close()
+        await file_operations_tool.close()
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
     asyncio.run(main())
\ No newline at end of file
@@ -7,24 +7,154 @@ Perfect for developing and debugging custom agents.
 """
 
 import asyncio
-import json
+import atexit
+import importlib
 import sys
 import time
+from collections import OrderedDict, deque
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Deque, Iterator, List, Optional, Tuple
+
+try:
+    # Gives input() line editing and arrow-key history
+    import readline
+except ImportError:
+    readline = None
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.agents.examples.simple_chat import simple_chat_agent
-from src.agents.examples.research_agent import research_agent  
-from src.agents.examples.data_analyst import data_analyst_agent
 from src.core.dependencies import ChatDependencies, ResearchDependencies, DataDependencies
+from src.core.models import AnalysisResult, ChatResponse, ResearchResult
 from src.config.logging import logger
-from src.utils.helpers import generate_conversation_id, generate_session_id
+from src.utils.helpers import generate_conversation_id, generate_session_id, install_fast_event_loop, json_dumps
 from src.utils.agent_builder import agent_builder
 
+# Most (agent, message) responses kept for repeated questions
+RESPONSE_CACHE_SIZE = 128
+# Messages kept in the session log; older ones are dropped
+MAX_HISTORY = 10_000
+# Committed messages sent to the chat agent each turn
+HISTORY_WINDOW = 10
+# Session logs and exports
+CONVERSATIONS_DIR = Path("generated/conversations")
+# Typed input recalled across sessions when readline is available
+INPUT_HISTORY_FILE = Path("generated/.playground_history")
+
+
+def _prompt(text: str) -> Optional[str]:
+    """Read one line of input, or None at end of input"""
+    if sys.stdin.isatty():
+        # Interactive: go through input() so readline editing applies
+        try:
+            return input(text)
+        except EOFError:
+            return None
+    
+    # Piped: skip input()'s terminal handling and read the line directly
+    sys.stdout.write(text)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    return line.rstrip("\n") if line else None
+
+
+def _format_chat(response: Any) -> str:
+    return response.message
+
+
+def _format_analysis(response: Any) -> str:
+    response_text = f"Analysis: {response.analysis}"
+    if getattr(response, 'insights', None):
+        response_text += f"\n\nInsights:\n" + "\n".join(f"• {insight}" for insight in response.insights)
+    if getattr(response, 'recommendations', None):
+        response_text += f"\n\nRecommendations:\n" + "\n".join(f"• {rec}" for rec in response.recommendations)
+    return response_text
+
+
+def _format_research(response: Any) -> str:
+    response_text = f"Research Results:\n"
+    for i, finding in enumerate(response.findings, 1):
+        response_text += f"{i}. {finding}\n"
+    if getattr(response, 'confidence', None):
+        response_text += f"\nConfidence: {response.confidence:.2%}"
+    return response_text
+
+
+# Response text formatting by output type, for the built-in agents
+_RESPONSE_FORMATTERS = {
+    ChatResponse: _format_chat,
+    AnalysisResult: _format_analysis,
+    ResearchResult: _format_research,
+}
+
+
+def _format_response(response: Any) -> str:
+    """Text to show for an agent response"""
+    formatter = _RESPONSE_FORMATTERS.get(type(response))
+    if formatter is not None:
+        return formatter(response)
+    
+    # Custom agents' output types are matched by shape
+    if hasattr(response, 'message'):
+        return _format_chat(response)
+    if hasattr(response, 'analysis'):
+        return _format_analysis(response)
+    if hasattr(response, 'findings'):
+        return _format_research(response)
+    return str(response)
+
+
+class ConversationLog:
+    """Logged messages stored column-wise, so scans over one field skip per-message dict lookups"""
+    
+    __slots__ = ("timestamps", "roles", "contents", "agents", "metadatas", "execution_times")
+    
+    def __init__(self, maxlen: int = MAX_HISTORY):
+        # Bounded columns: appends drop the oldest message once full
+        self.timestamps: Deque[str] = deque(maxlen=maxlen)
+        self.roles: Deque[str] = deque(maxlen=maxlen)
+        self.contents: Deque[str] = deque(maxlen=maxlen)
+        self.agents: Deque[str] = deque(maxlen=maxlen)
+        self.metadatas: Deque[Dict[str, Any]] = deque(maxlen=maxlen)
+        self.execution_times: Deque[float] = deque(maxlen=maxlen)
+    
+    def __len__(self) -> int:
+        return len(self.roles)
+    
+    def append(self, message: Dict[str, Any]) -> None:
+        self.timestamps.append(message["timestamp"])
+        self.roles.append(message["role"])
+        self.contents.append(message["content"])
+        self.agents.append(message["agent"])
+        self.metadatas.append(message["metadata"])
+        self.execution_times.append(message["metadata"].get("execution_time", 0.0))
+    
+    def clear(self) -> None:
+        for column in self.__slots__:
+            getattr(self, column).clear()
+    
+    def rows(self, start: int = 0) -> Iterator[Dict[str, Any]]:
+        """Rebuild message dicts from the given index on"""
+        columns = (self.timestamps, self.roles, self.contents, self.agents, self.metadatas)
+        for timestamp, role, content, agent, metadata in zip(*(islice(column, start, None) for column in columns)):
+            yield {
+                "timestamp": timestamp,
+                "role": role,
+                "content": content,
+                "agent": agent,
+                "metadata": metadata
+            }
+    
+    def response_times(self, agent: str) -> Tuple[int, float]:
+        """Number of responses from an agent and their mean execution time"""
+        times = [
+            t for role, name, t in zip(self.roles, self.agents, self.execution_times)
+            if role == "assistant" and name == agent
+        ]
+        return len(times), (sum(times) / len(times) if times else 0.0)
+
 
 class AgentPlayground:
     """Interactive playground for testing agents"""
@@ -32,34 +162,52 @@ class AgentPlayground:
     def __init__(self):
         self.session_id = generate_session_id()
         self.conversation_id = generate_conversation_id()
-        self.conversation_history = []
+        self.conversation_history = ConversationLog()
         self.current_agent = "chat"
         
-        # Available agents (built-in)
+        # Latest completed user/assistant exchanges; only finished turns enter, so it changes once per turn
+        self._committed_history: Deque[Dict[str, Any]] = deque(maxlen=HISTORY_WINDOW)
+        
+        # Exact-match responses keyed by (agent, message), least recently used first
+        self.cache_enabled = True
+        self._response_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        
+        # Available agents (built-in ones are imported on first use)
         self.agents = {
-            "chat": {
-                "agent": simple_chat_agent,
-                "deps_class": ChatDependencies,
-                "description": "Simple conversational AI with context management",
-                "type": "built-in"
-            },
-            "research": {
-                "agent": research_agent,
-                "deps_class": ResearchDependencies,
-                "description": "Information gathering and research agent",
-                "type": "built-in"
-            },
-            "analyst": {
-                "agent": data_analyst_agent,
-                "deps_class": DataDependencies,
-                "description": "Data analysis and business insights agent",
-                "type": "built-in"
-            }
+            "chat": self._built_in_entry(
+                "src.agents.examples.simple_chat",
+                "simple_chat_agent",
+                ChatDependencies,
+                "Simple conversational AI with context management"
+            ),
+            "research": self._built_in_entry(
+                "src.agents.examples.research_agent",
+                "research_agent",
+                ResearchDependencies,
+                "Information gathering and research agent"
+            ),
+            "analyst": self._built_in_entry(
+                "src.agents.examples.data_analyst",
+                "data_analyst_agent",
+                DataDependencies,
+                "Data analysis and business insights agent"
+            )
         }
         
         # Load any previously created agents
         self._load_created_agents()
         
+        self.observe_mode = False
+        self._commands = self._build_commands()
+        
+        # Every logged message is appended here as it happens, so a crash loses nothing
+        CONVERSATIONS_DIR.mkdir(parents=True, exist_ok=True)
+        self._log_path = CONVERSATIONS_DIR / f"conversation_{self.session_id}.jsonl"
+        self._log_file = open(self._log_path, "ab", buffering=8192)
+        self._log_start = self._log_file.tell()
+        self._logged_count = 0
+        atexit.register(self._log_file.close)
+        
         print(f"🚀 Agent Playground Started")
         print(f"Session ID: {self.session_id}")
         print(f"Conversation ID: {self.conversation_id}")
@@ -77,6 +225,7 @@ class AgentPlayground:
         print("  /observe or /obs     - Toggle detailed observation mode")
         print("  /profile             - Show agent performance profile")
         print("  /export              - Export conversation to JSON")
+        print("  /cache [clear]       - Toggle the response cache, or clear it")
         print("")
         print("🎨 Agent Creation:")
         print("  /create              - Create a new agent interactively")
@@ -130,7 +279,8 @@ class AgentPlayground:
             print("   No messages yet.")
             return
             
-        for i, msg in enumerate(self.conversation_history[-10:], 1):  # Show last 10
+        start = max(len(self.conversation_history) - 10, 0)
+        for i, msg in enumerate(self.conversation_history.rows(start), 1):  # Show last 10
             timestamp = msg.get('timestamp', 'Unknown')
             role = msg.get('role', 'unknown')
             content = msg.get('content', '')[:100] + "..." if len(msg.get('content', '')) > 100 else msg.get('content', '')
@@ -146,12 +296,18 @@ class AgentPlayground:
         """Clear conversation history"""
         count = len(self.conversation_history)
         self.conversation_history.clear()
+        
+        # Exports start after this point of the session log
+        self._log_file.flush()
+        self._log_start = self._log_file.tell()
+        self._logged_count = 0
+        self._committed_history.clear()
         print(f"🗑️  Cleared {count} messages from history")
     
     def show_agent_info(self):
         """Show current agent information"""
-        agent_config = self.agents[self.current_agent]
-        agent_info = agent_config["agent"].get_info()
+        agent_config = self._agent_config(self.current_agent)
+        agent_info = agent_config["info"]
         
         print(f"\n🤖 Current Agent: {self.current_agent}")
         print(f"   Name: {agent_info['name']}")
@@ -163,26 +319,69 @@ class AgentPlayground:
     
     def export_conversation(self):
         """Export conversation to JSON file"""
-        # Ensure conversations directory exists
-        conversations_dir = Path("generated/conversations")
-        conversations_dir.mkdir(parents=True, exist_ok=True)
-        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = conversations_dir / f"conversation_{timestamp}.json"
+        filename = CONVERSATIONS_DIR / f"conversation_{timestamp}.json"
         
-        export_data = {
+        header = {
             "session_id": self.session_id,
             "conversation_id": self.conversation_id,
             "timestamp": datetime.now().isoformat(),
-            "message_count": len(self.conversation_history),
-            "messages": self.conversation_history
+            "message_count": self._logged_count
         }
         
-        with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+        # Messages are already serialized in the session log; copy them across line by line
+        self._log_file.flush()
+        with open(filename, 'wb') as f, open(self._log_path, 'rb') as log:
+            f.write(b"{\n")
+            for key, value in header.items():
+                f.write(b'  "%s": %s,\n' % (key.encode(), json_dumps(value)))
+            f.write(b'  "messages": [')
+            log.seek(self._log_start)
+            for i, line in enumerate(log):
+                f.write(b",\n    " if i else b"\n    ")
+                f.write(line.rstrip(b"\n"))
+            f.write(b"\n  ]\n}\n" if self._logged_count else b"]\n}\n")
         
         print(f"💾 Exported conversation to {filename}")
     
+    @staticmethod
+    def _agent_entry(agent: Any, deps_class: Any, description: str, agent_type: str) -> Dict[str, Any]:
+        """Registry entry for an agent; its info is looked up once here and reused"""
+        return {
+            "agent": agent,
+            "deps_class": deps_class,
+            "description": description,
+            "type": agent_type,
+            "info": agent.get_info()
+        }
+    
+    @staticmethod
+    def _built_in_entry(module: str, attr: str, deps_class: Any, description: str) -> Dict[str, Any]:
+        """Registry entry for a built-in agent, which is imported and built on first use"""
+        return {
+            "loader": lambda: getattr(importlib.import_module(module), attr),
+            "deps_class": deps_class,
+            "description": description,
+            "type": "built-in"
+        }
+    
+    def _agent_config(self, agent_name: str) -> Dict[str, Any]:
+        """Registry entry for an agent, loading the agent if this is its first use"""
+        agent_config = self.agents[agent_name]
+        if "agent" not in agent_config:
+            agent_config["agent"] = agent_config["loader"]()
+            agent_config["info"] = agent_config["agent"].get_info()
+        return agent_config
+    
+    def _custom_agent_entry(self, agent: Any) -> Dict[str, Any]:
+        """Registry entry for an agent made with the agent builder"""
+        return self._agent_entry(
+            agent,
+            agent.deps_type,
+            f"Custom agent: {agent.instructions[:50]}...",
+            "custom"
+        )
+    
     def _load_created_agents(self):
         """Load previously created agents"""
         try:
@@ -195,12 +394,7 @@ class AgentPlayground:
                     
                     if loaded_agent:
                         # Add to available agents
-                        self.agents[agent_name] = {
-                            "agent": loaded_agent,
-                            "deps_class": loaded_agent.deps_type,
-                            "description": f"Custom agent: {loaded_agent.instructions[:50]}...",
-                            "type": "custom"
-                        }
+                        self.agents[agent_name] = self._custom_agent_entry(loaded_agent)
         except Exception as e:
             logger.error(f"Error loading created agents: {e}")
     
@@ -211,12 +405,7 @@ class AgentPlayground:
             
             if agent:
                 # Add to available agents
-                self.agents[agent.name] = {
-                    "agent": agent,
-                    "deps_class": agent.deps_type,
-                    "description": f"Custom agent: {agent.instructions[:50]}...",
-                    "type": "custom"
-                }
+                self.agents[agent.name] = self._custom_agent_entry(agent)
                 
                 # Ask if user wants to switch to the new agent
                 switch = input(f"\n🔄 Switch to the new agent '{agent.name}'? (y/n): ").strip().lower()
@@ -240,12 +429,7 @@ class AgentPlayground:
         loaded_agent = agent_builder.load_agent(agent_name)
         
         if loaded_agent:
-            self.agents[agent_name] = {
-                "agent": loaded_agent,
-                "deps_class": loaded_agent.deps_type,
-                "description": f"Custom agent: {loaded_agent.instructions[:50]}...",
-                "type": "custom"
-            }
+            self.agents[agent_name] = self._custom_agent_entry(loaded_agent)
             print(f"✅ Loaded agent '{agent_name}'")
             
             # Ask if user wants to switch to the loaded agent
@@ -276,6 +460,10 @@ class AgentPlayground:
             print(f"🔄 Switching away from '{agent_name}' to 'chat'")
             self.current_agent = "chat"
         
+        # Drop its cached responses so a new agent with this name starts fresh
+        for cache_key in [key for key in self._response_cache if key[0] == agent_name]:
+            del self._response_cache[cache_key]
+
         # Delete from playground and builder
         del self.agents[agent_name]
         agent_builder.delete_agent(agent_name)
@@ -305,7 +493,7 @@ class AgentPlayground:
         else:
             print(f"❌ Agent '{agent_name}' not found")
     
-    def log_interaction(self, role: str, content: str, agent: str = None, metadata: Dict[str, Any] = None):
+    def log_interaction(self, role: str, content: str, agent: str = None, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
         """Log an interaction to conversation history"""
         message = {
             "timestamp": datetime.now().isoformat(),
@@ -315,16 +503,43 @@ class AgentPlayground:
             "metadata": metadata or {}
         }
         self.conversation_history.append(message)
+        self._log_file.write(json_dumps(message, default=str) + b"\n")
+        self._logged_count += 1
+        return message
     
     async def send_message(self, message: str, observe_mode: bool = False):
         """Send message to current agent"""
         start_time = time.time()
         
         # Log user message
-        self.log_interaction("user", message)
+        user_message = self.log_interaction("user", message)
+        
+        # Repeated questions to the same agent are answered from the cache
+        cache_key = (self.current_agent, message.strip())
+        if self.cache_enabled and cache_key in self._response_cache:
+            self._response_cache.move_to_end(cache_key)
+            response_text, response_type = self._response_cache[cache_key]
+            
+            assistant_message = self.log_interaction(
+                "assistant",
+                response_text,
+                self.current_agent,
+                {
+                    "execution_time": time.time() - start_time,
+                    "response_type": response_type,
+                    "cache_hit": True
+                }
+            )
+            self._committed_history.extend((user_message, assistant_message))
+            
+            if observe_mode:
+                print(f"🔍 [OBSERVE] Cache hit, skipped the {self.current_agent} agent call")
+            
+            print(f"\n🤖 {self.current_agent}: {response_text}")
+            return
         
         # Get current agent configuration
-        agent_config = self.agents[self.current_agent]
+        agent_config = self._agent_config(self.current_agent)
         agent = agent_config["agent"]
         deps_class = agent_config["deps_class"]
         
@@ -333,7 +548,8 @@ class AgentPlayground:
             deps = ChatDependencies(
                 user_id="playground_user",
                 session_id=self.session_id,
-                conversation_history=self.conversation_history[-10:],  # Last 10 messages
+                conversation_history=self._committed_history,  # Last 10 committed messages
+                recent=user_message,
                 context={"conversation_id": self.conversation_id}
             )
         elif deps_class == ResearchDependencies:
@@ -365,25 +581,10 @@ class AgentPlayground:
             execution_time = time.time() - start_time
             
             # Extract response content based on agent type
-            if hasattr(response, 'message'):
-                response_text = response.message
-            elif hasattr(response, 'analysis'):
-                response_text = f"Analysis: {response.analysis}"
-                if hasattr(response, 'insights') and response.insights:
-                    response_text += f"\n\nInsights:\n" + "\n".join(f"• {insight}" for insight in response.insights)
-                if hasattr(response, 'recommendations') and response.recommendations:
-                    response_text += f"\n\nRecommendations:\n" + "\n".join(f"• {rec}" for rec in response.recommendations)
-            elif hasattr(response, 'findings'):
-                response_text = f"Research Results:\n"
-                for i, finding in enumerate(response.findings, 1):
-                    response_text += f"{i}. {finding}\n"
-                if hasattr(response, 'confidence') and response.confidence:
-                    response_text += f"\nConfidence: {response.confidence:.2%}"
-            else:
-                response_text = str(response)
+            response_text = _format_response(response)
             
             # Log agent response
-            self.log_interaction(
+            assistant_message = self.log_interaction(
                 "assistant", 
                 response_text, 
                 self.current_agent,
@@ -393,6 +594,13 @@ class AgentPlayground:
                 }
             )
             
+            # Commit the exchange only once it has succeeded
+            self._committed_history.extend((user_message, assistant_message))
+            
+            self._response_cache[cache_key] = (response_text, type(response).__name__)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+            
             if observe_mode:
                 print(f"🔍 [OBSERVE] Response received in {execution_time:.2f}s")
                 print(f"🔍 [OBSERVE] Response type: {type(response).__name__}")
@@ -405,10 +613,106 @@ class AgentPlayground:
             self.log_interaction("system", error_msg, self.current_agent, {"error": True})
             print(f"❌ {error_msg}")
     
+    def _build_commands(self) -> Dict[str, Callable[..., Optional[bool]]]:
+        """Map each command to its handler; a handler returning True ends the session"""
+        def plain(handler: Callable[[], Any]) -> Callable[..., None]:
+            def run_plain(*args: str) -> None:
+                handler()
+            return run_plain
+        
+        def needs_name(handler: Callable[[str], None], usage: str) -> Callable[..., None]:
+            def run_with_name(*args: str) -> None:
+                if args:
+                    handler(args[0])
+                else:
+                    print(f"Usage: {usage}")
+            return run_with_name
+        
+        commands = {
+            '/help': plain(self.print_help),
+            '/agents': plain(self.list_agents),
+            '/switch': needs_name(self.switch_agent, "/switch <agent_name>"),
+            '/history': plain(self.show_history),
+            '/clear': plain(self.clear_history),
+            '/info': plain(self.show_agent_info),
+            '/observe': plain(self.toggle_observe_mode),
+            '/profile': plain(self.show_profile),
+            '/export': plain(self.export_conversation),
+            '/cache': self.cache_command,
+            '/create': plain(self.create_agent_interactive),
+            '/templates': plain(self.show_agent_templates),
+            '/created': plain(self.show_created_agents),
+            '/load': needs_name(self.load_agent_by_name, "/load <agent_name>"),
+            '/delete': needs_name(self.delete_agent_by_name, "/delete <agent_name>"),
+            '/agent-info': needs_name(self.show_agent_detailed_info, "/agent-info <agent_name>"),
+            '/quit': lambda *args: self.quit(),
+        }
+        
+        aliases = {'/h': '/help', '/a': '/agents', '/hist': '/history', '/obs': '/observe', '/q': '/quit'}
+        for alias, command in aliases.items():
+            commands[alias] = commands[command]
+        
+        return commands
+    
+    def toggle_observe_mode(self):
+        """Toggle detailed observation of agent calls"""
+        self.observe_mode = not self.observe_mode
+        print(f"🔍 Observation mode: {'ON' if self.observe_mode else 'OFF'}")
+    
+    def show_profile(self):
+        """Show the current agent's response count and average response time"""
+        print("📊 Agent Performance Profile:")
+        message_count, avg_time = self.conversation_history.response_times(self.current_agent)
+        if message_count:
+            print(f"   Messages: {message_count}")
+            print(f"   Avg Response Time: {avg_time:.2f}s")
+        else:
+            print("   No messages from current agent yet.")
+    
+    def cache_command(self, *args: str):
+        """Toggle the response cache, or clear it with 'clear'"""
+        if args and args[0] == 'clear':
+            count = len(self._response_cache)
+            self._response_cache.clear()
+            print(f"🗑️  Cleared {count} cached responses")
+        else:
+            self.cache_enabled = not self.cache_enabled
+            print(f"💾 Response cache: {'ON' if self.cache_enabled else 'OFF'}")
+    
+    def quit(self) -> bool:
+        """End the session"""
+        print("👋 Goodbye!")
+        return True
+    
+    def _load_input_history(self):
+        """Restore typed input from earlier sessions"""
+        if readline is None or not sys.stdin.isatty():
+            return
+        readline.set_history_length(1000)
+        try:
+            readline.read_history_file(INPUT_HISTORY_FILE)
+        except OSError:
+            pass
+    
+    def _save_input_history(self):
+        """Keep typed input for the next session"""
+        if readline is None or not sys.stdin.isatty():
+            return
+        try:
+            INPUT_HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            readline.write_history_file(INPUT_HISTORY_FILE)
+        except OSError as e:
+            logger.error(f"Could not save input history: {e}")
+    
     async def run(self):
         """Main playground loop"""
-        observe_mode = False
-        
+        self._load_input_history()
+        try:
+            await self._loop()
+        finally:
+            self._save_input_history()
+    
+    async def _loop(self):
         print("🎮 Agent Playground Ready!")
         print("Type /help for commands, or start chatting with your agents.")
         print("=" * 60)
@@ -417,76 +721,34 @@ class AgentPlayground:
             try:
                 # Show current agent and prompt
                 prompt = f"\n[{self.current_agent}] > "
-                user_input = input(prompt).strip()
+                line = _prompt(prompt)
+                if line is None:
+                    print("\n👋 Goodbye!")
+                    break
+                user_input = line.strip()
                 
                 if not user_input:
                     continue
                 
                 # Handle commands
                 if user_input.startswith('/'):
-                    parts = user_input.split()
-                    command = parts[0].lower()
+                    # Most commands take no argument, so try the whole line before splitting it
+                    command, args = user_input.lower(), []
+                    handler = self._commands.get(command)
+                    if handler is None:
+                        command, *args = user_input.split(maxsplit=1)
+                        command = command.lower()
+                        handler = self._commands.get(command)
                     
-                    if command in ['/help', '/h']:
-                        self.print_help()
-                    elif command in ['/agents', '/a']:
-                        self.list_agents()
-                    elif command == '/switch':
-                        if len(parts) > 1:
-                            self.switch_agent(parts[1])
-                        else:
-                            print("Usage: /switch <agent_name>")
-                    elif command in ['/history', '/hist']:
-                        self.show_history()
-                    elif command == '/clear':
-                        self.clear_history()
-                    elif command == '/info':
-                        self.show_agent_info()
-                    elif command in ['/observe', '/obs']:
-                        observe_mode = not observe_mode
-                        print(f"🔍 Observation mode: {'ON' if observe_mode else 'OFF'}")
-                    elif command == '/profile':
-                        print("📊 Agent Performance Profile:")
-                        agent_messages = [msg for msg in self.conversation_history if msg.get('role') == 'assistant' and msg.get('agent') == self.current_agent]
-                        if agent_messages:
-                            avg_time = sum(msg.get('metadata', {}).get('execution_time', 0) for msg in agent_messages) / len(agent_messages)
-                            print(f"   Messages: {len(agent_messages)}")
-                            print(f"   Avg Response Time: {avg_time:.2f}s")
-                        else:
-                            print("   No messages from current agent yet.")
-                    elif command == '/export':
-                        self.export_conversation()
-                    elif command == '/create':
-                        self.create_agent_interactive()
-                    elif command == '/templates':
-                        self.show_agent_templates()
-                    elif command == '/created':
-                        self.show_created_agents()
-                    elif command == '/load':
-                        if len(parts) > 1:
-                            self.load_agent_by_name(parts[1])
-                        else:
-                            print("Usage: /load <agent_name>")
-                    elif command == '/delete':
-                        if len(parts) > 1:
-                            self.delete_agent_by_name(parts[1])
-                        else:
-                            print("Usage: /delete <agent_name>")
-                    elif command == '/agent-info':
-                        if len(parts) > 1:
-                            self.show_agent_detailed_info(parts[1])
-                        else:
-                            print("Usage: /agent-info <agent_name>")
-                    elif command in ['/quit', '/q']:
-                        print("👋 Goodbye!")
-                        break
-                    else:
+                    if handler is None:
                         print(f"Unknown command: {command}")
                         print("Type /help for available commands.")
+                    elif handler(*args):
+                        break
                 
                 else:
                     # Send message to agent
-                    await self.send_message(user_input, observe_mode)
+                    await self.send_message(user_input, self.observe_mode)
                     
             except KeyboardInterrupt:
                 print("\n\n👋 Goodbye!")
@@ -495,7 +757,6 @@ class AgentPlayground:
                 print(f"❌ Unexpected error: {e}")
                 logger.error(f"Playground error: {e}")
 
-
 async def main():
     """Run the agent playground"""
     playground = AgentPlayground()
@@ -503,4 +764,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
     asyncio.run(main())
\ No newline at end of file
@@ -1,31 +1,78 @@
-import json
-from typing import Any, Dict, List, Optional
+import asyncio
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic_ai import RunContext
 
 from ...core.base_agent import BaseAgent
 from ...core.dependencies import DataDependencies
 from ...core.models import AnalysisResult
+from ...tools.data_tools import DataHandle, data_tools
+from ...tools.file_operations import file_operations_tool
+from ...utils.helpers import json_dumps
+
+# Data files kept loaded at once, least recently used dropped first
+HANDLE_CACHE_SIZE = 8
 
 
 class DataAnalystAgent(BaseAgent[DataDependencies, AnalysisResult]):
+    INSTRUCTIONS = """
+    You are a data analyst AI assistant. You help users analyze data, identify patterns,
+    generate insights, and provide actionable recommendations. Use the available tools
+    to process data and perform statistical analysis. Always explain your methodology
+    and assumptions clearly. To get patterns, insights and recommendations for the same
+    data, call run_analysis_pipeline once rather than each tool in turn.
+    """
+    
     def __init__(self, model: Optional[str] = None):
-        instructions = """
-        You are a data analyst AI assistant. You help users analyze data, identify patterns,
-        generate insights, and provide actionable recommendations. Use the available tools
-        to process data and perform statistical analysis. Always explain your methodology
-        and assumptions clearly.
-        """
-        
         super().__init__(
             name="data_analyst",
             model=model,
-            instructions=instructions,
+            instructions=self.INSTRUCTIONS,
             deps_type=DataDependencies,
             output_type=AnalysisResult,
         )
+        
+        # Loaded data files by path, with the modification time they were read at,
+        # so each is parsed once and a changed file replaces its old handle
+        self._handles: "OrderedDict[str, Tuple[int, DataHandle]]" = OrderedDict()
+    
+    async def _load_handle(self, data_path: str) -> Optional[DataHandle]:
+        """Load a JSON data file into a reusable handle, reusing it until the file changes"""
+        path = Path(data_path)
+        if not path.exists():
+            return None
+        
+        key = str(path.resolve())
+        mtime = path.stat().st_mtime_ns
+        cached = self._handles.get(key)
+        if cached is not None and cached[0] == mtime:
+            self._handles.move_to_end(key)
+            return cached[1]
+        
+        data = await file_operations_tool.read_json_file(data_path)
+        if data is None:
+            return None
+        handle = await data_tools.load_handle(data)
+        
+        self._handles[key] = (mtime, handle)
+        self._handles.move_to_end(key)
+        if len(self._handles) > HANDLE_CACHE_SIZE:
+            self._handles.popitem(last=False)
+        return handle
     
     def _register_tools(self) -> None:
+        @self.agent.instructions
+        def upstream_research(ctx: RunContext[DataDependencies]) -> str:
+            """Expose research handed over by an upstream agent, if any"""
+            research = ctx.deps.upstream_research if ctx.deps else None
+            if research is None:
+                return ""
+            
+            findings = "\n".join(f"- {finding}" for finding in research.findings)
+            return f"Research on '{research.query}' provided by an upstream agent:\n{findings}"
+        
         @self.agent.tool
         async def load_data(ctx: RunContext[DataDependencies], data_source: str) -> str:
             """Load data from various sources (CSV, JSON, etc.)"""
@@ -46,12 +93,24 @@ class DataAnalystAgent(BaseAgent[DataDependencies, AnalysisResult]):
                 ]
             }
             
-            return f"Loaded data from {data_source}:\n{json.dumps(mock_data, indent=2)}"
+            return f"Loaded data from {data_source}:\n{json_dumps(mock_data, indent=2).decode()}"
         
         @self.agent.tool
         async def calculate_statistics(ctx: RunContext[DataDependencies], column: str) -> str:
             """Calculate basic statistics for a column"""
-            # Mock statistics - in practice, this would calculate real stats
+            if ctx.deps and ctx.deps.data_path:
+                handle = await self._load_handle(ctx.deps.data_path)
+                if handle is None:
+                    return f"Could not load data from {ctx.deps.data_path}"
+                
+                # Vectorized over the column array when numpy is installed
+                column_stats = await data_tools.calculate_column_stats(handle, column)
+                if column_stats is None:
+                    return f"No statistics available for column '{column}'"
+                
+                return f"Statistics for column '{column}':\n{column_stats.model_dump_json(indent=2)}"
+            
+            # Mock statistics when there is no data file to read
             stats = {
                 "column": column,
                 "count": 1000,
@@ -63,7 +122,7 @@ class DataAnalystAgent(BaseAgent[DataDependencies, AnalysisResult]):
                 "quartiles": [33.1, 44.2, 58.7]
             }
             
-            return f"Statistics for column '{column}':\n{json.dumps(stats, indent=2)}"
+            return f"Statistics for column '{column}':\n{json_dumps(stats, indent=2).decode()}"
         
         @self.agent.tool
         async def identify_patterns(ctx: RunContext[DataDependencies], data_summary: str) -> str:
@@ -101,6 +160,16 @@ class DataAnalystAgent(BaseAgent[DataDependencies, AnalysisResult]):
             ]
             
             return f"Recommendations:\n" + "\n".join(f"- {rec}" for rec in recommendations)
+        
+        @self.agent.tool
+        async def run_analysis_pipeline(ctx: RunContext[DataDependencies], data_summary: str) -> str:
+            """Identify patterns, generate insights and recommend actions for a data summary in one call"""
+            results = await asyncio.gather(
+                identify_patterns(ctx, data_summary),
+                generate_insights(ctx, data_summary),
+                recommend_actions(ctx, data_summary)
+            )
+            return "\n\n".join(results)
 
 
 # Create a global instance for easy import
@@ -1,3 +1,5 @@
+import asyncio
+from collections import defaultdict
 from typing import List, Optional
 
 from pydantic_ai import RunContext
@@ -8,18 +10,19 @@ from ...core.models import ResearchResult
 
 
 class ResearchAgent(BaseAgent[ResearchDependencies, ResearchResult]):
+    INSTRUCTIONS = """
+    You are a research assistant specialized in gathering and analyzing information.
+    Use available tools to search for relevant information and provide comprehensive,
+    well-sourced answers. Always cite your sources and indicate the confidence level
+    of your findings. When you have several independent queries or source lists,
+    use the batch tools to handle them in one call.
+    """
+    
     def __init__(self, model: Optional[str] = None):
-        instructions = """
-        You are a research assistant specialized in gathering and analyzing information.
-        Use available tools to search for relevant information and provide comprehensive,
-        well-sourced answers. Always cite your sources and indicate the confidence level
-        of your findings.
-        """
-        
         super().__init__(
             name="research_agent",
             model=model,
-            instructions=instructions,
+            instructions=self.INSTRUCTIONS,
             deps_type=ResearchDependencies,
             output_type=ResearchResult,
         )
@@ -47,13 +50,13 @@ class ResearchAgent(BaseAgent[ResearchDependencies, ResearchResult]):
             if not sources:
                 return "No sources provided for analysis"
             
-            analysis = f"Analyzed {len(sources)} sources:\n"
+            parts = [f"Analyzed {len(sources)} sources:\n"]
             for i, source in enumerate(sources, 1):
                 # Mock analysis - in practice, this would be more sophisticated
                 credibility = "High" if "edu" in source or "gov" in source else "Medium"
-                analysis += f"{i}. {source} - Credibility: {credibility}\n"
+                parts.append(f"{i}. {source} - Credibility: {credibility}\n")
             
-            return analysis
+            return "".join(parts)
         
         @self.agent.tool
         async def synthesize_findings(ctx: RunContext[ResearchDependencies], findings: List[str]) -> str:
@@ -61,22 +64,30 @@ class ResearchAgent(BaseAgent[ResearchDependencies, ResearchResult]):
             if not findings:
                 return "No findings to synthesize"
             
-            summary = f"Synthesis of {len(findings)} findings:\n"
+            parts = [f"Synthesis of {len(findings)} findings:\n"]
             
             # Group similar findings (mock implementation)
-            themes = {}
+            themes = defaultdict(list)
             for finding in findings:
-                theme = finding.split()[0] if finding.split() else "General"
-                if theme not in themes:
-                    themes[theme] = []
+                # Only the first word is needed, so stop splitting after it
+                theme = (finding.split(None, 1) or ["General"])[0]
                 themes[theme].append(finding)
             
             for theme, theme_findings in themes.items():
-                summary += f"\n{theme.title()} theme:\n"
-                for finding in theme_findings:
-                    summary += f"- {finding}\n"
+                parts.append(f"\n{theme.title()} theme:\n")
+                parts.extend(f"- {finding}\n" for finding in theme_findings)
             
-            return summary
+            return "".join(parts)
+        
+        @self.agent.tool
+        async def batch_search_information(ctx: RunContext[ResearchDependencies], queries: List[str]) -> List[str]:
+            """Run several independent searches at once"""
+            return list(await asyncio.gather(*(search_information(ctx, query) for query in queries)))
+        
+        @self.agent.tool
+        async def batch_analyze_sources(ctx: RunContext[ResearchDependencies], sources_lists: List[List[str]]) -> List[str]:
+            """Analyze several independent lists of sources at once"""
+            return list(await asyncio.gather(*(analyze_sources(ctx, sources) for sources in sources_lists)))
 
 
 # Create a global instance for easy import
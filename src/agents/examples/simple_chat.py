@@ -1,3 +1,4 @@
+from itertools import islice
 from typing import Optional
 
 from pydantic_ai import RunContext
@@ -8,17 +9,17 @@ from ...core.models import ChatResponse
 
 
 class SimpleChatAgent(BaseAgent[ChatDependencies, ChatResponse]):
+    INSTRUCTIONS = """
+    You are a helpful and friendly AI assistant. Engage in natural conversation with users.
+    Be concise but informative. If you don't know something, say so honestly.
+    Maintain context from the conversation history when available.
+    """
+    
     def __init__(self, model: Optional[str] = None):
-        instructions = """
-        You are a helpful and friendly AI assistant. Engage in natural conversation with users.
-        Be concise but informative. If you don't know something, say so honestly.
-        Maintain context from the conversation history when available.
-        """
-        
         super().__init__(
             name="simple_chat",
             model=model,
-            instructions=instructions,
+            instructions=self.INSTRUCTIONS,
             deps_type=ChatDependencies,
             output_type=ChatResponse,
         )
@@ -27,7 +28,12 @@ class SimpleChatAgent(BaseAgent[ChatDependencies, ChatResponse]):
         @self.agent.tool
         async def get_conversation_context(ctx: RunContext[ChatDependencies]) -> str:
             """Get recent conversation history for context"""
-            history = ctx.deps.conversation_history[-5:] if ctx.deps else []
+            history = []
+            if ctx.deps:
+                # Walk back from the newest messages instead of copying the whole history
+                recent = [ctx.deps.recent] if ctx.deps.recent else []
+                past = islice(reversed(ctx.deps.conversation_history), 5 - len(recent))
+                history = list(past)[::-1] + recent
             if not history:
                 return "No previous conversation history available"
             
@@ -43,13 +49,10 @@ class SimpleChatAgent(BaseAgent[ChatDependencies, ChatResponse]):
             if not ctx.deps:
                 return "No conversation context available"
             
+            # History is bounded by max_history, so old messages drop off automatically
             message = {"role": role, "content": content}
             ctx.deps.conversation_history.append(message)
             
-            # Keep only recent messages
-            if len(ctx.deps.conversation_history) > ctx.deps.max_history:
-                ctx.deps.conversation_history = ctx.deps.conversation_history[-ctx.deps.max_history:]
-            
             return f"Remembered {role} message in conversation history"
 
 
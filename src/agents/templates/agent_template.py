@@ -14,23 +14,23 @@ class TemplateAgent(BaseAgent[BaseDependencies, AgentResult]):
     Steps to create a new agent:
     1. Copy this file with a new name
     2. Rename the class (TemplateAgent -> YourAgentName)
-    3. Update the instructions to match your agent's purpose
+    3. Update INSTRUCTIONS to match your agent's purpose
     4. Choose appropriate dependencies and output types
     5. Implement your tools in _register_tools()
     6. Create a global instance at the bottom
     """
     
+    INSTRUCTIONS = """
+    Replace this with instructions specific to your agent's role and capabilities.
+    Be clear about what the agent should do, how it should behave, and what
+    tools it has available.
+    """
+    
     def __init__(self, model: Optional[str] = None):
-        instructions = """
-        Replace this with instructions specific to your agent's role and capabilities.
-        Be clear about what the agent should do, how it should behave, and what
-        tools it has available.
-        """
-        
         super().__init__(
             name="template_agent",  # Change this to your agent's name
             model=model,
-            instructions=instructions,
+            instructions=self.INSTRUCTIONS,
             deps_type=BaseDependencies,  # Change to appropriate dependency type
             output_type=AgentResult,     # Change to appropriate output type
         )
@@ -1,10 +1,41 @@
 import logging
+import logging.handlers
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
 from .settings import settings
 
+# File log records are buffered and written in batches of up to this many
+LOG_BUFFER_CAPACITY = 256
+# Seconds between background flushes, so the log file never lags far behind
+LOG_FLUSH_INTERVAL = 1.0
+
+# Background flusher, started by the first setup_logging call that logs to a file
+_flush_thread: Optional[threading.Thread] = None
+
+
+def _flush_periodically(logger: logging.Logger, interval: float) -> None:
+    # Flushes whatever handlers the logger has now, so re-running setup_logging
+    # doesn't need a thread of its own
+    while True:
+        time.sleep(interval)
+        for handler in list(logger.handlers):
+            handler.flush()
+
+
+def _close_handlers(logger: logging.Logger) -> None:
+    """Flush and close the logger's handlers, then remove them"""
+    for handler in list(logger.handlers):
+        # MemoryHandler.close() flushes into its target but leaves it open
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
+    logger.handlers.clear()
+
 
 def setup_logging(
     level: Optional[str] = None,
@@ -20,8 +51,8 @@ def setup_logging(
     logger = logging.getLogger("agent-land")
     logger.setLevel(numeric_level)
     
-    # Clear any existing handlers
-    logger.handlers.clear()
+    # Close any existing handlers, writing out what they still buffer
+    _close_handlers(logger)
     
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -41,7 +72,27 @@ def setup_logging(
         file_handler = logging.FileHandler(file_path, mode="a")
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        
+        # Buffer records instead of writing each one; errors flush immediately,
+        # and logging's own exit hook flushes whatever is left
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        buffered_handler.setLevel(numeric_level)
+        logger.addHandler(buffered_handler)
+        
+        global _flush_thread
+        if _flush_thread is None:
+            _flush_thread = threading.Thread(
+                target=_flush_periodically,
+                args=(logger, LOG_FLUSH_INTERVAL),
+                name="log-flush",
+                daemon=True,
+            )
+            _flush_thread.start()
     
     return logger
 
@@ -1,11 +1,10 @@
+from functools import lru_cache
 from typing import Optional
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-load_dotenv()
-
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
@@ -21,5 +20,19 @@ class Settings(BaseSettings):
 
     debug: bool = False
 
+    celery_broker_url: str = "redis://localhost:6379/0"
+    task_state_url: str = "redis://localhost:6379/1"
+
+    web_cache_dir: str = ".webcache"
+    web_cache_ttl: int = 86400
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load the settings once; every later call returns the same instance"""
+    # Also export .env to os.environ for code that reads variables directly
+    load_dotenv()
+    return Settings()
+
 
-settings = Settings()
+settings = get_settings()
@@ -1,4 +1,7 @@
 import asyncio
+import functools
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 
@@ -8,6 +11,7 @@ from pydantic_ai import Agent, RunContext
 from ..config.logging import logger
 from ..config.settings import settings
 from .dependencies import BaseDependencies
+from .http_client import build_model, get_shared_http_client
 from .models import AgentResult, ToolResult
 
 T = TypeVar("T", bound=BaseDependencies)
@@ -15,6 +19,11 @@ R = TypeVar("R", bound=BaseModel)
 
 
 class BaseAgent(Generic[T, R], ABC):
+    # Event loop on a daemon thread that every run_sync call submits to, so
+    # sync callers don't set up and tear down a loop per prompt
+    _sync_loop: Optional[asyncio.AbstractEventLoop] = None
+    _sync_loop_lock = threading.Lock()
+
     def __init__(
         self,
         name: str,
@@ -30,6 +39,9 @@ class BaseAgent(Generic[T, R], ABC):
         self.deps_type = deps_type
         self.output_type = output_type
 
+        # Models bound to a shared HTTP client, built on first use per client
+        self._client_models = weakref.WeakKeyDictionary()
+
         # Initialize Pydantic AI agent
         self.agent = Agent(
             self.model,
@@ -41,7 +53,7 @@ class BaseAgent(Generic[T, R], ABC):
 
         self._register_tools()
 
-        logger.info(f"Initialized agent '{self.name}' with model '{self.model}'")
+        logger.info("Initialized agent '%s' with model '%s'", self.name, self.model)
 
     @abstractmethod
     def _register_tools(self) -> None:
@@ -55,7 +67,8 @@ class BaseAgent(Generic[T, R], ABC):
         **kwargs,
     ) -> Union[R, AgentResult]:
         """Run the agent with the given prompt and dependencies"""
-        logger.info(f"Running agent '{self.name}' with prompt: {prompt[:100]}...")
+        logger.info("Running agent '%s' with prompt: %s...", self.name, prompt[:100])
+        kwargs = self._with_shared_client(kwargs)
 
         try:
             if dependencies:
@@ -63,15 +76,37 @@ class BaseAgent(Generic[T, R], ABC):
             else:
                 result = await self.agent.run(prompt, **kwargs)
 
-            logger.info(f"Agent '{self.name}' completed successfully")
+            logger.info("Agent '%s' completed successfully", self.name)
             return result.output if hasattr(result, "output") else result
 
         except Exception as e:
-            logger.error(f"Agent '{self.name}' failed: {str(e)}")
+            logger.error("Agent '%s' failed: %s", self.name, e)
             if self.output_type:
                 return self.output_type()
             raise
 
+    async def run_many(
+        self,
+        prompts: List[str],
+        dependencies: Optional[T] = None,
+        concurrency: int = 16,
+        **kwargs,
+    ) -> List[Union[R, AgentResult, BaseException]]:
+        """Run the agent on several prompts concurrently, in prompt order.
+
+        At most `concurrency` runs are in flight at once. A prompt that fails
+        yields its exception in place of a result instead of failing the batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(prompt: str) -> Union[R, AgentResult]:
+            async with semaphore:
+                return await self.run(prompt, dependencies, **kwargs)
+
+        return await asyncio.gather(
+            *(run_one(prompt) for prompt in prompts), return_exceptions=True
+        )
+
     def run_sync(
         self,
         prompt: str,
@@ -79,7 +114,33 @@ class BaseAgent(Generic[T, R], ABC):
         **kwargs,
     ) -> Union[R, AgentResult]:
         """Synchronous wrapper for run method"""
-        return asyncio.run(self.run(prompt, dependencies, **kwargs))
+        loop = self._get_sync_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        # Blocking the shared loop on its own future would never return
+        if running is loop:
+            raise RuntimeError(
+                "run_sync can't be called from the shared run_sync loop; await run() instead"
+            )
+
+        future = asyncio.run_coroutine_threadsafe(
+            self.run(prompt, dependencies, **kwargs), loop
+        )
+        return future.result()
+
+    @staticmethod
+    def _get_sync_loop() -> asyncio.AbstractEventLoop:
+        """The shared run_sync loop, started on first use"""
+        with BaseAgent._sync_loop_lock:
+            if BaseAgent._sync_loop is None or BaseAgent._sync_loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="agent-run-sync", daemon=True
+                ).start()
+                BaseAgent._sync_loop = loop
+            return BaseAgent._sync_loop
 
     async def stream(
         self,
@@ -88,7 +149,8 @@ class BaseAgent(Generic[T, R], ABC):
         **kwargs,
     ):
         """Stream responses from the agent"""
-        logger.info(f"Streaming from agent '{self.name}'")
+        logger.info("Streaming from agent '%s'", self.name)
+        kwargs = self._with_shared_client(kwargs)
 
         try:
             if dependencies:
@@ -103,17 +165,31 @@ class BaseAgent(Generic[T, R], ABC):
                         yield message
 
         except Exception as e:
-            logger.error(f"Streaming failed for agent '{self.name}': {str(e)}")
+            logger.error("Streaming failed for agent '%s': %s", self.name, e)
             raise
 
+    def _with_shared_client(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Route the call through the shared HTTP client when one is active"""
+        client = get_shared_http_client()
+        if client is None or "model" in kwargs:
+            return kwargs
+
+        model = self._client_models.get(client)
+        if model is None:
+            model = build_model(self.model, client)
+            self._client_models[client] = model
+
+        return {**kwargs, "model": model}
+
     def add_tool(self, func: callable, name: Optional[str] = None):
         """Add a tool to the agent"""
         tool_name = name or func.__name__
         self.agent.tool(func)
-        logger.info(f"Added tool '{tool_name}' to agent '{self.name}'")
+        logger.info("Added tool '%s' to agent '%s'", tool_name, self.name)
 
-    def get_info(self) -> Dict[str, Any]:
-        """Get information about the agent"""
+    @functools.cached_property
+    def info(self) -> Dict[str, Any]:
+        """Information about the agent, computed once per instance"""
         return {
             "name": self.name,
             "model": self.model,
@@ -121,3 +197,7 @@ class BaseAgent(Generic[T, R], ABC):
             "deps_type": self.deps_type.__name__ if self.deps_type else None,
             "output_type": self.output_type.__name__ if self.output_type else None,
         }
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get information about the agent"""
+        return self.info
@@ -1,8 +1,10 @@
-from typing import Any, Dict, Optional
+from collections import deque
+from typing import Any, Deque, Dict, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 from ..config.settings import settings
+from .models import ResearchResult
 
 
 class BaseDependencies(BaseModel):
@@ -12,8 +14,17 @@ class BaseDependencies(BaseModel):
 
 
 class ChatDependencies(BaseDependencies):
-    conversation_history: list = []
+    conversation_history: Deque[Dict[str, Any]] = Field(default_factory=deque)
     max_history: int = 50
+    # The turn in progress, kept out of conversation_history so that stays an unchanged prefix
+    recent: Optional[Dict[str, Any]] = None
+
+    @model_validator(mode="after")
+    def _bound_history(self) -> "ChatDependencies":
+        # Bounded deque: appends drop the oldest message once full
+        if self.conversation_history.maxlen != self.max_history:
+            self.conversation_history = deque(self.conversation_history, maxlen=self.max_history)
+        return self
 
 
 class ResearchDependencies(BaseDependencies):
@@ -26,6 +37,7 @@ class DataDependencies(BaseDependencies):
     data_path: Optional[str] = None
     allowed_formats: list = ["csv", "json", "xlsx"]
     max_file_size: int = 100 * 1024 * 1024  # 100MB
+    upstream_research: Optional[ResearchResult] = None  # handed over by a research agent
 
 
 class ToolDependencies(BaseDependencies):
@@ -0,0 +1,65 @@
+import importlib.util
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+from ..config.settings import settings
+
+# Client shared by every agent call made inside a shared_http_client() block
+_current_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar(
+    "shared_http_client", default=None
+)
+
+
+def get_shared_http_client() -> Optional[httpx.AsyncClient]:
+    """Get the shared HTTP client for the current context, if any"""
+    return _current_client.get()
+
+
+@asynccontextmanager
+async def shared_http_client(
+    max_connections: int = 20,
+    timeout: float = 60.0,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Pool connections for all agent calls made inside this block"""
+    # HTTP/2 multiplexing needs the optional h2 package
+    http2 = importlib.util.find_spec("h2") is not None
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    )
+
+    async with httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout) as client:
+        token = _current_client.set(client)
+        try:
+            yield client
+        finally:
+            _current_client.reset(token)
+
+
+def build_model(model_name: str, http_client: httpx.AsyncClient) -> Any:
+    """Build a Pydantic AI model for 'provider:name' that uses the given client"""
+    provider, _, name = model_name.partition(":")
+
+    if provider == "openai":
+        from pydantic_ai.models.openai import OpenAIModel
+        from pydantic_ai.providers.openai import OpenAIProvider
+
+        return OpenAIModel(
+            name,
+            provider=OpenAIProvider(api_key=settings.openai_api_key, http_client=http_client),
+        )
+
+    if provider == "anthropic":
+        from pydantic_ai.models.anthropic import AnthropicModel
+        from pydantic_ai.providers.anthropic import AnthropicProvider
+
+        return AnthropicModel(
+            name,
+            provider=AnthropicProvider(api_key=settings.anthropic_api_key, http_client=http_client),
+        )
+
+    # Unknown providers keep resolving the model string themselves
+    return model_name
@@ -0,0 +1,138 @@
+"""
+Scenario Task Queue
+
+Runs multi-agent scenarios on Celery workers so callers don't block on them.
+Task state lives in a Redis hash per task. Celery and redis are optional
+(install the `queue` extra); without them, callers run scenarios in-process.
+
+Start a worker with:
+    celery -A src.tasks worker --loglevel=info
+"""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .config.logging import logger
+from .config.settings import settings
+
+try:
+    import redis
+    from celery import Celery
+except ImportError:
+    redis = None
+    Celery = None
+
+# Seconds to wait when connecting to the broker or the state store
+QUEUE_CONNECT_TIMEOUT = 5
+
+# Seconds to wait for a queued scenario before giving up on it
+SCENARIO_WAIT_TIMEOUT = 600
+
+
+def queue_available() -> bool:
+    """Whether the Celery/Redis task queue can be used"""
+    return Celery is not None and redis is not None
+
+
+def queue_reachable() -> bool:
+    """Whether the broker and the state store accept connections"""
+    try:
+        with app.connection_for_write(connect_timeout=QUEUE_CONNECT_TIMEOUT) as connection:
+            connection.ensure_connection(max_retries=1)
+        _state_client().ping()
+    except Exception as e:
+        logger.warning(f"Task queue unreachable: {e}")
+        return False
+    return True
+
+
+def _state_client() -> "redis.Redis":
+    """Redis client holding per-task status and results"""
+    return redis.Redis.from_url(
+        settings.task_state_url,
+        decode_responses=True,
+        socket_connect_timeout=QUEUE_CONNECT_TIMEOUT,
+    )
+
+
+def _set_state(task_id: str, **fields: Any) -> None:
+    """Update the stored state of a task"""
+    _state_client().hset(
+        f"task:{task_id}",
+        mapping={**fields, "updated_at": datetime.now().isoformat()},
+    )
+
+
+if queue_available():
+    app = Celery("agent_scenarios", broker=settings.celery_broker_url)
+
+    @app.task(bind=True, max_retries=3, default_retry_delay=60)
+    def run_scenario_task(self, scenario: str, args: List[Any], task_id: str) -> str:
+        """Run one scenario on a worker, retrying transient failures"""
+        # Imported here so loading the worker doesn't pull in every agent
+        from examples.multi_agent_scenarios import MultiAgentScenarios, ScenarioSpec
+
+        _set_state(task_id, status="running", scenario=scenario, attempt=self.request.retries + 1)
+
+        try:
+            results = asyncio.run(
+                MultiAgentScenarios()._dispatch(ScenarioSpec(scenario, tuple(args)))
+            )
+        except Exception as e:
+            if self.request.retries >= self.max_retries:
+                _set_state(task_id, status="failed", error=str(e))
+                raise
+            logger.warning(f"Scenario task {task_id} failed, retrying: {e}")
+            _set_state(task_id, status="retrying", error=str(e))
+            # Back off exponentially from the default delay
+            raise self.retry(exc=e, countdown=self.default_retry_delay * 2 ** self.request.retries)
+
+        _set_state(task_id, status="completed", result=json.dumps(results, default=str))
+        return task_id
+
+
+def submit_scenario(scenario: str, args: List[Any]) -> str:
+    """Queue a scenario for a worker and return its task id"""
+    task_id = str(uuid.uuid4())
+    _set_state(task_id, status="queued", scenario=scenario)
+    run_scenario_task.delay(scenario, list(args), task_id)
+    logger.info(f"📮 Queued scenario {scenario} as task {task_id}")
+    return task_id
+
+
+def get_task_state(task_id: str) -> Optional[Dict[str, str]]:
+    """Get the stored state of a task, if it exists"""
+    return _state_client().hgetall(f"task:{task_id}") or None
+
+
+async def wait_for_scenario(
+    task_id: str,
+    poll_interval: float = 1.0,
+    timeout: Optional[float] = SCENARIO_WAIT_TIMEOUT,
+) -> Dict[str, Any]:
+    """Poll a queued scenario until it finishes and return its results.
+
+    Raises TimeoutError if it hasn't finished within `timeout` seconds, e.g.
+    because no worker is running. Redis is polled on a worker thread so the
+    event loop isn't blocked.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+
+    while True:
+        state = await asyncio.to_thread(get_task_state, task_id) or {}
+        status = state.get("status")
+
+        if status == "completed":
+            return json.loads(state["result"])
+        if status == "failed":
+            raise RuntimeError(f"Scenario task {task_id} failed: {state.get('error')}")
+        if deadline is not None and loop.time() >= deadline:
+            raise TimeoutError(
+                f"Scenario task {task_id} still {status or 'unknown'} after {timeout}s; is a worker running?"
+            )
+
+        await asyncio.sleep(poll_interval)
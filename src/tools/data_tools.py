@@ -1,9 +1,123 @@
+import asyncio
 import json
+import os
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
 from ..config.logging import logger
+from ..utils.helpers import json_loads
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+else:
+    from . import fast_stats
+
+    # Compile the kernels now instead of on the first request
+    if os.getenv("AGENTLAND_NUMBA_WARMUP") == "1":
+        from ._warmup import warmup
+        warmup()
+
+# Row-oriented records, as returned by load_json_data
+Records = List[Dict[str, Any]]
+# Column name -> values for every row, as returned by to_columns. Columns of
+# only ints or only floats are int64/float64 arrays when numpy is installed;
+# others are plain lists, with _MISSING where a record lacks the key.
+Columns = Dict[str, Any]
+
+# Summaries of at least this many records run on a worker thread
+OFFLOAD_MIN_RECORDS = 10_000
+
+# Records sampled to estimate how selective each filter condition is
+FILTER_SAMPLE_SIZE = 128
+
+# Stands in for a column a record doesn't have
+_MISSING = object()
+
+# int64 range; larger ints stay in a list so they round-trip exactly
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _factorize(values: List[Any]) -> Tuple[Dict[Any, int], "np.ndarray"]:
+    """Integer codes for values, numbered in order of first appearance"""
+    codes_by_value: Dict[Any, int] = {}
+    codes = np.fromiter(
+        (codes_by_value.setdefault(v, len(codes_by_value)) for v in values),
+        dtype=np.int64,
+        count=len(values)
+    )
+    return codes_by_value, codes
+
+
+def _is_hashable(value: Any) -> bool:
+    """Whether value can be a dictionary key; a tuple holding a list can't"""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _group_label(key: Any) -> str:
+    """Group name for a key, with records lacking the column grouped as Unknown"""
+    return "Unknown" if key is _MISSING else str(key)
+
+
+def _column_array(values: List[Any]) -> Optional["np.ndarray"]:
+    """Array for a column of only ints or only floats; None if it must stay a list"""
+    if not values:
+        return None
+    if all(type(v) is float for v in values):
+        return np.asarray(values, dtype=np.float64)
+    # bools are ints but compare and print differently, so they stay in the list
+    if all(type(v) is int and _INT64_MIN <= v <= _INT64_MAX for v in values):
+        return np.asarray(values, dtype=np.int64)
+    return None
+
+
+def _type_name(value: Any) -> str:
+    """Summary type name for a column, from one of its values"""
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "string"
+    return "object"
+
+
+def _has_column(data: Union[Records, "DataHandle"], column: str) -> bool:
+    """Whether any record has the column, not just the first; a handle answers from its columns"""
+    if isinstance(data, DataHandle):
+        return column in data.columns
+    return any(column in record for record in data)
+
+
+class DataHandle:
+    """Records loaded once, with their columns and factorized codes kept alongside"""
+    
+    __slots__ = ("rows", "columns", "factors")
+    
+    def __init__(self, rows: Records, columns: Columns):
+        self.rows = rows
+        self.columns = columns
+        self.factors: Dict[str, Optional[Tuple[Dict[Any, int], "np.ndarray"]]] = {}
+    
+    def factorize(self, column: str) -> Optional[Tuple[Dict[Any, int], "np.ndarray"]]:
+        """Integer codes for a non-numeric column, computed on first use.
+        
+        None if the column holds unhashable values such as lists or dicts.
+        """
+        if column not in self.factors:
+            try:
+                self.factors[column] = _factorize(self.columns[column])
+            except TypeError:
+                self.factors[column] = None
+        return self.factors[column]
 
 
 class DataSummary(BaseModel):
@@ -32,12 +146,12 @@ class DataTools:
     def __init__(self):
         pass
     
-    async def load_json_data(self, data: Union[str, List[Dict], Dict]) -> List[Dict[str, Any]]:
+    async def load_json_data(self, data: Union[str, bytes, List[Dict], Dict]) -> List[Dict[str, Any]]:
         """Load and normalize JSON data"""
         try:
-            if isinstance(data, str):
-                # Parse JSON string
-                parsed_data = json.loads(data)
+            if isinstance(data, (str, bytes)):
+                # Parse JSON text; bytes skip a separate UTF-8 decode under orjson
+                parsed_data = json_loads(data)
             else:
                 parsed_data = data
             
@@ -49,105 +163,130 @@ class DataTools:
                 # If it's already a list, use as is
                 normalized_data = parsed_data
             else:
-                logger.error(f"Unsupported data type: {type(parsed_data)}")
+                logger.error("Unsupported data type: %s", type(parsed_data))
                 return []
             
-            logger.info(f"Loaded {len(normalized_data)} records")
+            logger.info("Loaded %d records", len(normalized_data))
             return normalized_data
             
         except json.JSONDecodeError as e:
-            logger.error(f"Error parsing JSON data: {e}")
+            # orjson's decode error subclasses the stdlib one
+            logger.error("Error parsing JSON data: %s", e)
             return []
         except Exception as e:
-            logger.error(f"Error loading data: {e}")
+            logger.error("Error loading data: %s", e)
             return []
     
-    async def summarize_data(self, data: List[Dict[str, Any]], sample_size: int = 5) -> DataSummary:
-        """Create a summary of the dataset"""
-        if not data:
-            return DataSummary(
-                total_records=0,
-                columns=[],
-                data_types={},
-                missing_values={},
-                sample_data=[]
-            )
-        
-        # Get all unique columns
+    async def to_columns(self, data: Records) -> Columns:
+        """Convert records to columns once, so repeated stats and aggregations run vectorized"""
         all_columns = set()
         for record in data:
             all_columns.update(record.keys())
-        columns = sorted(list(all_columns))
         
-        # Analyze data types and missing values
-        data_types = {}
-        missing_values = {}
-        
-        for column in columns:
-            column_values = []
-            missing_count = 0
-            
-            for record in data:
-                if column in record and record[column] is not None:
-                    column_values.append(record[column])
-                else:
-                    missing_count += 1
+        columns = {}
+        for column in sorted(all_columns):
+            # Missing keys stay distinguishable from explicit nulls
+            values = [record.get(column, _MISSING) for record in data]
             
-            # Determine data type
-            if column_values:
-                first_value = column_values[0]
-                if isinstance(first_value, bool):
-                    data_types[column] = "boolean"
-                elif isinstance(first_value, int):
-                    data_types[column] = "integer"
-                elif isinstance(first_value, float):
-                    data_types[column] = "float"
-                elif isinstance(first_value, str):
-                    data_types[column] = "string"
+            array = _column_array(values) if np is not None else None
+            columns[column] = values if array is None else array
+        
+        logger.info("Converted %d records to %d columns", len(data), len(columns))
+        return columns
+    
+    async def load_handle(self, data: Union[str, List[Dict], Dict]) -> DataHandle:
+        """Load data once into a handle that the other tools can reuse without re-scanning it"""
+        rows = await self.load_json_data(data)
+        return DataHandle(rows, await self.to_columns(rows))
+    
+    async def summarize_data(self, data: Union[Records, DataHandle], sample_size: int = 5) -> DataSummary:
+        """Create a summary of the dataset"""
+        if isinstance(data, DataHandle):
+            data = data.rows
+        
+        # Large datasets are summarized on a worker thread so the event loop stays responsive
+        if len(data) >= OFFLOAD_MIN_RECORDS:
+            summary = await asyncio.to_thread(self._summarize, data, sample_size)
+        else:
+            summary = self._summarize(data, sample_size)
+        
+        logger.info("Generated summary for %d records with %d columns", len(data), len(summary.columns))
+        return summary
+    
+    def _summarize(self, data: Records, sample_size: int) -> DataSummary:
+        """Count present values and find each column's first value in one pass over the records"""
+        present_counts: Dict[str, int] = {}
+        first_values: Dict[str, Any] = {}
+        
+        for record in data:
+            for column, value in record.items():
+                if value is None:
+                    present_counts.setdefault(column, 0)
                 else:
-                    data_types[column] = "object"
-            else:
-                data_types[column] = "unknown"
-            
-            missing_values[column] = missing_count
+                    present_counts[column] = present_counts.get(column, 0) + 1
+                    first_values.setdefault(column, value)
         
-        # Sample data
-        sample_data = data[:sample_size]
+        columns = sorted(present_counts)
         
-        summary = DataSummary(
+        return DataSummary(
             total_records=len(data),
             columns=columns,
-            data_types=data_types,
-            missing_values=missing_values,
-            sample_data=sample_data
+            data_types={
+                column: _type_name(first_values[column]) if column in first_values else "unknown"
+                for column in columns
+            },
+            missing_values={column: len(data) - present_counts[column] for column in columns},
+            sample_data=data[:sample_size]
         )
-        
-        logger.info(f"Generated summary for {len(data)} records with {len(columns)} columns")
-        return summary
     
-    async def calculate_column_stats(self, data: List[Dict[str, Any]], column: str) -> Optional[DataStats]:
+    async def calculate_column_stats(self, data: Union[Records, Columns, DataHandle], column: str) -> Optional[DataStats]:
         """Calculate statistics for a specific column"""
-        if not data or column not in data[0]:
-            logger.error(f"Column '{column}' not found in data")
-            return None
+        if isinstance(data, DataHandle):
+            data = data.columns
         
-        # Extract column values (excluding None/null)
-        values = []
-        for record in data:
-            if column in record and record[column] is not None:
-                values.append(record[column])
+        if isinstance(data, dict):
+            if column not in data:
+                logger.error("Column '%s' not found in data", column)
+                return None
+            
+            if np is not None and isinstance(data[column], np.ndarray):
+                return self._array_stats(column, data[column])
+            
+            values = [v for v in data[column] if v is not None and v is not _MISSING]
+        else:
+            if not _has_column(data, column):
+                logger.error("Column '%s' not found in data", column)
+                return None
+            
+            # Extract column values (excluding None/null)
+            values = []
+            for record in data:
+                if column in record and record[column] is not None:
+                    values.append(record[column])
         
         if not values:
-            logger.error(f"No valid values found for column '{column}'")
+            logger.error("No valid values found for column '%s'", column)
             return None
         
-        stats = DataStats(
-            column=column,
-            count=len(values),
-            unique_count=len(set(values))
-        )
+        # Fields are computed here with the right types, so skip validation
+        stats = DataStats.model_construct(column=column, count=len(values), unique_count=0)
         
         # Calculate numeric statistics if applicable
+        if np is not None:
+            numeric_values = np.fromiter(
+                (float(v) for v in values if isinstance(v, (int, float))), dtype=np.float64
+            )
+            n_numeric = numeric_values.shape[0]
+            n_unique = self._set_numeric_stats(stats, numeric_values) if n_numeric else 0
+            
+            # An all-numeric column is counted from the kernel's sort; anything else needs a set
+            stats.unique_count = n_unique if n_numeric == len(values) else len(set(values))
+            
+            logger.info("Calculated statistics for column '%s'", column)
+            return stats
+        
+        stats.unique_count = len(set(values))
+        
         try:
             numeric_values = [float(v) for v in values if isinstance(v, (int, float))]
             
@@ -180,39 +319,156 @@ class DataTools:
             stats.min = str(min(values))
             stats.max = str(max(values))
         
-        logger.info(f"Calculated statistics for column '{column}'")
+        logger.info("Calculated statistics for column '%s'", column)
+        return stats
+    
+    def _array_stats(self, column: str, values: "np.ndarray") -> Optional[DataStats]:
+        """Statistics for a numeric column array, computed with numpy"""
+        n = values.shape[0]
+        if n == 0:
+            logger.error("No valid values found for column '%s'", column)
+            return None
+        
+        stats = DataStats.model_construct(column=column, count=n, unique_count=0)
+        stats.unique_count = self._set_numeric_stats(stats, values)
+        
+        logger.info("Calculated statistics for column '%s'", column)
         return stats
     
-    async def filter_data(self, data: List[Dict[str, Any]], conditions: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _set_numeric_stats(self, stats: DataStats, values: "np.ndarray") -> int:
+        """Fill in the numeric fields of stats from a float64 array; returns its distinct value count"""
+        values = values.astype(np.float64, copy=False)
+        mean, std, median, q1, q3, low, high, n_unique = fast_stats.numeric_stats(values)
+        
+        stats.mean = float(mean)
+        stats.median = float(median)
+        stats.std = float(std)
+        stats.min = float(low)
+        stats.max = float(high)
+        stats.quartiles = [float(q1), float(median), float(q3)]
+        return int(n_unique)
+    
+    async def filter_data(self, data: Union[Records, Columns, DataHandle], conditions: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Filter data based on conditions"""
-        filtered_data = []
+        if isinstance(data, DataHandle):
+            return self._filter_columns(data.columns, conditions, data)
         
-        for record in data:
-            match = True
-            for column, condition_value in conditions.items():
-                if column not in record:
-                    match = False
-                    break
-                
-                record_value = record[column]
-                
-                # Simple equality check (can be extended for complex conditions)
-                if record_value != condition_value:
-                    match = False
-                    break
-            
-            if match:
-                filtered_data.append(record)
+        if isinstance(data, dict):
+            return self._filter_columns(data, conditions)
+        
+        # Simple equality check (can be extended for complex conditions); each
+        # condition narrows the previous result, and a missing column never matches
+        filtered_data = list(data)
+        for column, condition_value in self._by_selectivity(data, conditions):
+            filtered_data = [
+                record for record in filtered_data
+                if record.get(column, _MISSING) == condition_value
+            ]
+        
+        logger.info("Filtered data: %d -> %d records", len(data), len(filtered_data))
+        return filtered_data
+    
+    def _by_selectivity(self, data: Records, conditions: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        """Conditions ordered so the one matching the fewest sampled records narrows first"""
+        items = list(conditions.items())
+        if len(items) < 2:
+            return items
+        
+        sample = data[:FILTER_SAMPLE_SIZE]
+        return sorted(
+            items,
+            key=lambda item: sum(record.get(item[0], _MISSING) == item[1] for record in sample)
+        )
+    
+    def _filter_columns(
+        self,
+        data: Columns,
+        conditions: Dict[str, Any],
+        handle: Optional[DataHandle] = None
+    ) -> List[Dict[str, Any]]:
+        """Filter columns with equality conditions, returning the matching rows"""
+        n_rows = len(next(iter(data.values()), []))
+        
+        if any(column not in data for column in conditions):
+            matches = []
+        elif np is None:
+            matches = [
+                i for i in range(n_rows)
+                if all(data[column][i] == value for column, value in conditions.items())
+            ]
+        else:
+            mask = np.ones(n_rows, dtype=bool)
+            for column, value in conditions.items():
+                values = data[column]
+                if handle is None or isinstance(values, np.ndarray):
+                    mask &= self._match_mask(values, value)
+                else:
+                    factorized = handle.factorize(column)
+                    if factorized is None:
+                        mask &= self._equality_mask(values, value)
+                    else:
+                        mask &= self._match_mask(values, value, factorized)
+            matches = np.flatnonzero(mask).tolist()
+        
+        if handle is not None:
+            filtered_data = [handle.rows[i] for i in matches]
+        else:
+            # Rebuild each row from its own values, leaving out columns it lacked
+            filtered_data = []
+            for i in matches:
+                row = {}
+                for column, values in data.items():
+                    value = values[i]
+                    if value is _MISSING:
+                        continue
+                    row[column] = value.item() if np is not None and isinstance(values, np.ndarray) else value
+                filtered_data.append(row)
         
-        logger.info(f"Filtered data: {len(data)} -> {len(filtered_data)} records")
+        logger.info("Filtered data: %s -> %d records", n_rows, len(filtered_data))
         return filtered_data
     
-    async def group_data(self, data: List[Dict[str, Any]], group_by: str) -> Dict[str, List[Dict[str, Any]]]:
+    def _match_mask(
+        self,
+        values: Any,
+        value: Any,
+        factorized: Optional[Tuple[Dict[Any, int], "np.ndarray"]] = None
+    ) -> "np.ndarray":
+        """Boolean mask of the rows in a column equal to value"""
+        if isinstance(values, np.ndarray):
+            # Only a number can equal a numeric element; a list would broadcast instead
+            if isinstance(value, (int, float, np.number)):
+                return values == value
+            return np.zeros(len(values), dtype=bool)
+        
+        if not _is_hashable(value):
+            return self._equality_mask(values, value)
+        
+        # Factorize to integer codes so the comparison is one pass over an int array
+        if factorized is None:
+            try:
+                factorized = _factorize(values)
+            except TypeError:
+                # Lists or dicts in the column can't be dictionary keys
+                return self._equality_mask(values, value)
+        codes_by_value, codes = factorized
+        
+        if value not in codes_by_value:
+            return np.zeros(len(values), dtype=bool)
+        return fast_stats.eq_const(codes, codes_by_value[value])
+    
+    def _equality_mask(self, values: List[Any], value: Any) -> "np.ndarray":
+        """Boolean mask of the rows equal to value, compared one by one like the record path"""
+        return np.fromiter((v == value for v in values), dtype=bool, count=len(values))
+    
+    async def group_data(self, data: Union[Records, DataHandle], group_by: str) -> Dict[str, List[Dict[str, Any]]]:
         """Group data by a specific column"""
-        if not data or group_by not in data[0]:
-            logger.error(f"Group by column '{group_by}' not found")
+        if not _has_column(data, group_by):
+            logger.error("Group by column '%s' not found", group_by)
             return {}
         
+        if isinstance(data, DataHandle):
+            data = data.rows
+        
         groups = {}
         for record in data:
             group_key = str(record.get(group_by, "Unknown"))
@@ -220,20 +476,51 @@ class DataTools:
                 groups[group_key] = []
             groups[group_key].append(record)
         
-        logger.info(f"Grouped data by '{group_by}' into {len(groups)} groups")
+        logger.info("Grouped data by '%s' into %d groups", group_by, len(groups))
         return groups
     
-    async def aggregate_data(self, data: List[Dict[str, Any]], group_by: str, agg_column: str, operation: str = "sum") -> Dict[str, float]:
+    async def aggregate_data(self, data: Union[Records, Columns, DataHandle], group_by: str, agg_column: str, operation: str = "sum") -> Dict[str, float]:
         """Aggregate data by groups"""
-        groups = await self.group_data(data, group_by)
-        results = {}
+        handle = None
+        if isinstance(data, DataHandle):
+            handle, data = data, data.columns
         
-        for group_key, group_data in groups.items():
-            values = []
-            for record in group_data:
-                if agg_column in record and isinstance(record[agg_column], (int, float)):
-                    values.append(float(record[agg_column]))
+        if isinstance(data, dict):
+            if group_by not in data or agg_column not in data:
+                logger.error("Group by column '%s' or column '%s' not found", group_by, agg_column)
+                return {}
+            
+            if np is not None and isinstance(data[agg_column], np.ndarray):
+                results = None
+                if handle is not None and not isinstance(data[group_by], np.ndarray):
+                    factorized = handle.factorize(group_by)
+                    if factorized is not None:
+                        results = self._aggregate_factorized(factorized, data[agg_column], operation)
+                if results is None:
+                    results = self._aggregate_arrays(data[group_by], data[agg_column], operation)
+                logger.info("Aggregated data by '%s' using '%s' on '%s'", group_by, operation, agg_column)
+                return results
             
+            pairs = zip(data[group_by], data[agg_column])
+        else:
+            if not _has_column(data, group_by):
+                logger.error("Group by column '%s' not found", group_by)
+                return {}
+            pairs = ((record.get(group_by, "Unknown"), record.get(agg_column)) for record in data)
+        
+        # Collect each group's numeric values in one pass, without building per-group record lists
+        groups: Dict[str, List[float]] = {}
+        for key, value in pairs:
+            group_key = _group_label(key)
+            values = groups.get(group_key)
+            if values is None:
+                values = groups[group_key] = []
+            if isinstance(value, (int, float)):
+                values.append(float(value))
+        
+        results = {}
+        
+        for group_key, values in groups.items():
             if values:
                 if operation == "sum":
                     results[group_key] = sum(values)
@@ -248,8 +535,56 @@ class DataTools:
                 else:
                     results[group_key] = sum(values)  # default to sum
         
-        logger.info(f"Aggregated data by '{group_by}' using '{operation}' on '{agg_column}'")
+        logger.info("Aggregated data by '%s' using '%s' on '%s'", group_by, operation, agg_column)
         return results
+    
+    def _aggregate_arrays(self, keys: List[Any], values: "np.ndarray", operation: str) -> Dict[str, float]:
+        """Group-by reduction over a numeric column array, computed with numpy"""
+        labels, first_seen, codes = np.unique(
+            np.asarray([_group_label(key) for key in keys]), return_index=True, return_inverse=True
+        )
+        reduced = self._reduce_groups(values, codes, len(labels), operation)
+        
+        # Report groups in the order they first appear, like group_data
+        order = np.argsort(first_seen)
+        return self._group_results([str(labels[i]) for i in order], reduced[order], operation)
+    
+    def _aggregate_factorized(
+        self,
+        factorized: Tuple[Dict[Any, int], "np.ndarray"],
+        values: "np.ndarray",
+        operation: str
+    ) -> Optional[Dict[str, float]]:
+        """Group-by reduction reusing a handle's codes; None if distinct keys share a label"""
+        codes_by_value, codes = factorized
+        labels = [_group_label(key) for key in codes_by_value]
+        if len(set(labels)) != len(labels):
+            return None
+        
+        # Codes are already numbered in order of first appearance
+        reduced = self._reduce_groups(values, codes, len(labels), operation)
+        return self._group_results(labels, reduced, operation)
+    
+    def _group_results(self, labels: List[str], reduced: "np.ndarray", operation: str) -> Dict[str, float]:
+        """Label -> result, with counts as ints like the record path returns them"""
+        if operation == "count":
+            return {label: int(total) for label, total in zip(labels, reduced)}
+        return {label: float(total) for label, total in zip(labels, reduced)}
+    
+    def _reduce_groups(self, values: "np.ndarray", codes: "np.ndarray", n_groups: int, operation: str) -> "np.ndarray":
+        """Reduce values into one result per group code"""
+        # int64 columns are reduced as floats, like the record path's float(value)
+        values = values.astype(np.float64, copy=False)
+        if operation == "count":
+            return np.bincount(codes, minlength=n_groups).astype(np.float64)
+        if operation in ("mean", "avg"):
+            return fast_stats.group_mean(values, codes, n_groups)
+        if operation == "min":
+            return fast_stats.group_min(values, codes, n_groups)
+        if operation == "max":
+            return fast_stats.group_max(values, codes, n_groups)
+        
+        return fast_stats.group_sum(values, codes, n_groups)  # default to sum
 
 
 # Global tool instance
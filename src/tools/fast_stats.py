@@ -0,0 +1,179 @@
+"""
+Fast Stats Kernels
+
+Numeric kernels behind the data tools' columnar path. They are
+JIT-compiled with Numba when it is installed and use numpy otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange, vectorize
+except ImportError:
+    njit = None
+
+# Below this many rows, splitting a group-by across threads costs more than it saves
+PARALLEL_MIN_ROWS = 100_000
+
+
+if njit is not None:
+    @njit(cache=True)
+    def numeric_stats(arr):
+        """(mean, std, median, q1, q3, min, max, distinct count) of a column, from one sort"""
+        a = np.sort(arr)
+        n = a.shape[0]
+
+        total = 0.0
+        for i in range(n):
+            total += a[i]
+        mean = total / n
+
+        var = 0.0
+        n_unique = 1
+        for i in range(n):
+            d = a[i] - mean
+            var += d * d
+            if i > 0 and a[i] != a[i - 1]:
+                n_unique += 1
+
+        if n % 2 == 1:
+            median = a[n // 2]
+        else:
+            median = (a[n // 2 - 1] + a[n // 2]) / 2
+        return mean, np.sqrt(var / n), median, a[n // 4], a[3 * n // 4], a[0], a[n - 1], n_unique
+
+    @njit(fastmath=True, cache=True)
+    def _group_sum_into(values, labels, out):
+        for i in range(values.shape[0]):
+            out[labels[i]] += values[i]
+
+    @njit(parallel=True, cache=True)
+    def _group_sum_chunks(values, labels, n_groups, n_chunks):
+        n = values.shape[0]
+        sums = np.zeros((n_chunks, n_groups))
+
+        # Each chunk of rows accumulates into its own row of partials
+        for t in prange(n_chunks):
+            lo = t * n // n_chunks
+            hi = (t + 1) * n // n_chunks
+            for i in range(lo, hi):
+                sums[t, labels[i]] += values[i]
+
+        totals = np.zeros(n_groups)
+        for t in range(n_chunks):
+            for k in range(n_groups):
+                totals[k] += sums[t, k]
+        return totals
+
+    @njit(parallel=True, cache=True)
+    def _group_mean_chunks(values, labels, n_groups, n_chunks):
+        n = values.shape[0]
+        sums = np.zeros((n_chunks, n_groups))
+        counts = np.zeros((n_chunks, n_groups), dtype=np.int64)
+
+        # Each chunk of rows accumulates into its own row of partials
+        for t in prange(n_chunks):
+            lo = t * n // n_chunks
+            hi = (t + 1) * n // n_chunks
+            for i in range(lo, hi):
+                k = labels[i]
+                sums[t, k] += values[i]
+                counts[t, k] += 1
+
+        means = np.zeros(n_groups)
+        for k in range(n_groups):
+            total = 0.0
+            count = 0
+            for t in range(n_chunks):
+                total += sums[t, k]
+                count += counts[t, k]
+            means[k] = total / count
+        return means
+
+    @njit(parallel=True, cache=True)
+    def _group_extreme_chunks(values, labels, n_groups, n_chunks, largest):
+        n = values.shape[0]
+        partials = np.full((n_chunks, n_groups), -np.inf if largest else np.inf)
+
+        for t in prange(n_chunks):
+            lo = t * n // n_chunks
+            hi = (t + 1) * n // n_chunks
+            for i in range(lo, hi):
+                k = labels[i]
+                v = values[i]
+                if (v > partials[t, k]) if largest else (v < partials[t, k]):
+                    partials[t, k] = v
+
+        out = partials[0].copy()
+        for t in range(1, n_chunks):
+            for k in range(n_groups):
+                v = partials[t, k]
+                if (v > out[k]) if largest else (v < out[k]):
+                    out[k] = v
+        return out
+
+    def _n_chunks(n_rows):
+        return get_num_threads() if n_rows >= PARALLEL_MIN_ROWS else 1
+
+    def group_sum(values, labels, n_groups):
+        """Sum of the values in each label group, split across threads for large inputs"""
+        n_chunks = _n_chunks(values.shape[0])
+        if n_chunks > 1:
+            return _group_sum_chunks(values, labels, n_groups, n_chunks)
+
+        # A single serial pass is cheaper than the parallel kernel on one chunk
+        out = np.zeros(n_groups)
+        _group_sum_into(values, labels, out)
+        return out
+
+    def group_mean(values, labels, n_groups):
+        """Mean of the values in each label group, split across threads for large inputs"""
+        return _group_mean_chunks(values, labels, n_groups, _n_chunks(values.shape[0]))
+
+    def group_min(values, labels, n_groups):
+        """Smallest value in each label group, split across threads for large inputs"""
+        return _group_extreme_chunks(values, labels, n_groups, _n_chunks(values.shape[0]), False)
+
+    def group_max(values, labels, n_groups):
+        """Largest value in each label group, split across threads for large inputs"""
+        return _group_extreme_chunks(values, labels, n_groups, _n_chunks(values.shape[0]), True)
+
+    @vectorize(["boolean(int64, int64)"], target="parallel")
+    def eq_const(code, k):
+        """Elementwise code == k, as a boolean mask"""
+        return code == k
+
+else:
+    def numeric_stats(arr):
+        """(mean, std, median, q1, q3, min, max, distinct count) of a column, from one sort"""
+        a = np.sort(arr)
+        n = a.shape[0]
+        mean = a.sum() / n
+        median = a[n // 2] if n % 2 == 1 else (a[n // 2 - 1] + a[n // 2]) / 2
+        n_unique = int(np.count_nonzero(np.diff(a))) + 1
+        return mean, np.sqrt(((a - mean) ** 2).sum() / n), median, a[n // 4], a[3 * n // 4], a[0], a[n - 1], n_unique
+
+    def group_sum(values, labels, n_groups):
+        """Sum of the values in each label group"""
+        return np.bincount(labels, weights=values, minlength=n_groups)
+
+    def group_mean(values, labels, n_groups):
+        """Mean of the values in each label group"""
+        sums = np.bincount(labels, weights=values, minlength=n_groups)
+        return sums / np.bincount(labels, minlength=n_groups)
+
+    def group_min(values, labels, n_groups):
+        """Smallest value in each label group"""
+        out = np.full(n_groups, np.inf)
+        np.minimum.at(out, labels, values)
+        return out
+
+    def group_max(values, labels, n_groups):
+        """Largest value in each label group"""
+        out = np.full(n_groups, -np.inf)
+        np.maximum.at(out, labels, values)
+        return out
+
+    def eq_const(codes, k):
+        """Elementwise code == k, as a boolean mask"""
+        return codes == k
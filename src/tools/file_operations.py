@@ -1,11 +1,23 @@
-import json
+import asyncio
+import fnmatch
+import importlib.util
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import httpx
 from pydantic import BaseModel
 
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
 from ..config.logging import logger
+from ..utils.helpers import json_dumps, json_loads
+
+# Files smaller than this are read and written inline; a thread hop would cost more
+SMALL_FILE_BYTES = 64 * 1024
 
 
 class FileInfo(BaseModel):
@@ -22,42 +34,131 @@ class FileOperationsTool:
     def __init__(self, allowed_extensions: Optional[List[str]] = None, max_size_mb: int = 100):
         self.allowed_extensions = allowed_extensions or [".txt", ".json", ".csv", ".md", ".py"]
         self.max_size_bytes = max_size_mb * 1024 * 1024
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """HTTP client shared by every download, so connections are kept alive"""
+        # Pooled connections belong to the loop that opened them, so a client
+        # left over from an earlier asyncio.run() is replaced, not reused
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._discard_client()
+            self._client = httpx.AsyncClient(
+                # HTTP/2 multiplexing needs the optional h2 package
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+            self._client_loop = loop
+        return self._client
+    
+    def _discard_client(self) -> None:
+        """Let go of the current client, closing it on its own loop if that still runs"""
+        client, loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if client is None or client.is_closed:
+            return
+        
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            # Its loop has finished, so its connections can't be closed from here
+            logger.debug("Dropping HTTP client bound to a finished event loop")
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
     
     def get_file_info(self, file_path: str) -> FileInfo:
         """Get information about a file"""
         path = Path(file_path)
         
+        # One stat instead of exists() plus stat()
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size, exists = 0, False
+        else:
+            exists = True
+        
         return FileInfo(
             name=path.name,
             path=str(path.absolute()),
-            size=path.stat().st_size if path.exists() else 0,
+            size=size,
             extension=path.suffix,
-            exists=path.exists()
+            exists=exists
         )
     
-    async def read_text_file(self, file_path: str, encoding: str = "utf-8") -> Optional[str]:
-        """Read a text file safely"""
+    def _readable_size(self, path: Path) -> Optional[int]:
+        """Size of a file that exists, has an allowed extension and isn't too large; None otherwise"""
+        # One stat answers both the existence and the size check
+        try:
+            size = path.stat().st_size
+        except OSError:
+            logger.error("File does not exist: %s", path)
+            return None
+        
+        if path.suffix not in self.allowed_extensions:
+            logger.error("File extension not allowed: %s", path.suffix)
+            return None
+        
+        if size > self.max_size_bytes:
+            logger.error("File too large: %s bytes", size)
+            return None
+        
+        return size
+    
+    async def _read_bytes(self, path: Path, size: int) -> bytes:
+        """Read a file of a known size without blocking the event loop"""
+        if size < SMALL_FILE_BYTES:
+            return path.read_bytes()
+        if aiofiles is None:
+            return await asyncio.to_thread(path.read_bytes)
+        async with aiofiles.open(path, "rb") as f:
+            return await f.read()
+    
+    async def _write_bytes(self, path: Path, content: bytes) -> None:
+        """Write a file without blocking the event loop"""
+        if len(content) < SMALL_FILE_BYTES:
+            path.write_bytes(content)
+            return
+        if aiofiles is None:
+            await asyncio.to_thread(path.write_bytes, content)
+            return
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(content)
+    
+    async def read_bytes_file(self, file_path: str) -> Optional[bytes]:
+        """Read a file's raw bytes safely"""
         try:
             path = Path(file_path)
             
-            if not path.exists():
-                logger.error(f"File does not exist: {file_path}")
+            size = self._readable_size(path)
+            if size is None:
                 return None
             
-            if path.suffix not in self.allowed_extensions:
-                logger.error(f"File extension not allowed: {path.suffix}")
-                return None
-            
-            if path.stat().st_size > self.max_size_bytes:
-                logger.error(f"File too large: {path.stat().st_size} bytes")
-                return None
-            
-            content = path.read_text(encoding=encoding)
-            logger.info(f"Successfully read file: {file_path}")
+            content = await self._read_bytes(path, size)
+            logger.info("Successfully read file: %s", file_path)
             return content
             
         except Exception as e:
-            logger.error(f"Error reading file {file_path}: {e}")
+            logger.error("Error reading file %s: %s", file_path, e)
+            return None
+    
+    async def read_text_file(self, file_path: str, encoding: str = "utf-8") -> Optional[str]:
+        """Read a text file safely"""
+        raw = await self.read_bytes_file(file_path)
+        if raw is None:
+            return None
+        
+        try:
+            return raw.decode(encoding)
+        except Exception as e:
+            logger.error("Error decoding file %s: %s", file_path, e)
             return None
     
     async def write_text_file(self, file_path: str, content: str, encoding: str = "utf-8") -> bool:
@@ -66,62 +167,98 @@ class FileOperationsTool:
             path = Path(file_path)
             
             if path.suffix not in self.allowed_extensions:
-                logger.error(f"File extension not allowed: {path.suffix}")
+                logger.error("File extension not allowed: %s", path.suffix)
                 return False
             
             # Create directory if it doesn't exist
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            path.write_text(content, encoding=encoding)
-            logger.info(f"Successfully wrote file: {file_path}")
+            await self._write_bytes(path, content.encode(encoding))
+            logger.info("Successfully wrote file: %s", file_path)
             return True
             
         except Exception as e:
-            logger.error(f"Error writing file {file_path}: {e}")
+            logger.error("Error writing file %s: %s", file_path, e)
             return False
     
     async def read_json_file(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Read and parse a JSON file"""
-        content = await self.read_text_file(file_path)
-        if content is None:
+        raw = await self.read_bytes_file(file_path)
+        if raw is None:
             return None
         
         try:
-            data = json.loads(content)
-            logger.info(f"Successfully parsed JSON file: {file_path}")
+            # Parse the raw bytes; no separate UTF-8 decode pass
+            data = json_loads(raw)
+            logger.info("Successfully parsed JSON file: %s", file_path)
             return data
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing JSON file {file_path}: {e}")
+        except ValueError as e:
+            # Covers both json and orjson decode errors
+            logger.error("Error parsing JSON file %s: %s", file_path, e)
             return None
     
-    async def write_json_file(self, file_path: str, data: Dict[str, Any], indent: int = 2) -> bool:
-        """Write data to a JSON file"""
+    async def write_json_bytes(self, file_path: str, data: Any, indent: int = 2) -> bool:
+        """Write data to a JSON file, serializing it once straight to bytes"""
         try:
-            content = json.dumps(data, indent=indent, ensure_ascii=False)
-            return await self.write_text_file(file_path, content)
+            path = Path(file_path)
+            
+            if path.suffix not in self.allowed_extensions:
+                logger.error("File extension not allowed: %s", path.suffix)
+                return False
+            
+            content = json_dumps(data, indent=indent)
+            
+            # Create directory if it doesn't exist
+            path.parent.mkdir(parents=True, exist_ok=True)
+            
+            await self._write_bytes(path, content)
+            logger.info("Successfully wrote file: %s", file_path)
+            return True
+            
         except Exception as e:
-            logger.error(f"Error serializing data for {file_path}: {e}")
+            logger.error("Error writing JSON file %s: %s", file_path, e)
             return False
     
+    async def write_json_file(self, file_path: str, data: Dict[str, Any], indent: int = 2) -> bool:
+        """Write data to a JSON file"""
+        return await self.write_json_bytes(file_path, data, indent)
+    
     async def list_directory(self, directory_path: str, pattern: str = "*") -> List[FileInfo]:
         """List files in a directory"""
         try:
             path = Path(directory_path)
             
             if not path.exists() or not path.is_dir():
-                logger.error(f"Directory does not exist or is not a directory: {directory_path}")
+                logger.error("Directory does not exist or is not a directory: %s", directory_path)
                 return []
             
-            files = []
-            for file_path in path.glob(pattern):
-                if file_path.is_file():
-                    files.append(self.get_file_info(str(file_path)))
+            if "/" in pattern or os.sep in pattern or "**" in pattern:
+                # Patterns that reach into subdirectories still need glob
+                files = [
+                    self.get_file_info(str(file_path))
+                    for file_path in path.glob(pattern)
+                    if file_path.is_file()
+                ]
+            else:
+                # One directory read; each entry's stat is cached on the DirEntry
+                with os.scandir(path) as entries:
+                    files = [
+                        FileInfo(
+                            name=entry.name,
+                            path=str(Path(entry.path).absolute()),
+                            size=entry.stat().st_size,
+                            extension=Path(entry.name).suffix,
+                            exists=True
+                        )
+                        for entry in entries
+                        if fnmatch.fnmatch(entry.name, pattern) and entry.is_file()
+                    ]
             
-            logger.info(f"Listed {len(files)} files in {directory_path}")
+            logger.info("Listed %d files in %s", len(files), directory_path)
             return files
             
         except Exception as e:
-            logger.error(f"Error listing directory {directory_path}: {e}")
+            logger.error("Error listing directory %s: %s", directory_path, e)
             return []
     
     async def download_file(self, url: str, file_path: str, timeout: int = 30) -> bool:
@@ -130,26 +267,44 @@ class FileOperationsTool:
             path = Path(file_path)
             
             if path.suffix not in self.allowed_extensions:
-                logger.error(f"File extension not allowed: {path.suffix}")
+                logger.error("File extension not allowed: %s", path.suffix)
                 return False
             
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url)
+            async with self._get_client().stream("GET", url, timeout=timeout) as response:
                 response.raise_for_status()
                 
-                if len(response.content) > self.max_size_bytes:
-                    logger.error(f"Downloaded file too large: {len(response.content)} bytes")
+                # Refuse up front when the server announces an oversized body
+                declared = int(response.headers.get("content-length") or 0)
+                if declared > self.max_size_bytes:
+                    logger.error("Downloaded file too large: %s bytes", declared)
                     return False
                 
                 # Create directory if it doesn't exist
                 path.parent.mkdir(parents=True, exist_ok=True)
                 
-                path.write_bytes(response.content)
-                logger.info(f"Successfully downloaded file from {url} to {file_path}")
-                return True
+                total = 0
+                try:
+                    # Chunks are at most SMALL_FILE_BYTES, small enough to write inline
+                    with open(path, "wb") as f:
+                        async for chunk in response.aiter_bytes(SMALL_FILE_BYTES):
+                            total += len(chunk)
+                            if total > self.max_size_bytes:
+                                break
+                            f.write(chunk)
+                except BaseException:
+                    path.unlink(missing_ok=True)
+                    raise
+                
+                if total > self.max_size_bytes:
+                    path.unlink(missing_ok=True)
+                    logger.error("Downloaded file too large: more than %s bytes", self.max_size_bytes)
+                    return False
                 
+                logger.info("Successfully downloaded file from %s to %s", url, file_path)
+                return True
+            
         except Exception as e:
-            logger.error(f"Error downloading file from {url}: {e}")
+            logger.error("Error downloading file from %s: %s", url, e)
             return False
 
 
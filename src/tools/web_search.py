@@ -1,10 +1,21 @@
 import asyncio
-from typing import Dict, List, Optional
+import importlib.util
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 from pydantic import BaseModel
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 from ..config.logging import logger
+from ..config.settings import settings
+from ..utils.async_lru import async_lru_cache
+
+# How long cached search results stay fresh, in seconds
+SEARCH_CACHE_TTL = 3600
 
 
 class SearchResult(BaseModel):
@@ -20,6 +31,57 @@ class WebSearchTool:
     def __init__(self, api_key: Optional[str] = None, timeout: int = 30):
         self.api_key = api_key
         self.timeout = timeout
+        self._page_cache = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """HTTP client shared by every fetch, so connections are kept alive"""
+        # Pooled connections belong to the loop that opened them, so a client
+        # left over from an earlier asyncio.run() is replaced, not reused
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._discard_client()
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                # HTTP/2 multiplexing needs the optional h2 package
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=30.0,
+                ),
+            )
+            self._client_loop = loop
+        return self._client
+    
+    def _discard_client(self) -> None:
+        """Let go of the current client, closing it on its own loop if that still runs"""
+        client, loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if client is None or client.is_closed:
+            return
+        
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            # Its loop has finished, so its connections can't be closed from here
+            logger.debug("Dropping HTTP client bound to a finished event loop")
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+    
+    @property
+    def page_cache(self) -> Optional["diskcache.Cache"]:
+        """Disk cache of fetched page content, if diskcache is installed"""
+        if self._page_cache is None and diskcache is not None:
+            self._page_cache = diskcache.Cache(settings.web_cache_dir)
+        return self._page_cache
     
     async def search(self, query: str, max_results: int = 10) -> List[SearchResult]:
         """
@@ -29,10 +91,19 @@ class WebSearchTool:
         - Bing Web Search API
         - DuckDuckGo API
         """
+        # A fresh list per call, so one caller's edits don't leak into the cache
+        return list(await self._search(query, max_results))
+    
+    @async_lru_cache(
+        maxsize=128,
+        ttl=SEARCH_CACHE_TTL,
+        key=lambda self, query, max_results: (self, query, max_results),
+    )
+    async def _search(self, query: str, max_results: int) -> Tuple[SearchResult, ...]:
         logger.info(f"Performing web search for: {query}")
         
         # Mock search results for demonstration
-        mock_results = [
+        mock_results = tuple(
             SearchResult(
                 title=f"Search result {i+1} for '{query}'",
                 url=f"https://example.com/result-{i+1}",
@@ -41,7 +112,7 @@ class WebSearchTool:
                 source="web"
             )
             for i in range(min(max_results, 5))
-        ]
+        )
         
         # Simulate API delay
         await asyncio.sleep(0.1)
@@ -51,9 +122,17 @@ class WebSearchTool:
     
     async def search_academic(self, query: str, max_results: int = 5) -> List[SearchResult]:
         """Search academic sources (placeholder implementation)"""
+        return list(await self._search_academic(query, max_results))
+    
+    @async_lru_cache(
+        maxsize=128,
+        ttl=SEARCH_CACHE_TTL,
+        key=lambda self, query, max_results: (self, query, max_results),
+    )
+    async def _search_academic(self, query: str, max_results: int) -> Tuple[SearchResult, ...]:
         logger.info(f"Performing academic search for: {query}")
         
-        mock_results = [
+        mock_results = tuple(
             SearchResult(
                 title=f"Academic paper {i+1}: {query}",
                 url=f"https://scholar.example.com/paper-{i+1}",
@@ -62,28 +141,38 @@ class WebSearchTool:
                 source="academic"
             )
             for i in range(min(max_results, 3))
-        ]
+        )
         
         await asyncio.sleep(0.1)
         return mock_results
     
     async def fetch_page_content(self, url: str) -> Optional[str]:
         """Fetch and extract text content from a web page"""
+        cache = self.page_cache
+        if cache is not None:
+            # diskcache reads and writes files, so keep them off the event loop
+            content = await asyncio.to_thread(cache.get, url)
+            if content is not None:
+                logger.info(f"Using cached content for: {url}")
+                return content
+        
         logger.info(f"Fetching content from: {url}")
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                
-                # In a real implementation, you'd parse HTML and extract text
-                # For now, return a mock response
-                content = f"Mock page content from {url}. This would contain the actual " \
-                          f"text content extracted from the webpage."
-                
-                logger.info(f"Successfully fetched content from {url}")
-                return content
-                
+            response = await self._get_client().get(url)
+            response.raise_for_status()
+            
+            # In a real implementation, you'd parse HTML and extract text
+            # For now, return a mock response
+            content = f"Mock page content from {url}. This would contain the actual " \
+                      f"text content extracted from the webpage."
+            
+            if cache is not None:
+                await asyncio.to_thread(cache.set, url, content, expire=settings.web_cache_ttl)
+            
+            logger.info(f"Successfully fetched content from {url}")
+            return content
+            
         except httpx.RequestError as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
@@ -91,6 +180,28 @@ class WebSearchTool:
             logger.error(f"HTTP error {e.response.status_code} for {url}")
             return None
 
+    
+    async def fetch_pages(self, urls: List[str], concurrency: int = 20) -> Dict[str, Optional[str]]:
+        """Fetch several pages concurrently on the shared client, keyed by URL"""
+        semaphore = asyncio.Semaphore(concurrency)
+        unique_urls = list(dict.fromkeys(urls))
+        
+        async def fetch_one(url: str) -> Optional[str]:
+            async with semaphore:
+                return await self.fetch_page_content(url)
+        
+        results = await asyncio.gather(
+            *(fetch_one(url) for url in unique_urls), return_exceptions=True
+        )
+        
+        pages: Dict[str, Optional[str]] = {}
+        for url, result in zip(unique_urls, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching {url}: {result}")
+                result = None
+            pages[url] = result
+        return pages
+
 
 # Global tool instance
 web_search_tool = WebSearchTool()
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Async LRU Cache
+
+An lru_cache for coroutine functions: it stores awaited results rather than
+coroutine objects, and concurrent calls with the same key share one call.
+"""
+
+import asyncio
+import functools
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+def fingerprint(value: Any) -> bytes:
+    """Stable digest of a value, using its JSON dump for Pydantic models"""
+    if hasattr(value, "model_dump_json"):
+        data = value.model_dump_json()
+    else:
+        data = repr(value)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).digest()
+
+
+def async_lru_cache(
+    maxsize: int = 512,
+    key: Optional[Callable[..., Hashable]] = None,
+    ttl: Optional[float] = None,
+):
+    """
+    Cache the results of a coroutine function, evicting least recently used.
+
+    Args:
+        maxsize: Maximum number of cached results
+        key: Builds the cache key from the call arguments; defaults to the
+            arguments themselves, which must then be hashable
+        ttl: Seconds a result stays fresh; None keeps it until evicted
+
+    Failed calls are not cached. Use `cache_clear()` on the wrapper to reset.
+    """
+    def decorator(fn):
+        cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+        in_flight: Dict[Hashable, asyncio.Task] = {}
+
+        def make_key(*args, **kwargs) -> Hashable:
+            if key:
+                return key(*args, **kwargs)
+            return args, tuple(sorted(kwargs.items()))
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            cache_key = make_key(*args, **kwargs)
+
+            if cache_key in cache:
+                result, expires_at = cache[cache_key]
+                if expires_at is None or time.monotonic() < expires_at:
+                    cache.move_to_end(cache_key)
+                    return result
+                del cache[cache_key]
+
+            # Single-flight: identical concurrent calls wait on the same task
+            task = in_flight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                in_flight[cache_key] = task
+                task.add_done_callback(lambda _: in_flight.pop(cache_key, None))
+
+            # Shielded so one cancelled caller doesn't fail the others
+            result = await asyncio.shield(task)
+
+            cache[cache_key] = (result, time.monotonic() + ttl if ttl is not None else None)
+            cache.move_to_end(cache_key)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return result
+
+        def cache_clear() -> None:
+            cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
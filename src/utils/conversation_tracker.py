@@ -118,6 +118,13 @@ class ConversationTracker:
         
         logger.debug(f"💬 [{conversation_id}] {sender}: {content[:50]}...")
     
+    def add_messages_bulk(self, messages: List[Dict[str, Any]]):
+        """Add a batch of messages, each given as add_message keyword arguments"""
+        for message in messages:
+            self.add_message(**message)
+        
+        logger.debug(f"💬 Added {len(messages)} queued messages")
+    
     def end_conversation(self, conversation_id: str, summary: str = None):
         """End a conversation"""
         if conversation_id not in self.conversations:
@@ -1,7 +1,17 @@
 import asyncio
+import json
+import random
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared RNG for retry jitter
+_retry_rng = random.Random()
 
 
 def generate_session_id() -> str:
@@ -130,6 +140,32 @@ async def run_with_timeout(coro, timeout_seconds: float, default_result: Any = N
         return default_result
 
 
+def install_fast_event_loop() -> bool:
+    """Switch asyncio to uvloop when it is installed; returns whether it was"""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def enable_eager_tasks() -> bool:
+    """
+    Start new tasks eagerly on the running loop (Python 3.12+).
+
+    Coroutines that finish without suspending, such as cache hits, then
+    complete without a trip through the scheduler. Returns whether it was enabled.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return False
+    
+    asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    return True
+
+
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     """Truncate text to a maximum length"""
     if len(text) <= max_length:
@@ -138,6 +174,22 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     return text[:max_length - len(suffix)] + suffix
 
 
+def json_dumps(data: Any, indent: Optional[int] = None, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    # orjson only pretty-prints with two-space indentation
+    if orjson is not None and indent in (None, 2):
+        return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 if indent else 0)
+    
+    return json.dumps(data, indent=indent, ensure_ascii=False, default=default).encode("utf-8")
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def extract_json_from_text(text: str) -> Optional[Dict[str, Any]]:
     """Try to extract JSON from a text string"""
     import json
@@ -180,10 +232,37 @@ def calculate_text_similarity(text1: str, text2: str) -> float:
 
 class RetryConfig:
     """Configuration for retry logic"""
-    def __init__(self, max_attempts: int = 3, delay: float = 1.0, backoff_factor: float = 2.0):
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        delay: float = 1.0,
+        backoff_factor: float = 2.0,
+        max_delay: Optional[float] = None,
+        jitter: Optional[str] = None,
+        retry_if: Optional[Callable[[Exception], bool]] = None,
+    ):
+        if jitter not in (None, "full", "equal"):
+            raise ValueError(f"Unsupported jitter mode: {jitter}")
+        
         self.max_attempts = max_attempts
         self.delay = delay
         self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_if = retry_if
+    
+    def get_delay(self, attempt: int) -> float:
+        """Get the sleep time before retrying after the given (0-based) attempt"""
+        delay = self.delay * self.backoff_factor ** attempt
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        
+        # Jitter decorrelates retries from many concurrent callers
+        if self.jitter == "full":
+            return _retry_rng.uniform(0, delay)
+        if self.jitter == "equal":
+            return delay / 2 + _retry_rng.uniform(0, delay / 2)
+        return delay
 
 
 async def retry_async(func, *args, config: Optional[RetryConfig] = None, **kwargs) -> Any:
@@ -192,18 +271,19 @@ async def retry_async(func, *args, config: Optional[RetryConfig] = None, **kwarg
         config = RetryConfig()
     
     last_exception = None
-    current_delay = config.delay
     
     for attempt in range(config.max_attempts):
         try:
             return await func(*args, **kwargs)
         except Exception as e:
             last_exception = e
+            if config.retry_if is not None and not config.retry_if(e):
+                # Deterministic failure, retrying won't help
+                break
             if attempt < config.max_attempts - 1:
-                await asyncio.sleep(current_delay)
-                current_delay *= config.backoff_factor
+                await asyncio.sleep(config.get_delay(attempt))
             else:
                 break
     
     if last_exception:
-        raise last_exception
\ No newline at end of file
+        raise last_exception
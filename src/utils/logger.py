@@ -169,6 +169,7 @@ class ContextualLogger:
         self.logger.critical(f"[{self.context}] {message}", **kwargs)
 
 
+@functools.lru_cache(maxsize=None)
 def get_contextual_logger(context: str) -> ContextualLogger:
-    """Get a logger with specific context"""
+    """Get a logger with specific context (cached, one instance per context)"""
     return ContextualLogger(context)
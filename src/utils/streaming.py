@@ -0,0 +1,35 @@
+"""
+Streaming Helpers
+
+Utilities for shaping agent token streams before they reach a consumer.
+"""
+
+import re
+from typing import AsyncIterator
+
+# End of a sentence: terminal punctuation followed by whitespace
+_SENTENCE_END = re.compile(r"[.!?]\s")
+
+
+async def coalesce_stream(stream: AsyncIterator[str], max_bytes: int = 64) -> AsyncIterator[str]:
+    """Merge tiny chunks, yielding at sentence boundaries or once max_bytes is buffered"""
+    buf = ""
+
+    async for chunk in stream:
+        buf += chunk
+
+        # Flush everything up to the last complete sentence
+        end = 0
+        for match in _SENTENCE_END.finditer(buf):
+            end = match.end()
+        if end:
+            yield buf[:end]
+            buf = buf[end:]
+
+        if len(buf.encode("utf-8")) >= max_bytes:
+            yield buf
+            buf = ""
+
+    # Flush the tail once the stream is exhausted
+    if buf:
+        yield buf
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from src.utils.async_lru import async_lru_cache
+
+
+def _counting(ttl=None, fail=False, delay=0.0):
+    calls = []
+
+    @async_lru_cache(maxsize=2, ttl=ttl)
+    async def double(x):
+        calls.append(x)
+        await asyncio.sleep(delay)
+        if fail:
+            raise ValueError(x)
+        return x * 2
+
+    return double, calls
+
+
+async def test_repeated_calls_are_cached():
+    double, calls = _counting()
+
+    assert await double(2) == 4
+    assert await double(2) == 4
+    assert calls == [2]
+
+
+async def test_least_recently_used_is_evicted():
+    double, calls = _counting()
+
+    await double(1)
+    await double(2)
+    await double(1)
+    await double(3)  # evicts 2, the least recently used
+    await double(1)
+    await double(2)
+    assert calls == [1, 2, 3, 2]
+
+
+async def test_entries_expire_after_ttl():
+    double, calls = _counting(ttl=0.05)
+
+    await double(1)
+    await double(1)
+    await asyncio.sleep(0.1)
+    await double(1)
+    assert calls == [1, 1]
+
+
+async def test_concurrent_calls_share_one_call():
+    double, calls = _counting(delay=0.05)
+
+    results = await asyncio.gather(*(double(3) for _ in range(5)))
+    assert results == [6] * 5
+    assert calls == [3]
+
+
+async def test_failures_are_not_cached():
+    double, calls = _counting(fail=True, delay=0.01)
+
+    results = await asyncio.gather(double(1), double(1), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    with pytest.raises(ValueError):
+        await double(1)
+    assert calls == [1, 1]
+
+
+async def test_cancelled_caller_does_not_cancel_others():
+    double, calls = _counting(delay=0.05)
+
+    first = asyncio.ensure_future(double(4))
+    second = asyncio.ensure_future(double(4))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == 8
+    assert calls == [4]
+
+
+async def test_cache_clear():
+    double, calls = _counting()
+
+    await double(1)
+    double.cache_clear()
+    await double(1)
+    assert calls == [1, 1]
@@ -0,0 +1,94 @@
+import pytest
+
+from src.tools.data_tools import DataTools
+
+RECORDS = [
+    {"name": "a", "tags": ["x", "y"], "score": 1.5},
+    {"name": "b", "tags": ["z"], "score": 2.0},
+    {"name": "c", "tags": ["x", "y"], "score": 4.0},
+    {"name": "d", "score": 8.0},
+]
+
+
+async def test_filter_handle_on_list_column():
+    tools = DataTools()
+    handle = await tools.load_handle(RECORDS)
+
+    result = await tools.filter_data(handle, {"tags": ["x", "y"]})
+
+    assert result == await tools.filter_data(RECORDS, {"tags": ["x", "y"]})
+    assert [record["name"] for record in result] == ["a", "c"]
+
+
+async def test_aggregate_handle_grouped_by_list_column():
+    tools = DataTools()
+    handle = await tools.load_handle(RECORDS)
+
+    result = await tools.aggregate_data(handle, group_by="tags", agg_column="score")
+
+    assert result == await tools.aggregate_data(RECORDS, group_by="tags", agg_column="score")
+    assert result == {"['x', 'y']": 5.5, "['z']": 2.0, "Unknown": 8.0}
+
+
+MIXED_RECORDS = [
+    {"region": "north", "units": 3, "price": 2.5, "meta": {"a": 1}},
+    {"region": "south", "units": 5, "price": 1.0},
+    {"region": None, "units": 2, "price": 4.0, "meta": {"a": 1}},
+    {"units": 7, "price": 3.5, "meta": [1, 2]},
+    {"region": "north", "units": 1, "price": 0.5},
+    {"region": "south", "price": 6.0, "meta": None},
+]
+
+
+async def _layouts(tools, records):
+    """The same records as records, columns and a handle"""
+    return [records, await tools.to_columns(records), await tools.load_handle(records)]
+
+
+@pytest.mark.parametrize("operation", ["sum", "mean", "count", "min", "max"])
+@pytest.mark.parametrize("group_by", ["region", "meta"])
+async def test_aggregate_layouts_match_records(group_by, operation):
+    tools = DataTools()
+    records, columns, handle = await _layouts(tools, MIXED_RECORDS)
+
+    expected = await tools.aggregate_data(records, group_by, "price", operation)
+
+    for data in (columns, handle):
+        result = await tools.aggregate_data(data, group_by, "price", operation)
+        assert result == expected
+        assert [type(value) for value in result.values()] == [type(value) for value in expected.values()]
+
+
+@pytest.mark.parametrize("conditions", [
+    {"region": "north"},
+    {"region": None},
+    {"units": 5},
+    {"units": [5]},
+    {"meta": {"a": 1}},
+    {"meta": [1, 2]},
+    {"region": "south", "units": 5},
+    {"missing": 1},
+])
+async def test_filter_layouts_match_records(conditions):
+    tools = DataTools()
+    records, columns, handle = await _layouts(tools, MIXED_RECORDS)
+
+    expected = await tools.filter_data(records, conditions)
+
+    for data in (columns, handle):
+        result = await tools.filter_data(data, conditions)
+        assert result == expected
+        assert [{k: type(v) for k, v in row.items()} for row in result] == [
+            {k: type(v) for k, v in row.items()} for row in expected
+        ]
+
+
+@pytest.mark.parametrize("column", ["units", "price", "region"])
+async def test_column_stats_layouts_match_records(column):
+    tools = DataTools()
+    records, columns, handle = await _layouts(tools, MIXED_RECORDS)
+
+    expected = await tools.calculate_column_stats(records, column)
+
+    for data in (columns, handle):
+        assert await tools.calculate_column_stats(data, column) == expected
@@ -0,0 +1,65 @@
+import importlib.util
+import sys
+
+import numpy as np
+import pytest
+
+from src.tools import fast_stats
+
+
+@pytest.fixture(scope="module")
+def numpy_stats():
+    """fast_stats loaded as if Numba weren't installed"""
+    spec = importlib.util.spec_from_file_location("fast_stats_numpy", fast_stats.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "numba", None)
+        spec.loader.exec_module(module)
+    assert module.njit is None
+    return module
+
+
+def _reference_groups(values, labels, n_groups):
+    groups = [values[labels == g] for g in range(n_groups)]
+    return {
+        "group_sum": np.array([g.sum() for g in groups]),
+        "group_mean": np.array([g.mean() for g in groups]),
+        "group_min": np.array([g.min() for g in groups]),
+        "group_max": np.array([g.max() for g in groups]),
+    }
+
+
+@pytest.mark.parametrize("n_rows", [7, 1_000, fast_stats.PARALLEL_MIN_ROWS + 13])
+def test_group_kernels_match_reference(numpy_stats, n_rows):
+    rng = np.random.default_rng(n_rows)
+    n_groups = 5
+    values = rng.normal(size=n_rows)
+    labels = np.arange(n_rows, dtype=np.int64) % n_groups
+    rng.shuffle(labels)
+
+    expected = _reference_groups(values, labels, n_groups)
+    for name, reference in expected.items():
+        np.testing.assert_allclose(getattr(fast_stats, name)(values, labels, n_groups), reference)
+        np.testing.assert_allclose(getattr(numpy_stats, name)(values, labels, n_groups), reference)
+
+
+@pytest.mark.parametrize("values", [[3.0], [2.0, 1.0], [5.0, 1.0, 1.0, 4.0, 2.5], list(range(10))])
+def test_numeric_stats_match_fallback(numpy_stats, values):
+    arr = np.asarray(values, dtype=np.float64)
+
+    np.testing.assert_allclose(fast_stats.numeric_stats(arr), numpy_stats.numeric_stats(arr))
+
+    mean, std, median, _, _, low, high, n_unique = fast_stats.numeric_stats(arr)
+    assert mean == pytest.approx(np.mean(arr))
+    assert std == pytest.approx(np.std(arr))
+    assert median == pytest.approx(np.median(arr))
+    assert (low, high) == (arr.min(), arr.max())
+    assert n_unique == len(set(values))
+
+
+def test_eq_const(numpy_stats):
+    codes = np.array([0, 2, 1, 2, 0], dtype=np.int64)
+
+    for kernels in (fast_stats, numpy_stats):
+        assert kernels.eq_const(codes, 2).tolist() == [False, True, False, True, False]
+        assert not kernels.eq_const(codes, 3).any()
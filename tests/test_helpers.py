@@ -0,0 +1,40 @@
+import pytest
+
+from src.utils.helpers import RetryConfig
+
+
+def test_delay_backs_off_exponentially():
+    config = RetryConfig(delay=0.5, backoff_factor=3.0)
+
+    assert [config.get_delay(attempt) for attempt in range(4)] == [0.5, 1.5, 4.5, 13.5]
+
+
+def test_delay_is_capped_at_max_delay():
+    config = RetryConfig(delay=1.0, backoff_factor=2.0, max_delay=5.0)
+
+    assert [config.get_delay(attempt) for attempt in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+@pytest.mark.parametrize("attempt", range(6))
+def test_full_jitter_stays_within_bounds(attempt):
+    config = RetryConfig(delay=1.0, backoff_factor=2.0, max_delay=10.0, jitter="full")
+    cap = min(2.0 ** attempt, 10.0)
+
+    delays = [config.get_delay(attempt) for _ in range(500)]
+    assert all(0 <= delay <= cap for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.parametrize("attempt", range(6))
+def test_equal_jitter_stays_within_bounds(attempt):
+    config = RetryConfig(delay=1.0, backoff_factor=2.0, max_delay=10.0, jitter="equal")
+    cap = min(2.0 ** attempt, 10.0)
+
+    delays = [config.get_delay(attempt) for _ in range(500)]
+    assert all(cap / 2 <= delay <= cap for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_unknown_jitter_mode_is_rejected():
+    with pytest.raises(ValueError):
+        RetryConfig(jitter="decorrelated")
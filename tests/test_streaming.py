@@ -0,0 +1,53 @@
+from src.utils.streaming import coalesce_stream
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(stream, **kwargs):
+    return [chunk async for chunk in coalesce_stream(stream, **kwargs)]
+
+
+async def test_small_chunks_merge_until_a_sentence_ends():
+    result = await _collect(_chunks("Hel", "lo wor", "ld. Next", " one"))
+
+    assert result == ["Hello world. ", "Next one"]
+
+
+async def test_sentence_end_waits_for_whitespace():
+    result = await _collect(_chunks("Done.", " More"))
+
+    assert result == ["Done. ", "More"]
+
+
+async def test_flushes_through_the_last_sentence_in_the_buffer():
+    result = await _collect(_chunks("One! Two? Three", "."))
+
+    assert result == ["One! Two? ", "Three."]
+
+
+async def test_flushes_once_max_bytes_is_buffered():
+    result = await _collect(_chunks(*["abcd"] * 5), max_bytes=8)
+
+    assert result == ["abcdabcd", "abcdabcd", "abcd"]
+
+
+async def test_max_bytes_counts_encoded_bytes():
+    # "é" is two bytes in UTF-8
+    result = await _collect(_chunks("éé", "éé", "é"), max_bytes=8)
+
+    assert result == ["éééé", "é"]
+
+
+async def test_output_is_the_input_joined():
+    chunks = ["The ", "quick. ", "brown fox ", "jumps over", " the lazy dog!", " ", "End"]
+
+    result = await _collect(_chunks(*chunks), max_bytes=16)
+
+    assert "".join(result) == "".join(chunks)
+
+
+async def test_empty_stream_yields_nothing():
+    assert await _collect(_chunks()) == []